@@ -1,6 +1,8 @@
 from decimal import Decimal
+from typing import Any
 
 from django.contrib import admin
+from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 from unfold.contrib.filters.admin import ChoicesDropdownFilter
 from unfold.decorators import display
@@ -9,6 +11,7 @@ from apps.carts.admins import CartItemInline
 from apps.carts.choices import CartStatus
 from apps.carts.models import Cart
 from apps.carts.selectors import CartSelector
+from apps.carts.services import CartService
 from apps.core.admins import BaseModelAdmin
 
 
@@ -42,6 +45,12 @@ class CartAdmin(BaseModelAdmin):
     search_help_text = _("Search by email")
     autocomplete_fields = ("user",)
 
+    def save_related(
+        self, request: HttpRequest, form: Any, formsets: Any, change: bool
+    ) -> None:
+        super().save_related(request, form, formsets, change)
+        CartService().refresh_cart_summary(cart=form.instance)
+
     @display(
         description=_("Status"),
         label={
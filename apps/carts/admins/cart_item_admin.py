@@ -1,7 +1,12 @@
+from typing import Any
+
 from django.contrib import admin
+from django.db.models import QuerySet
+from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 
-from apps.carts.models import CartItem
+from apps.carts.models import Cart, CartItem
+from apps.carts.services import CartService
 from apps.core.admins import BaseModelAdmin
 
 
@@ -31,3 +36,22 @@ class CartItemAdmin(BaseModelAdmin):
         "cart",
         "product",
     )
+
+    def save_model(
+        self, request: HttpRequest, obj: CartItem, form: Any, change: bool
+    ) -> None:
+        super().save_model(request, obj, form, change)
+        CartService().refresh_cart_summary(cart=obj.cart)
+
+    def delete_model(self, request: HttpRequest, obj: CartItem) -> None:
+        super().delete_model(request, obj)
+        CartService().refresh_cart_summary(cart=obj.cart)
+
+    def delete_queryset(
+        self, request: HttpRequest, queryset: QuerySet[CartItem]
+    ) -> None:
+        carts: QuerySet[Cart] = Cart.objects.filter(
+            pk__in=list(queryset.values_list("cart_id", flat=True))
+        )
+        super().delete_queryset(request, queryset)
+        CartService().refresh_cart_summaries(carts=carts)
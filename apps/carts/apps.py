@@ -8,3 +8,6 @@ class CartsConfig(AppConfig):
     name: str = "apps.carts"
     verbose_name: StrOrPromise = _("Carts")
     label: str = "carts"
+
+    def ready(self) -> None:
+        from apps.carts import signals  # noqa: F401
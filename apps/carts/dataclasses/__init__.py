@@ -0,0 +1,5 @@
+from apps.carts.dataclasses.cart_snapshot_dataclass import CartSnapshot
+
+__all__ = [
+    "CartSnapshot",
+]
@@ -0,0 +1,69 @@
+from dataclasses import dataclass, field
+from decimal import ROUND_HALF_UP, Decimal
+from functools import cached_property
+from typing import Dict, List, Optional, Sequence
+
+from apps.carts.models import Cart, CartItem
+
+
+@dataclass(frozen=True)
+class CartSnapshot:
+    cart: Optional[Cart]
+    cart_items: Sequence[CartItem] = field(default_factory=list)
+
+    @cached_property
+    def cart_items_map(self) -> Dict[int, CartItem]:
+        return {
+            cart_item.product_id: cart_item for cart_item in self.cart_items
+        }
+
+    @cached_property
+    def available_cart_items(self) -> List[CartItem]:
+        return [
+            cart_item
+            for cart_item in self.cart_items
+            if cart_item.product.is_available
+        ]
+
+    @cached_property
+    def unavailable_cart_items(self) -> List[CartItem]:
+        return [
+            cart_item
+            for cart_item in self.cart_items
+            if not cart_item.product.is_available
+        ]
+
+    @cached_property
+    def cart_prices(self) -> Dict[str, Decimal]:
+        products_total_price: Decimal = (
+            self.cart.available_total_price
+            if self.cart is not None
+            else Decimal("0.00")
+        ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+        return {
+            "products_total_price": products_total_price,
+            "total_price": products_total_price,
+        }
+
+    @property
+    def total_quantity(self) -> int:
+        return self.cart.items_count if self.cart is not None else 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.total_quantity
+
+    @property
+    def has_unavailable_cart_items(self) -> bool:
+        return self.cart is not None and self.cart.has_unavailable_items
+
+    def get_cart_item(self, *, cart_item_pk: int) -> Optional[CartItem]:
+        return next(
+            (
+                cart_item
+                for cart_item in self.cart_items
+                if cart_item.pk == cart_item_pk
+            ),
+            None,
+        )
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.6 on 2026-10-15 18:12
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def fill_cart_summaries(apps, schema_editor):
+    Cart = apps.get_model("carts", "Cart")
+    CartItem = apps.get_model("carts", "CartItem")
+
+    cart_items = (
+        CartItem.objects.filter(cart=models.OuterRef("pk"))
+        .order_by()
+        .values("cart")
+    )
+    Cart.objects.update(
+        items_count=Coalesce(
+            models.Subquery(
+                cart_items.annotate(items_count=models.Count("pk")).values(
+                    "items_count"
+                )
+            ),
+            0,
+        ),
+        available_total_price=Coalesce(
+            models.Subquery(
+                cart_items.filter(product__is_available=True)
+                .annotate(available_total_price=models.Sum("total_price"))
+                .values("available_total_price")
+            ),
+            models.Value(Decimal("0.00")),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        ),
+        has_unavailable_items=models.Exists(
+            cart_items.filter(product__is_available=False)
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("carts", "0007_alter_cartitem_unique_cart_product"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cart",
+            name="available_total_price",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=Decimal("0.00"),
+                editable=False,
+                help_text="Calculated by the system.",
+                max_digits=12,
+                verbose_name="available total price",
+            ),
+        ),
+        migrations.AddField(
+            model_name="cart",
+            name="has_unavailable_items",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                help_text="Calculated by the system.",
+                verbose_name="has unavailable items",
+            ),
+        ),
+        migrations.AddField(
+            model_name="cart",
+            name="items_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Calculated by the system.",
+                verbose_name="items count",
+            ),
+        ),
+        migrations.RunPython(
+            code=fill_cart_summaries,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
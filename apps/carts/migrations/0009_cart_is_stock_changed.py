@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-15 18:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("carts", "0008_cart_available_total_price_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cart",
+            name="is_stock_changed",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                help_text="Set when item quantities were reduced to the available stock.",
+                verbose_name="stock changed",
+            ),
+        ),
+    ]
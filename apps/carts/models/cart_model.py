@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from django.contrib.auth import get_user_model
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -19,6 +21,34 @@ class Cart(BaseModel):  # type: ignore
         default=CartStatus.ACTIVE,
         verbose_name=_("cart status"),
     )
+    items_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("items count"),
+        help_text=_("Calculated by the system."),
+    )
+    available_total_price = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal(value="0.00"),
+        editable=False,
+        verbose_name=_("available total price"),
+        help_text=_("Calculated by the system."),
+    )
+    has_unavailable_items = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name=_("has unavailable items"),
+        help_text=_("Calculated by the system."),
+    )
+    is_stock_changed = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name=_("stock changed"),
+        help_text=_(
+            "Set when item quantities were reduced to the available stock."
+        ),
+    )
 
     class Meta:  # noqa: D106
         db_table = "carts_cart"
@@ -45,4 +75,4 @@ class Cart(BaseModel):  # type: ignore
 
     @property
     def total_quantity(self) -> int:
-        return self.cart_items.count()
+        return self.items_count
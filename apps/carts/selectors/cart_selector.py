@@ -1,10 +1,12 @@
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Dict, List, Optional
 
-from django.db.models import Prefetch, QuerySet, Sum
+from django.db.models import Prefetch, QuerySet
+from django.http import HttpRequest
 
 from apps.accounts.models import User
 from apps.carts.choices import CartStatus
+from apps.carts.dataclasses import CartSnapshot
 from apps.carts.models import Cart, CartItem
 from apps.catalog.selectors import ProductSelector
 
@@ -18,7 +20,7 @@ class CartSelector:
                 queryset=CartItem.objects.prefetch_related(
                     Prefetch(
                         lookup="product",
-                        queryset=ProductSelector().get_products(
+                        queryset=ProductSelector().get_product_cards(
                             only_active=False
                         ),
                     )
@@ -29,6 +31,18 @@ class CartSelector:
     def get_cart_items(self, *, cart: Cart) -> QuerySet[CartItem]:
         return cart.cart_items.all()
 
+    def get_cart_items_with_products(
+        self, *, cart: Cart
+    ) -> QuerySet[CartItem]:
+        return cart.cart_items.prefetch_related(
+            Prefetch(
+                lookup="product",
+                queryset=ProductSelector().get_product_cards(
+                    only_active=False
+                ),
+            )
+        )
+
     def get_cart_item(
         self, *, cart: Cart, cart_item_pk: int
     ) -> Optional[CartItem]:
@@ -41,6 +55,36 @@ class CartSelector:
             .first()
         )
 
+    def get_cart_snapshot(self, *, user: User) -> CartSnapshot:
+        cart: Optional[Cart] = Cart.objects.filter(
+            user=user, cart_status=CartStatus.ACTIVE
+        ).first()
+
+        if cart is None:
+            return CartSnapshot(cart=None)
+
+        return CartSnapshot(
+            cart=cart,
+            cart_items=self.get_cart_items_with_products(cart=cart),
+        )
+
+    def get_request_cart_snapshot(
+        self, *, request: HttpRequest, refresh: bool = False
+    ) -> CartSnapshot:
+        cart_snapshot: Optional[CartSnapshot] = getattr(
+            request, "cart_snapshot", None
+        )
+
+        if cart_snapshot is None or refresh:
+            cart_snapshot = (
+                self.get_cart_snapshot(user=request.user)  # type: ignore
+                if request.user.is_authenticated
+                else CartSnapshot(cart=None)
+            )
+            request.cart_snapshot = cart_snapshot  # type: ignore
+
+        return cart_snapshot
+
     def get_cart_items_map(self, *, cart: Cart) -> Dict[int, CartItem]:
         return {
             cart_item.product_id: cart_item
@@ -48,18 +92,10 @@ class CartSelector:
         }
 
     def get_cart_products_total_price(self, *, cart: Cart) -> Decimal:
-        cart_items: QuerySet[CartItem] = self.get_cart_items(cart=cart).filter(
-            product__is_available=True
+        return cart.available_total_price.quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
         )
 
-        total_price: Decimal = cart_items.aggregate(
-            total_price=Sum(
-                "total_price",
-            )
-        )["total_price"] or Decimal("0.00")
-
-        return total_price.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
     def get_cart_prices(self, *, cart: Cart) -> Dict[str, Decimal]:
         cart_products_total_price: Decimal = (
             self.get_cart_products_total_price(cart=cart)
@@ -74,7 +110,7 @@ class CartSelector:
         return cart_prices
 
     def has_unavailable_cart_items(self, *, cart: Cart) -> bool:
-        return cart.cart_items.filter(product__is_available=False).exists()
+        return cart.has_unavailable_items
 
     def get_available_cart_items(self, *, cart: Cart) -> List[CartItem]:
         return [
@@ -91,4 +127,4 @@ class CartSelector:
         ]
 
     def is_cart_empty(self, *, cart: Cart) -> bool:
-        return not cart.cart_items.exists()
+        return not cart.items_count
@@ -1,8 +1,21 @@
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
 from django.db import IntegrityError, transaction
-from django.db.models import QuerySet
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    Exists,
+    F,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Floor
 
 from apps.accounts.models import User
 from apps.carts.choices import CartStatus
@@ -17,6 +30,13 @@ from apps.carts.models import Cart, CartItem
 from apps.carts.selectors import CartSelector
 from apps.catalog.models import Product
 from apps.catalog.selectors import ProductSelector
+from apps.core.caches import UserVersionCache
+
+CART_SUMMARY_FIELDS: List[str] = [
+    "items_count",
+    "available_total_price",
+    "has_unavailable_items",
+]
 
 
 class CartService:
@@ -41,6 +61,7 @@ class CartService:
             cart=cart
         )
         cart_items.delete()
+        self.refresh_cart_summary(cart=cart)
 
     @transaction.atomic
     def delete_cart_item(self, *, cart: Cart, cart_item_pk: int) -> None:
@@ -53,6 +74,7 @@ class CartService:
             raise CartItemNotFoundError()
 
         cart_item.delete()
+        self.refresh_cart_summary(cart=cart)
 
     @transaction.atomic
     def create_cart_item(
@@ -81,7 +103,7 @@ class CartService:
             raise InsufficientStockError()
 
         try:
-            return CartItem.objects.create(
+            cart_item: CartItem = CartItem.objects.create(
                 cart=cart,
                 product=product,
                 quantity=real_quantity,
@@ -89,6 +111,10 @@ class CartService:
         except IntegrityError as error:
             raise CartItemAlreadyExistsError() from error
 
+        self.refresh_cart_summary(cart=cart)
+
+        return cart_item
+
     @transaction.atomic
     def adjust_cart_item_quantity(
         self, *, cart: Cart, cart_item_pk: int, delta: int = 1
@@ -124,38 +150,129 @@ class CartService:
 
         cart_item.quantity = new_quantity
         cart_item.save(update_fields=["quantity"])
+        self.refresh_cart_summary(cart=cart)
 
         return cart_item
 
     @transaction.atomic
-    def validate_cart_item_quantities(self, *, cart: Cart) -> bool:
-        is_stock_changed: bool = False
-
-        cart_items: QuerySet[CartItem] = CartSelector().get_cart_items(
-            cart=cart
+    def set_cart_item_quantities(
+        self, *, cart: Cart, quantities: Dict[int, Decimal]
+    ) -> None:
+        products: Dict[int, Product] = (
+            ProductSelector().get_products_for_update(product_pks=quantities)
         )
+        cart_items_map: Dict[int, CartItem] = {
+            cart_item.product_id: cart_item
+            for cart_item in CartItem.objects.filter(
+                cart=cart, product_id__in=quantities
+            )
+        }
+        deleted_product_pks: List[int] = []
+        created_cart_items: List[CartItem] = []
+        updated_cart_items: List[CartItem] = []
+
+        for product_pk, quantity in sorted(quantities.items()):
+            if not quantity:
+                deleted_product_pks.append(product_pk)
+                continue
 
-        for cart_item in cart_items:
-            product: Product = cart_item.product
+            product: Optional[Product] = products.get(product_pk)
 
-            if not product.stock:
-                continue
+            if product is None or not product.is_available:
+                raise ProductUnavailableError()
+
+            step: Decimal = product.weight_step or Decimal(value="1")
+
+            if quantity < step or quantity % step:
+                raise InvalidCartItemQuantityError()
+
+            if product.stock < quantity:
+                raise InsufficientStockError()
 
-            if cart_item.quantity > product.stock:
-                if product.weight_step:
-                    weight_steps: int = int(
-                        product.stock / product.weight_step
+            cart_item: Optional[CartItem] = cart_items_map.get(product_pk)
+
+            if cart_item is None:
+                created_cart_items.append(
+                    CartItem(
+                        cart=cart,
+                        product=product,
+                        quantity=quantity,
+                        price_snapshot=product.final_price,
                     )
-                    cart_item.quantity = (
-                        Decimal(value=weight_steps) * product.weight_step
+                )
+            elif cart_item.quantity != quantity:
+                cart_item.quantity = quantity
+                updated_cart_items.append(cart_item)
+
+        CartItem.objects.filter(
+            cart=cart, product_id__in=deleted_product_pks
+        ).delete()
+        CartItem.objects.bulk_create(created_cart_items)
+        CartItem.objects.bulk_update(updated_cart_items, fields=["quantity"])
+        self.refresh_cart_summary(cart=cart)
+
+        user_pk: int = cart.user_id
+        transaction.on_commit(
+            lambda: UserVersionCache().invalidate(user_pk=user_pk)
+        )
+
+    @transaction.atomic
+    def reconcile_product_cart_items(
+        self, *, product_pks: Iterable[int]
+    ) -> int:
+        product_pks = list(product_pks)
+        active_carts: QuerySet[Cart] = Cart.objects.filter(
+            cart_status=CartStatus.ACTIVE,
+            cart_items__product_id__in=product_pks,
+        )
+        exceeding_cart_items: QuerySet[CartItem] = CartItem.objects.filter(
+            cart__cart_status=CartStatus.ACTIVE,
+            product_id__in=product_pks,
+            product__is_available=True,
+            quantity__gt=F("product__stock"),
+        )
+        changed_cart_pks: List[int] = list(
+            exceeding_cart_items.values_list("cart_id", flat=True).distinct()
+        )
+        clamped_count: int = exceeding_cart_items.update(
+            quantity=Subquery(
+                Product.objects.filter(pk=OuterRef("product_id"))
+                .order_by()
+                .annotate(
+                    clamped_quantity=Case(
+                        When(
+                            weight_step__isnull=False,
+                            then=Floor(F("stock") / F("weight_step"))
+                            * F("weight_step"),  # noqa: W503
+                        ),
+                        default=F("stock"),
+                        output_field=DecimalField(
+                            max_digits=8, decimal_places=2
+                        ),
                     )
-                else:
-                    cart_item.quantity = product.stock
-                cart_item.save(update_fields=["quantity"])
+                )
+                .values("clamped_quantity")
+            )
+        )
+
+        if changed_cart_pks:
+            Cart.objects.filter(pk__in=changed_cart_pks).update(
+                is_stock_changed=True
+            )
 
-                is_stock_changed = True
+        self.refresh_cart_summaries(carts=active_carts)
 
-        return is_stock_changed
+        return clamped_count
+
+    @transaction.atomic
+    def acknowledge_stock_changes(self, *, cart: Cart) -> bool:
+        if not cart.is_stock_changed:
+            return False
+
+        Cart.objects.filter(pk=cart.pk).update(is_stock_changed=False)
+        cart.is_stock_changed = False
+
+        return True
 
     @transaction.atomic
     def change_cart_status(
@@ -163,3 +280,40 @@ class CartService:
     ) -> None:
         cart.cart_status = new_status
         cart.save(update_fields=["cart_status"])
+
+    def refresh_cart_summary(self, *, cart: Cart) -> None:
+        self.refresh_cart_summaries(carts=Cart.objects.filter(pk=cart.pk))
+        cart.refresh_from_db(fields=CART_SUMMARY_FIELDS)
+
+    def refresh_cart_summaries(self, *, carts: QuerySet[Cart]) -> int:
+        cart_items: QuerySet[CartItem] = (
+            CartItem.objects.filter(cart=OuterRef("pk"))
+            .order_by()
+            .values("cart")
+        )
+        available_cart_items: QuerySet[CartItem] = cart_items.filter(
+            product__is_available=True
+        )
+
+        return carts.update(
+            items_count=Coalesce(
+                Subquery(
+                    cart_items.annotate(items_count=Count("pk")).values(
+                        "items_count"
+                    )
+                ),
+                0,
+            ),
+            available_total_price=Coalesce(
+                Subquery(
+                    available_cart_items.annotate(
+                        available_total_price=Sum("total_price")
+                    ).values("available_total_price")
+                ),
+                Value(Decimal(value="0.00")),
+                output_field=DecimalField(max_digits=12, decimal_places=2),
+            ),
+            has_unavailable_items=Exists(
+                cart_items.filter(product__is_available=False)
+            ),
+        )
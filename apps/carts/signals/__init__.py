@@ -0,0 +1,11 @@
+from apps.carts.signals.cart_signals import (
+    invalidate_cart_item_user_version,
+    invalidate_cart_user_version,
+    schedule_product_cart_items_reconciliation,
+)
+
+__all__ = [
+    "invalidate_cart_item_user_version",
+    "invalidate_cart_user_version",
+    "schedule_product_cart_items_reconciliation",
+]
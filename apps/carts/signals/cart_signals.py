@@ -0,0 +1,55 @@
+from typing import Any, Optional
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.carts.models import Cart, CartItem
+from apps.carts.tasks import reconcile_product_cart_items_task
+from apps.catalog.models import Product
+from apps.core.caches import UserVersionCache
+
+
+@receiver(signal=post_save, sender=Cart)
+@receiver(signal=post_delete, sender=Cart)
+def invalidate_cart_user_version(
+    sender: Any, instance: Cart, **kwargs: Any
+) -> None:
+    user_pk: int = instance.user_id
+    transaction.on_commit(
+        lambda: UserVersionCache().invalidate(user_pk=user_pk)
+    )
+
+
+@receiver(signal=post_save, sender=CartItem)
+@receiver(signal=post_delete, sender=CartItem)
+def invalidate_cart_item_user_version(
+    sender: Any, instance: CartItem, **kwargs: Any
+) -> None:
+    user_pk: Optional[int] = (
+        Cart.objects.filter(pk=instance.cart_id)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+
+    if user_pk is None:
+        return
+
+    transaction.on_commit(
+        lambda: UserVersionCache().invalidate(user_pk=user_pk)
+    )
+
+
+@receiver(signal=post_save, sender=Product)
+def schedule_product_cart_items_reconciliation(
+    sender: Any, instance: Product, raw: bool = False, **kwargs: Any
+) -> None:
+    if raw:
+        return
+
+    product_pk: int = instance.pk
+    transaction.on_commit(
+        lambda: reconcile_product_cart_items_task.delay(
+            product_pks=[product_pk]
+        )
+    )
@@ -0,0 +1,7 @@
+from apps.carts.tasks.reconcile_product_cart_items_task import (
+    reconcile_product_cart_items_task,
+)
+
+__all__ = [
+    "reconcile_product_cart_items_task",
+]
@@ -0,0 +1,10 @@
+from typing import List
+
+from celery import shared_task
+
+from apps.carts.services import CartService
+
+
+@shared_task
+def reconcile_product_cart_items_task(*, product_pks: List[int]) -> None:
+    CartService().reconcile_product_cart_items(product_pks=product_pks)
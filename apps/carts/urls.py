@@ -9,6 +9,11 @@ app_name: str = "carts"
 urlpatterns: List[URLPattern] = [
     path("", views.CartDetailView.as_view(), name="detail"),
     path("clear/", views.CartClearView.as_view(), name="clear"),
+    path(
+        "items/bulk-update/",
+        views.CartItemBulkUpdateView.as_view(),
+        name="cart-item-bulk-update",
+    ),
     path(
         "items/<int:cart_item_pk>/delete/",
         views.CartItemDeleteView.as_view(),
@@ -1,5 +1,8 @@
 from apps.carts.views.cart_clear_view import CartClearView
 from apps.carts.views.cart_detail_view import CartDetailView
+from apps.carts.views.cart_item_bulk_update_view import (
+    CartItemBulkUpdateView,
+)
 from apps.carts.views.cart_item_create_view import CartItemCreateView
 from apps.carts.views.cart_item_delete_view import CartItemDeleteView
 from apps.carts.views.cart_item_update_quantity_view import (
@@ -9,6 +12,7 @@ from apps.carts.views.cart_item_update_quantity_view import (
 __all__ = [
     "CartDetailView",
     "CartClearView",
+    "CartItemBulkUpdateView",
     "CartItemDeleteView",
     "CartItemCreateView",
     "CartItemUpdateQuantityView",
@@ -6,6 +6,7 @@ from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import DetailView
 
+from apps.carts.dataclasses import CartSnapshot
 from apps.carts.models import Cart
 from apps.carts.selectors import CartSelector
 from apps.carts.services import CartService
@@ -25,12 +26,17 @@ class CartDetailView(HtmxLoginRequiredMixin, DetailView):
         ]
     }
 
-    def get_object(self, queryset: Optional[QuerySet[Cart]] = None) -> Cart:
-        cart: Cart = CartService().get_or_create_active_cart_for_user(
-            user=self.request.user  # type: ignore
+    def get_object(
+        self, queryset: Optional[QuerySet[Cart]] = None
+    ) -> Optional[Cart]:
+        cart_snapshot: CartSnapshot = CartSelector().get_request_cart_snapshot(
+            request=self.request
         )
 
-        if CartSelector().has_unavailable_cart_items(cart=cart):
+        if cart_snapshot.cart is None:
+            return None
+
+        if cart_snapshot.has_unavailable_cart_items:
             messages.warning(
                 self.request,
                 _(
@@ -39,7 +45,7 @@ class CartDetailView(HtmxLoginRequiredMixin, DetailView):
                 ),
             )
 
-        if CartService().validate_cart_item_quantities(cart=cart):
+        if CartService().acknowledge_stock_changes(cart=cart_snapshot.cart):
             messages.warning(
                 self.request,
                 _(
@@ -48,4 +54,4 @@ class CartDetailView(HtmxLoginRequiredMixin, DetailView):
                 ),
             )
 
-        return cart
+        return cart_snapshot.cart
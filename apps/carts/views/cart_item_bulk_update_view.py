@@ -0,0 +1,181 @@
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional
+
+from django.contrib import messages
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import render
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+from django_stubs_ext import StrOrPromise
+
+from apps.carts.dataclasses import CartSnapshot
+from apps.carts.exceptions import (
+    InsufficientStockError,
+    InvalidCartItemQuantityError,
+    ProductUnavailableError,
+)
+from apps.carts.models import Cart
+from apps.carts.selectors import CartSelector
+from apps.carts.services import CartService
+from apps.core.mixins import HtmxLoginRequiredMixin
+
+MAX_BULK_CART_ITEMS: int = 100
+
+
+class CartItemBulkUpdateView(HtmxLoginRequiredMixin, View):
+
+    def get_quantities(self) -> Dict[int, Decimal]:
+        product_pks: List[str] = self.request.POST.getlist("product")
+        quantities: List[str] = self.request.POST.getlist("quantity")
+
+        if (
+            not product_pks
+            or len(product_pks) != len(quantities)  # noqa: W503
+            or len(product_pks) > MAX_BULK_CART_ITEMS  # noqa: W503
+        ):
+            raise ValueError("Invalid cart item quantities.")
+
+        cart_item_quantities: Dict[int, Decimal] = {}
+
+        for product_pk, quantity in zip(product_pks, quantities, strict=True):
+            cart_item_quantity: Decimal = Decimal(quantity)
+
+            if not cart_item_quantity.is_finite() or cart_item_quantity < 0:
+                raise ValueError("Invalid cart item quantity.")
+
+            cart_item_quantities[int(product_pk)] = cart_item_quantity
+
+        return cart_item_quantities
+
+    def update_quantities(
+        self, *, quantities: Dict[int, Decimal]
+    ) -> Optional[StrOrPromise]:
+        cart: Cart = CartService().get_or_create_active_cart_for_user(
+            user=self.request.user  # type: ignore
+        )
+
+        try:
+            CartService().set_cart_item_quantities(
+                cart=cart, quantities=quantities
+            )
+        except InvalidCartItemQuantityError:
+            return _(
+                "An error occurred while changing the quantity of the "
+                "product in the cart. The quantity specified is incorrect."
+            )
+        except ProductUnavailableError:
+            return _(
+                "An error occurred while changing the quantity of the "
+                "product in the cart. Product is unavailable."
+            )
+        except InsufficientStockError:
+            return _(
+                "An error occurred while changing the quantity of the "
+                "product in the cart. The requested quantity "
+                "is out of stock."
+            )
+        except Exception:
+            return _(
+                "An error occurred while changing the quantity of the "
+                "product in the cart. Please try again."
+            )
+
+        return None
+
+    def post(self, request: HttpRequest) -> HttpResponse:
+        quantities: Dict[int, Decimal] = {}
+        error_message: Optional[StrOrPromise]
+
+        try:
+            quantities = self.get_quantities()
+        except (ValueError, InvalidOperation):
+            error_message = _(
+                "An error occurred while changing the quantity of the "
+                "product in the cart. The quantity specified is incorrect."
+            )
+        else:
+            error_message = self.update_quantities(quantities=quantities)
+
+        cart_snapshot: CartSnapshot = CartSelector().get_request_cart_snapshot(
+            request=request, refresh=True
+        )
+
+        if not request.htmx:  # type: ignore
+            return self.render_json(
+                cart_snapshot=cart_snapshot, error_message=error_message
+            )
+
+        if error_message is None:
+            messages.success(
+                request,
+                _(
+                    "The quantity of the product in the cart has been "
+                    "successfully updated. The price has been updated."
+                ),
+            )
+        else:
+            messages.error(request, error_message)
+
+        return self.render_htmx(
+            cart_snapshot=cart_snapshot, quantities=quantities
+        )
+
+    def render_htmx(
+        self, *, cart_snapshot: CartSnapshot, quantities: Dict[int, Decimal]
+    ) -> HttpResponse:
+        htmx_target: Optional[str] = self.request.htmx.target  # type: ignore
+
+        if len(quantities) == 1:
+            product_pk: int = next(iter(quantities))
+            cart_item: Any = cart_snapshot.cart_items_map.get(product_pk)
+
+            if htmx_target and re.match(
+                pattern=r"^cart-item-control-\d+$", string=htmx_target
+            ):
+                if cart_item:
+                    return render(
+                        self.request,
+                        template_name=(
+                            "carts/includes/_cart_item_control_htmx.html"
+                        ),
+                        context={"cart_item": cart_item},
+                    )
+                return render(
+                    self.request,
+                    template_name="carts/includes/_cart_item_stale_htmx.html",
+                    context={"cart_item_pk": htmx_target.rsplit("-", 1)[1]},
+                )
+
+            if cart_item:
+                return render(
+                    self.request,
+                    template_name=(
+                        "carts/includes/_product_cart_item_control_htmx.html"
+                    ),
+                    context={"product": cart_item.product},
+                )
+
+        return render(
+            self.request,
+            template_name="carts/includes/_cart_item_bulk_update_htmx.html",
+        )
+
+    def render_json(
+        self,
+        *,
+        cart_snapshot: CartSnapshot,
+        error_message: Optional[StrOrPromise],
+    ) -> JsonResponse:
+        return JsonResponse(
+            {
+                "error": str(error_message) if error_message else None,
+                "total_quantity": cart_snapshot.total_quantity,
+                "total_price": str(cart_snapshot.cart_prices["total_price"]),
+                "items": {
+                    str(cart_item.product_id): str(cart_item.quantity)
+                    for cart_item in cart_snapshot.cart_items
+                },
+            },
+            status=400 if error_message else 200,
+        )
@@ -97,8 +97,10 @@ class CartItemUpdateQuantityView(HtmxLoginRequiredMixin, View):
             )
 
         if request.htmx:  # type: ignore
-            cart_item: Optional[CartItem] = CartSelector().get_cart_item(
-                cart=cart, cart_item_pk=cart_item_pk
+            cart_item: Optional[CartItem] = (
+                CartSelector()
+                .get_request_cart_snapshot(request=request)
+                .get_cart_item(cart_item_pk=cart_item_pk)
             )
 
             htmx_target: Optional[str] = request.htmx.target  # type: ignore
@@ -35,6 +35,8 @@ class ProductAdmin(BaseModelAdmin, TabbedTranslationAdmin):
     readonly_fields = (
         "final_price",
         "is_available",
+        "rating_average",
+        "rating_count",
         "created_at",
         "updated_at",
     )
@@ -8,3 +8,6 @@ class CatalogConfig(AppConfig):
     name: str = "apps.catalog"
     verbose_name: StrOrPromise = _("Catalog")
     label: str = "catalog"
+
+    def ready(self) -> None:
+        from apps.catalog import signals  # noqa: F401
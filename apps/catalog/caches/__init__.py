@@ -0,0 +1,13 @@
+from apps.catalog.caches.category_tree_cache import CategoryTreeCache
+from apps.catalog.caches.product_facet_cache import ProductFacetCache
+from apps.catalog.caches.product_ranking_cache import ProductRankingCache
+from apps.catalog.caches.product_suggestion_cache import (
+    ProductSuggestionCache,
+)
+
+__all__ = [
+    "CategoryTreeCache",
+    "ProductFacetCache",
+    "ProductRankingCache",
+    "ProductSuggestionCache",
+]
@@ -0,0 +1,47 @@
+import time
+from typing import Optional, Tuple
+
+from django.core.cache import cache
+
+from apps.catalog.dataclasses import CategoryTree
+from apps.catalog.models import Category
+
+CATEGORY_TREE_VERSION_KEY: str = "catalog:category-tree:version"
+CATEGORY_TREE_KEY: str = "catalog:category-tree:{version}"
+CATEGORY_TREE_TIMEOUT: int = 60 * 60 * 24
+
+
+class CategoryTreeCache:
+    _local_tree: Optional[Tuple[int, CategoryTree]] = None
+
+    def get_version(self) -> int:
+        version: Optional[int] = cache.get(CATEGORY_TREE_VERSION_KEY)
+
+        if version is None:
+            cache.add(CATEGORY_TREE_VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(CATEGORY_TREE_VERSION_KEY)
+
+        return version  # type: ignore
+
+    def get_tree(self) -> CategoryTree:
+        version: int = self.get_version()
+        local_tree: Optional[Tuple[int, CategoryTree]] = (
+            CategoryTreeCache._local_tree
+        )
+
+        if local_tree is not None and local_tree[0] == version:
+            return local_tree[1]
+
+        tree_key: str = CATEGORY_TREE_KEY.format(version=version)
+        tree: Optional[CategoryTree] = cache.get(tree_key)
+
+        if tree is None:
+            tree = CategoryTree.build(categories=Category.objects.all())
+            cache.set(tree_key, tree, timeout=CATEGORY_TREE_TIMEOUT)
+
+        CategoryTreeCache._local_tree = (version, tree)
+
+        return tree
+
+    def invalidate(self) -> None:
+        cache.set(CATEGORY_TREE_VERSION_KEY, time.time_ns(), timeout=None)
@@ -0,0 +1,70 @@
+import time
+from typing import Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+from apps.catalog.caches.category_tree_cache import CategoryTreeCache
+from apps.catalog.dataclasses import (
+    PRODUCT_FACET_RANGE_FIELDS,
+    ProductFacets,
+)
+from apps.catalog.models import Category, Product
+
+PRODUCT_FACETS_KEY: str = "catalog:product-facets:{category_pk}"
+PRODUCT_FACETS_TIMEOUT: int = 60 * 60 * 24
+
+
+class ProductFacetCache:
+
+    def build_facets(self, *, category_pk: int) -> ProductFacets:
+        languages: List[str] = [code for code, _ in settings.LANGUAGES]
+        category: Optional[Category] = (
+            CategoryTreeCache().get_tree().categories.get(category_pk)
+        )
+        category_path: str = category.path if category else f"{category_pk}/"
+
+        return ProductFacets.build(
+            rows=Product.objects.filter(
+                is_active=True, category__path__startswith=category_path
+            )
+            .order_by()
+            .values(
+                "unit_type",
+                *[f"attributes_{language}" for language in languages],
+                **{
+                    f"{name}_value": F(field_name)
+                    for name, field_name in PRODUCT_FACET_RANGE_FIELDS.items()
+                },
+            ),
+            languages=languages,
+            version=time.time_ns(),
+        )
+
+    def get_facets(self, *, category_pk: int) -> ProductFacets:
+        facets_key: str = PRODUCT_FACETS_KEY.format(category_pk=category_pk)
+        facets: Optional[ProductFacets] = cache.get(facets_key)
+
+        if facets is None:
+            facets = self.build_facets(category_pk=category_pk)
+            cache.set(facets_key, facets, timeout=PRODUCT_FACETS_TIMEOUT)
+
+        return facets
+
+    def refresh(self, *, category_pks: Iterable[int]) -> None:
+        ancestor_pks: Set[int] = set()
+
+        for category_pk in category_pks:
+            ancestor_pks.update(
+                CategoryTreeCache()
+                .get_tree()
+                .ancestor_pks.get(category_pk, (category_pk,))
+            )
+
+        for category_pk in ancestor_pks:
+            cache.set(
+                PRODUCT_FACETS_KEY.format(category_pk=category_pk),
+                self.build_facets(category_pk=category_pk),
+                timeout=PRODUCT_FACETS_TIMEOUT,
+            )
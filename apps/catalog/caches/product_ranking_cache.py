@@ -0,0 +1,19 @@
+from typing import Optional
+
+from django.core.cache import cache
+
+from apps.catalog.dataclasses import ProductRankings
+
+PRODUCT_RANKINGS_KEY: str = "catalog:product-rankings"
+PRODUCT_RANKINGS_TIMEOUT: int = 60 * 60 * 24
+
+
+class ProductRankingCache:
+
+    def get_rankings(self) -> Optional[ProductRankings]:
+        return cache.get(PRODUCT_RANKINGS_KEY)
+
+    def set_rankings(self, *, rankings: ProductRankings) -> None:
+        cache.set(
+            PRODUCT_RANKINGS_KEY, rankings, timeout=PRODUCT_RANKINGS_TIMEOUT
+        )
@@ -0,0 +1,124 @@
+import hashlib
+import time
+from typing import Dict, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.utils import translation
+
+from apps.catalog.dataclasses import (
+    ProductSuggestion,
+    ProductSuggestionIndex,
+    ProductSuggestionIndexes,
+)
+from apps.catalog.models import Category, Product
+
+PRODUCT_SUGGESTION_VERSION_KEY: str = "catalog:product-suggestions:version"
+PRODUCT_SUGGESTION_INDEX_KEY: str = (
+    "catalog:product-suggestions:{version}:{language}"
+)
+PRODUCT_SUGGESTION_RESULT_KEY: str = (
+    "catalog:product-suggestions:{version}:{language}:{limit}:{query}"
+)
+PRODUCT_SUGGESTION_INDEX_TIMEOUT: int = 60 * 60 * 24
+PRODUCT_SUGGESTION_RESULT_TIMEOUT: int = 60
+
+
+class ProductSuggestionCache:
+    _local_indexes: Dict[str, Tuple[int, ProductSuggestionIndexes]] = {}
+
+    def get_version(self) -> int:
+        version: Optional[int] = cache.get(PRODUCT_SUGGESTION_VERSION_KEY)
+
+        if version is None:
+            cache.add(
+                PRODUCT_SUGGESTION_VERSION_KEY, time.time_ns(), timeout=None
+            )
+            version = cache.get(PRODUCT_SUGGESTION_VERSION_KEY)
+
+        return version  # type: ignore
+
+    def build_indexes(self) -> ProductSuggestionIndexes:
+        products: List[ProductSuggestion] = [
+            ProductSuggestion(
+                name=product.name, url=product.get_absolute_url()
+            )
+            for product in Product.objects.filter(
+                is_active=True, category__is_active=True
+            )
+            .select_related("category")
+            .only("name", "slug", "category__slug")
+            .order_by("-rating_count", "name")
+        ]
+        categories: List[ProductSuggestion] = [
+            ProductSuggestion(
+                name=category.name, url=category.get_absolute_url()
+            )
+            for category in Category.objects.filter(is_active=True).only(
+                "name", "slug"
+            )
+        ]
+
+        return ProductSuggestionIndexes(
+            products=ProductSuggestionIndex.build(suggestions=products),
+            categories=ProductSuggestionIndex.build(suggestions=categories),
+        )
+
+    def get_indexes(self, *, version: int) -> ProductSuggestionIndexes:
+        language: str = translation.get_language()
+        local_indexes: Optional[Tuple[int, ProductSuggestionIndexes]] = (
+            ProductSuggestionCache._local_indexes.get(language)
+        )
+
+        if local_indexes is not None and local_indexes[0] == version:
+            return local_indexes[1]
+
+        index_key: str = PRODUCT_SUGGESTION_INDEX_KEY.format(
+            version=version, language=language
+        )
+        indexes: Optional[ProductSuggestionIndexes] = cache.get(index_key)
+
+        if indexes is None:
+            indexes = self.build_indexes()
+            cache.set(
+                index_key, indexes, timeout=PRODUCT_SUGGESTION_INDEX_TIMEOUT
+            )
+
+        ProductSuggestionCache._local_indexes[language] = (version, indexes)
+
+        return indexes
+
+    def get_suggestions(
+        self, *, query: str, limit: int = 8
+    ) -> Dict[str, List[ProductSuggestion]]:
+        normalized_query: str = ProductSuggestionIndex.normalize(query)
+
+        if not normalized_query:
+            return {"products": [], "categories": []}
+
+        version: int = self.get_version()
+        result_key: str = PRODUCT_SUGGESTION_RESULT_KEY.format(
+            version=version,
+            language=translation.get_language(),
+            limit=limit,
+            query=hashlib.md5(
+                normalized_query.encode(), usedforsecurity=False
+            ).hexdigest(),
+        )
+        suggestions: Optional[Dict[str, List[ProductSuggestion]]] = cache.get(
+            result_key
+        )
+
+        if suggestions is None:
+            suggestions = self.get_indexes(version=version).search(
+                query=normalized_query, limit=limit
+            )
+            cache.set(
+                result_key,
+                suggestions,
+                timeout=PRODUCT_SUGGESTION_RESULT_TIMEOUT,
+            )
+
+        return suggestions
+
+    def invalidate(self) -> None:
+        cache.set(PRODUCT_SUGGESTION_VERSION_KEY, time.time_ns(), timeout=None)
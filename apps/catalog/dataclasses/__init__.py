@@ -0,0 +1,33 @@
+from apps.catalog.dataclasses.category_tree_dataclass import (
+    CategoryNode,
+    CategoryTree,
+)
+from apps.catalog.dataclasses.product_facets_dataclass import (
+    PRODUCT_FACET_RANGE_FIELDS,
+    PRODUCT_FACET_RANGES,
+    FacetRange,
+    ProductFacets,
+)
+from apps.catalog.dataclasses.product_rankings_dataclass import (
+    ProductRankings,
+)
+from apps.catalog.dataclasses.product_suggestion_index_dataclass import (
+    ProductSuggestion,
+    ProductSuggestionIndex,
+    ProductSuggestionIndexes,
+)
+from apps.catalog.dataclasses.stock_shortage_dataclass import StockShortage
+
+__all__ = [
+    "CategoryNode",
+    "CategoryTree",
+    "FacetRange",
+    "PRODUCT_FACET_RANGE_FIELDS",
+    "PRODUCT_FACET_RANGES",
+    "ProductFacets",
+    "ProductRankings",
+    "ProductSuggestion",
+    "ProductSuggestionIndex",
+    "ProductSuggestionIndexes",
+    "StockShortage",
+]
@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from apps.catalog.models import Category
+
+
+@dataclass(frozen=True)
+class CategoryNode:
+    category: Category
+    subcategories: List[Category] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CategoryTree:
+    categories: Dict[int, Category] = field(default_factory=dict)
+    category_pks_by_slug: Dict[str, int] = field(default_factory=dict)
+    children_pks: Dict[Optional[int], Tuple[int, ...]] = field(
+        default_factory=dict
+    )
+    ancestor_pks: Dict[int, Tuple[int, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, *, categories: Iterable[Category]) -> "CategoryTree":
+        categories_by_pk: Dict[int, Category] = {}
+        children_pks: Dict[Optional[int], List[int]] = {}
+
+        for category in categories:
+            categories_by_pk[category.pk] = category
+            children_pks.setdefault(category.parent_id, []).append(category.pk)
+
+        return cls(
+            categories=categories_by_pk,
+            category_pks_by_slug={
+                category.slug: category.pk
+                for category in categories_by_pk.values()
+            },
+            children_pks={
+                parent_pk: tuple(pks)
+                for parent_pk, pks in children_pks.items()
+            },
+            ancestor_pks={
+                category.pk: category.get_ancestor_pks()
+                for category in categories_by_pk.values()
+            },
+        )
+
+    def get_last_modified(self) -> Optional[datetime]:
+        return max(
+            (category.updated_at for category in self.categories.values()),
+            default=None,
+        )
+
+    def get_category(
+        self, *, category_slug: str, only_active: bool = True
+    ) -> Optional[Category]:
+        category_pk: Optional[int] = self.category_pks_by_slug.get(
+            category_slug
+        )
+
+        if category_pk is None:
+            return None
+
+        category: Category = self.categories[category_pk]
+
+        if only_active and not category.is_active:
+            return None
+
+        return category
+
+    def get_children(
+        self, *, category_pk: Optional[int], only_active: bool = True
+    ) -> List[Category]:
+        return [
+            self.categories[child_pk]
+            for child_pk in self.children_pks.get(category_pk, ())
+            if not only_active or self.categories[child_pk].is_active
+        ]
+
+    def get_nodes(self, *, only_active: bool = True) -> List[CategoryNode]:
+        return [
+            CategoryNode(
+                category=category,
+                subcategories=self.get_children(
+                    category_pk=category.pk, only_active=only_active
+                ),
+            )
+            for category in self.get_children(
+                category_pk=None, only_active=only_active
+            )
+        ]
+
+    def get_hierarchy(self, *, category_pk: int) -> List[Category]:
+        return [
+            self.categories[ancestor_pk]
+            for ancestor_pk in self.ancestor_pks.get(category_pk, ())
+            if ancestor_pk in self.categories
+        ]
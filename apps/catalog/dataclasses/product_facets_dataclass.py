@@ -0,0 +1,120 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class FacetRange:
+    lower: Decimal
+    upper: Optional[Decimal] = None
+
+    @property
+    def slug(self) -> str:
+        return f"{self.lower}-{self.upper or ''}"
+
+    def contains(self, value: Optional[Decimal]) -> bool:
+        return (
+            value is not None
+            and value >= self.lower
+            and (self.upper is None or value < self.upper)
+        )
+
+
+PRODUCT_FACET_RANGE_FIELDS: Dict[str, str] = {
+    "price": "final_price",
+    "calories": "nutrition__calories",
+    "proteins": "nutrition__proteins",
+    "fats": "nutrition__fats",
+    "carbs": "nutrition__carbs",
+}
+
+PRODUCT_FACET_RANGES: Dict[str, Tuple[FacetRange, ...]] = {
+    "price": (
+        FacetRange(lower=Decimal("0"), upper=Decimal("100")),
+        FacetRange(lower=Decimal("100"), upper=Decimal("300")),
+        FacetRange(lower=Decimal("300"), upper=Decimal("500")),
+        FacetRange(lower=Decimal("500"), upper=Decimal("1000")),
+        FacetRange(lower=Decimal("1000")),
+    ),
+    "calories": (
+        FacetRange(lower=Decimal("0"), upper=Decimal("100")),
+        FacetRange(lower=Decimal("100"), upper=Decimal("250")),
+        FacetRange(lower=Decimal("250"), upper=Decimal("400")),
+        FacetRange(lower=Decimal("400")),
+    ),
+    "proteins": (
+        FacetRange(lower=Decimal("0"), upper=Decimal("5")),
+        FacetRange(lower=Decimal("5"), upper=Decimal("15")),
+        FacetRange(lower=Decimal("15")),
+    ),
+    "fats": (
+        FacetRange(lower=Decimal("0"), upper=Decimal("5")),
+        FacetRange(lower=Decimal("5"), upper=Decimal("15")),
+        FacetRange(lower=Decimal("15")),
+    ),
+    "carbs": (
+        FacetRange(lower=Decimal("0"), upper=Decimal("5")),
+        FacetRange(lower=Decimal("5"), upper=Decimal("15")),
+        FacetRange(lower=Decimal("15")),
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ProductFacets:
+    version: int = 0
+    unit_types: Dict[str, int] = field(default_factory=dict)
+    ranges: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    attributes: Dict[str, Dict[str, Dict[str, int]]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        rows: Iterable[Mapping[str, Any]],
+        languages: Iterable[str],
+        version: int,
+    ) -> "ProductFacets":
+        unit_types: Dict[str, int] = {}
+        ranges: Dict[str, Dict[str, int]] = {
+            name: {} for name in PRODUCT_FACET_RANGES
+        }
+        attributes: Dict[str, Dict[str, Dict[str, int]]] = {
+            language: {} for language in languages
+        }
+
+        for row in rows:
+            unit_types[row["unit_type"]] = (
+                unit_types.get(row["unit_type"], 0) + 1
+            )
+
+            for name, facet_ranges in PRODUCT_FACET_RANGES.items():
+                for facet_range in facet_ranges:
+                    if facet_range.contains(row[f"{name}_value"]):
+                        ranges[name][facet_range.slug] = (
+                            ranges[name].get(facet_range.slug, 0) + 1
+                        )
+
+            for language, language_attributes in attributes.items():
+                for key, value in (
+                    row[f"attributes_{language}"] or {}
+                ).items():
+                    if not isinstance(value, str):
+                        continue
+
+                    values: Dict[str, int] = language_attributes.setdefault(
+                        key, {}
+                    )
+                    values[value] = values.get(value, 0) + 1
+
+        return cls(
+            version=version,
+            unit_types=unit_types,
+            ranges=ranges,
+            attributes=attributes,
+        )
+
+    def get_attributes(self, *, language: str) -> Dict[str, Dict[str, int]]:
+        return self.attributes.get(language, {})
@@ -0,0 +1,47 @@
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class ProductRankings:
+    popular_product_pks: Tuple[int, ...] = ()
+    similar_product_pks: Dict[int, Tuple[int, ...]] = field(
+        default_factory=dict
+    )
+
+    @staticmethod
+    def sample(
+        *, product_pks: Tuple[int, ...], limit: int, pool_size: int
+    ) -> List[int]:
+        pool: Tuple[int, ...] = product_pks[:pool_size]
+        sampled_positions: List[int] = random.sample(  # noqa: S311
+            range(len(pool)), k=min(limit, len(pool))
+        )
+        sampled_positions.sort()
+
+        return [pool[position] for position in sampled_positions]
+
+    def get_popular_product_pks(
+        self, *, limit: int, pool_size: int
+    ) -> List[int]:
+        return self.sample(
+            product_pks=self.popular_product_pks,
+            limit=limit,
+            pool_size=pool_size,
+        )
+
+    def get_similar_product_pks(
+        self, *, product_pk: int, category_pk: int, limit: int, pool_size: int
+    ) -> List[int]:
+        return self.sample(
+            product_pks=tuple(
+                similar_product_pk
+                for similar_product_pk in self.similar_product_pks.get(
+                    category_pk, ()
+                )
+                if similar_product_pk != product_pk
+            ),
+            limit=limit,
+            pool_size=pool_size,
+        )
@@ -0,0 +1,75 @@
+import bisect
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+@dataclass(frozen=True)
+class ProductSuggestion:
+    name: str
+    url: str
+
+
+@dataclass(frozen=True)
+class ProductSuggestionIndex:
+    suggestions: Tuple[ProductSuggestion, ...] = ()
+    keys: Tuple[str, ...] = ()
+    positions: Tuple[int, ...] = ()
+
+    @staticmethod
+    def normalize(value: str) -> str:
+        return " ".join(value.casefold().replace("ё", "е").split())
+
+    @classmethod
+    def build(
+        cls, *, suggestions: Iterable[ProductSuggestion]
+    ) -> "ProductSuggestionIndex":
+        indexed_suggestions: Tuple[ProductSuggestion, ...] = tuple(suggestions)
+        entries: List[Tuple[str, int]] = []
+
+        for position, suggestion in enumerate(indexed_suggestions):
+            words: List[str] = cls.normalize(suggestion.name).split(" ")
+
+            for word_index in range(len(words)):
+                entries.append((" ".join(words[word_index:]), position))
+
+        entries.sort()
+
+        return cls(
+            suggestions=indexed_suggestions,
+            keys=tuple(key for key, _ in entries),
+            positions=tuple(position for _, position in entries),
+        )
+
+    def search(self, *, query: str, limit: int) -> List[ProductSuggestion]:
+        prefix: str = self.normalize(query)
+
+        if not prefix:
+            return []
+
+        start: int = bisect.bisect_left(self.keys, prefix)
+        end: int = bisect.bisect_left(self.keys, prefix + "\uffff", lo=start)
+        positions: Set[int] = set(self.positions[start:end])
+
+        return [
+            self.suggestions[position]
+            for position in heapq.nsmallest(limit, positions)
+        ]
+
+
+@dataclass(frozen=True)
+class ProductSuggestionIndexes:
+    products: ProductSuggestionIndex = field(
+        default_factory=ProductSuggestionIndex
+    )
+    categories: ProductSuggestionIndex = field(
+        default_factory=ProductSuggestionIndex
+    )
+
+    def search(
+        self, *, query: str, limit: int
+    ) -> Dict[str, List[ProductSuggestion]]:
+        return {
+            "products": self.products.search(query=query, limit=limit),
+            "categories": self.categories.search(query=query, limit=limit),
+        }
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+
+@dataclass(frozen=True)
+class StockShortage:
+    product_pk: int
+    requested_quantity: Decimal
+    available_quantity: Decimal
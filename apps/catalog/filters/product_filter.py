@@ -1,13 +1,44 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
 import django_filters
-from django.contrib.postgres import search
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
 from django.utils.translation import gettext_lazy as _
+from modeltranslation.utils import get_language
 
+from apps.catalog.choices import UnitType
+from apps.catalog.dataclasses import (
+    PRODUCT_FACET_RANGE_FIELDS,
+    PRODUCT_FACET_RANGES,
+    FacetRange,
+    ProductFacets,
+)
 from apps.catalog.models import Product
+from apps.catalog.selectors import ProductSelector
 
 
 class ProductFilter(django_filters.FilterSet):
     q = django_filters.CharFilter(method="filter_search")
+    unit_type = django_filters.MultipleChoiceFilter(
+        choices=UnitType.choices, label=_("Unit type")
+    )
+    price = django_filters.MultipleChoiceFilter(
+        method="filter_range", label=_("Price")
+    )
+    calories = django_filters.MultipleChoiceFilter(
+        method="filter_range", label=_("Calories")
+    )
+    proteins = django_filters.MultipleChoiceFilter(
+        method="filter_range", label=_("Proteins")
+    )
+    fats = django_filters.MultipleChoiceFilter(
+        method="filter_range", label=_("Fats")
+    )
+    carbs = django_filters.MultipleChoiceFilter(
+        method="filter_range", label=_("Carbs")
+    )
+    attribute = django_filters.MultipleChoiceFilter(
+        method="filter_attribute", label=_("Attributes")
+    )
     sort = django_filters.OrderingFilter(
         fields=(
             ("final_price", "price"),
@@ -25,7 +56,118 @@ class ProductFilter(django_filters.FilterSet):
 
     class Meta:
         model = Product
-        fields = ("q", "sort")
+        fields = (
+            "q",
+            "unit_type",
+            "price",
+            "calories",
+            "proteins",
+            "fats",
+            "carbs",
+            "attribute",
+            "sort",
+        )
+
+    def __init__(
+        self, *args: Any, facets: Optional[ProductFacets] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.facets: ProductFacets = facets or ProductFacets()
+
+        for name, facet_ranges in PRODUCT_FACET_RANGES.items():
+            self.filters[name].extra["choices"] = [
+                (facet_range.slug, self.get_range_label(facet_range))
+                for facet_range in facet_ranges
+            ]
+
+        self.filters["attribute"].extra["choices"] = [
+            (f"{key}:{value}", value)
+            for key, values in self.attributes.items()
+            for value in values
+        ]
+
+    @property
+    def attributes(self) -> Dict[str, Dict[str, int]]:
+        return self.facets.get_attributes(language=get_language())
+
+    def get_range_label(self, facet_range: FacetRange) -> str:
+        if facet_range.upper is None:
+            return _("from %(lower)s") % {"lower": facet_range.lower}
+
+        return f"{facet_range.lower} – {facet_range.upper}"
+
+    def get_selected_values(self, name: str) -> List[str]:
+        if self.data is None or not hasattr(self.data, "getlist"):
+            return []
+
+        return self.data.getlist(name)
+
+    def get_facet_group(
+        self, *, name: str, label: str, options: Iterable[Tuple[str, str, int]]
+    ) -> Dict[str, Any]:
+        selected_values: List[str] = self.get_selected_values(name)
+
+        return {
+            "name": name,
+            "label": label,
+            "options": [
+                {
+                    "value": value,
+                    "label": option_label,
+                    "count": count,
+                    "is_selected": value in selected_values,
+                }
+                for value, option_label, count in options
+                if count or value in selected_values
+            ],
+        }
+
+    def get_facet_groups(self) -> List[Dict[str, Any]]:
+        facet_groups: List[Dict[str, Any]] = [
+            self.get_facet_group(
+                name="unit_type",
+                label=self.filters["unit_type"].label,
+                options=[
+                    (value, label, self.facets.unit_types.get(value, 0))
+                    for value, label in UnitType.choices
+                ],
+            )
+        ]
+
+        for name, facet_ranges in PRODUCT_FACET_RANGES.items():
+            counts: Dict[str, int] = self.facets.ranges.get(name, {})
+            facet_groups.append(
+                self.get_facet_group(
+                    name=name,
+                    label=self.filters[name].label,
+                    options=[
+                        (
+                            facet_range.slug,
+                            self.get_range_label(facet_range),
+                            counts.get(facet_range.slug, 0),
+                        )
+                        for facet_range in facet_ranges
+                    ],
+                )
+            )
+
+        for key, values in sorted(self.attributes.items()):
+            facet_groups.append(
+                self.get_facet_group(
+                    name="attribute",
+                    label=key,
+                    options=[
+                        (f"{key}:{value}", value, count)
+                        for value, count in sorted(values.items())
+                    ],
+                )
+            )
+
+        return [
+            facet_group
+            for facet_group in facet_groups
+            if facet_group["options"]
+        ]
 
     def filter_search(
         self, queryset: QuerySet[Product], name: str, value: str
@@ -33,16 +175,43 @@ class ProductFilter(django_filters.FilterSet):
         if not value:
             return queryset
 
-        search_vector: search.SearchVector = search.SearchVector("name")
-        search_query: search.SearchQuery = search.SearchQuery(value=value)
+        return ProductSelector().search_products(
+            products=queryset, query=value
+        )
+
+    def filter_range(
+        self, queryset: QuerySet[Product], name: str, value: List[str]
+    ) -> QuerySet[Product]:
+        field_name: str = PRODUCT_FACET_RANGE_FIELDS[name]
+        condition: Q = Q()
+
+        for facet_range in PRODUCT_FACET_RANGES[name]:
+            if facet_range.slug not in value:
+                continue
 
-        return (
-            queryset.annotate(
-                search=search_vector,
-                rank=search.SearchRank(
-                    search_vector, search_query, cover_density=True
-                ),
+            range_condition: Q = Q(**{f"{field_name}__gte": facet_range.lower})
+
+            if facet_range.upper is not None:
+                range_condition &= Q(
+                    **{f"{field_name}__lt": facet_range.upper}
+                )
+
+            condition |= range_condition
+
+        return queryset.filter(condition) if condition else queryset
+
+    def filter_attribute(
+        self, queryset: QuerySet[Product], name: str, value: List[str]
+    ) -> QuerySet[Product]:
+        conditions: Dict[str, Q] = {}
+
+        for attribute in value:
+            key, _separator, attribute_value = attribute.partition(":")
+            conditions[key] = conditions.get(key, Q()) | Q(
+                attributes__contains={key: attribute_value}
             )
-            .filter(search=search_query)
-            .order_by("-rank")
-        )
+
+        for condition in conditions.values():
+            queryset = queryset.filter(condition)
+
+        return queryset
@@ -1,8 +1,8 @@
 import django_filters
-from django.contrib.postgres import search
 from django.db.models import QuerySet
 
 from apps.catalog.models import Product
+from apps.catalog.selectors import ProductSelector
 
 
 class ProductSearchFilter(django_filters.FilterSet):
@@ -18,16 +18,6 @@ class ProductSearchFilter(django_filters.FilterSet):
         if not value:
             return queryset
 
-        search_vector: search.SearchVector = search.SearchVector("name")
-        search_query: search.SearchQuery = search.SearchQuery(value=value)
-
-        return (
-            queryset.annotate(
-                search=search_vector,
-                rank=search.SearchRank(
-                    search_vector, search_query, cover_density=True
-                ),
-            )
-            .filter(search=search_query)
-            .order_by("-rank")
+        return ProductSelector().search_products(
+            products=queryset, query=value
         )
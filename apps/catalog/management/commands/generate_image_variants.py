@@ -0,0 +1,53 @@
+from typing import Any, List, Type
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.catalog.models import Category, ProductImage
+from apps.core.models import ResponsiveImageModel
+from apps.core.services import ImageVariantService
+
+IMAGE_MODELS: List[Type[ResponsiveImageModel]] = [ProductImage, Category]
+
+
+class Command(BaseCommand):
+    help = "Generate responsive image variants for catalog images."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate variants that are already up to date.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        image_variant_service: ImageVariantService = ImageVariantService()
+        generated_count: int = 0
+
+        for model in IMAGE_MODELS:
+            for instance in model.objects.exclude(image="").exclude(
+                image__isnull=True
+            ):
+                if not options["force"] and (
+                    (instance.image_variants or {}).get("source")
+                    == instance.image_source_name
+                ):
+                    continue
+
+                try:
+                    image_variant_service.generate_variants(instance=instance)
+                except OSError as error:
+                    self.stderr.write(
+                        self.style.WARNING(
+                            f"Skipped {instance._meta.label} {instance.pk}: "
+                            f"{error}"
+                        )
+                    )
+                    continue
+
+                generated_count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Image variants generated for {generated_count} images."
+            )
+        )
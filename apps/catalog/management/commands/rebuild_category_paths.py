@@ -0,0 +1,18 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.catalog.services import CategoryService
+
+
+class Command(BaseCommand):
+    help = "Rebuild materialized category paths from parent links."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        updated_count: int = CategoryService().rebuild_paths()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Category paths rebuilt for {updated_count} categories."
+            )
+        )
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.6 on 2026-10-15 17:42
+
+from decimal import Decimal
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0024_alter_product_is_available"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="rating_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Calculated by the system.",
+                verbose_name="rating count",
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="rating_sum",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Calculated by the system.",
+                verbose_name="rating sum",
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="rating_average",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        rating_count=0, then=models.Value(Decimal("0.00"))
+                    ),
+                    default=django.db.models.expressions.CombinedExpression(
+                        django.db.models.functions.comparison.Cast(
+                            models.F("rating_sum"),
+                            output_field=models.DecimalField(
+                                decimal_places=2, max_digits=12
+                            ),
+                        ),
+                        "/",
+                        models.F("rating_count"),
+                    ),
+                    output_field=models.DecimalField(
+                        decimal_places=2, max_digits=3
+                    ),
+                ),
+                help_text="Calculated by the system.",
+                output_field=models.DecimalField(
+                    decimal_places=2, max_digits=3
+                ),
+                verbose_name="rating average",
+            ),
+        ),
+    ]
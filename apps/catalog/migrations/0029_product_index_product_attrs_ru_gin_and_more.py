@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-15 18:23
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0028_category_image_variants_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["attributes_ru"], name="index_product_attrs_ru_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["attributes_en"], name="index_product_attrs_en_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.6 on 2026-10-15 18:25
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+def fill_category_paths(apps, schema_editor):
+    Category = apps.get_model("catalog", "Category")
+
+    parent_pks = {
+        pk: parent_pk
+        for pk, parent_pk in Category.objects.values_list("pk", "parent_id")
+    }
+    categories = []
+
+    for category in Category.objects.only("pk", "parent_id"):
+        ancestor_pks = []
+        ancestor_pk = category.pk
+
+        while ancestor_pk is not None and ancestor_pk not in ancestor_pks:
+            ancestor_pks.append(ancestor_pk)
+            ancestor_pk = parent_pks.get(ancestor_pk)
+
+        category.path = "".join(f"{pk}/" for pk in reversed(ancestor_pks))
+        categories.append(category)
+
+    Category.objects.bulk_update(categories, fields=["path"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0029_product_index_product_attrs_ru_gin_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="path",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="Calculated by the system.",
+                max_length=255,
+                verbose_name="path",
+            ),
+        ),
+        migrations.RunPython(
+            code=fill_category_paths,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    models.F("path"), name="varchar_pattern_ops"
+                ),
+                name="index_category_path",
+            ),
+        ),
+    ]
@@ -1,13 +1,18 @@
-from django.db import models
+from typing import Any, Optional, Tuple
+
+from django.contrib.postgres.indexes import OpClass
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models.functions import Concat, Substr
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import pgettext_lazy
 from django_resized import ResizedImageField
 
-from apps.core.models import BaseModel
+from apps.core.models import BaseModel, ResponsiveImageModel
 
 
-class Category(BaseModel):  # type: ignore
+class Category(ResponsiveImageModel, BaseModel):  # type: ignore
     parent = models.ForeignKey(
         to="self",
         on_delete=models.CASCADE,
@@ -49,6 +54,13 @@ class Category(BaseModel):  # type: ignore
         default=True,
         verbose_name=pgettext_lazy("feminine", "active"),
     )
+    path = models.CharField(
+        max_length=255,
+        default="",
+        editable=False,
+        verbose_name=_("path"),
+        help_text=_("Calculated by the system."),
+    )
 
     class Meta:
         db_table = "catalog_category"
@@ -56,6 +68,12 @@ class Category(BaseModel):  # type: ignore
         verbose_name = _("category")
         verbose_name_plural = _("categories")
         ordering = ("sort_order", "name")
+        indexes = [
+            models.Index(
+                OpClass(models.F("path"), name="varchar_pattern_ops"),
+                name="index_category_path",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.name}"
@@ -65,3 +83,52 @@ class Category(BaseModel):  # type: ignore
             viewname="catalog:product-list",
             kwargs={"category_slug": self.slug},
         )
+
+    def get_ancestor_pks(self) -> Tuple[int, ...]:
+        return tuple(int(pk) for pk in self.path.split("/") if pk)
+
+    def clean(self) -> None:
+        super().clean()
+
+        if (
+            self.pk
+            and self.parent_id
+            and self.pk in (self.parent.get_ancestor_pks())
+        ):
+            raise ValidationError(
+                {"parent": _("A category cannot be nested in itself.")}
+            )
+
+    def save(self, **kwargs: Any) -> None:
+        with transaction.atomic():
+            super().save(**kwargs)
+            self.update_path()
+
+    def update_path(self) -> None:
+        previous_path: str = self.path
+        parent_path: Optional[str] = None
+
+        if self.parent_id is not None:
+            parent_path = (
+                Category.objects.filter(pk=self.parent_id)
+                .values_list("path", flat=True)
+                .first()
+            )
+
+        self.path = f"{parent_path or ''}{self.pk}/"
+
+        if self.path == previous_path:
+            return
+
+        Category.objects.filter(pk=self.pk).update(path=self.path)
+
+        if previous_path:
+            Category.objects.filter(path__startswith=previous_path).exclude(
+                pk=self.pk
+            ).update(
+                path=Concat(
+                    models.Value(self.path),
+                    Substr("path", len(previous_path) + 1),
+                    output_field=models.CharField(),
+                )
+            )
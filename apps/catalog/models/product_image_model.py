@@ -2,10 +2,10 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django_resized import ResizedImageField
 
-from apps.core.models import BaseModel
+from apps.core.models import BaseModel, ResponsiveImageModel
 
 
-class ProductImage(BaseModel):  # type: ignore
+class ProductImage(ResponsiveImageModel, BaseModel):  # type: ignore
     product = models.ForeignKey(
         to="Product",
         on_delete=models.CASCADE,
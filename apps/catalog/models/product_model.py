@@ -1,13 +1,16 @@
 from decimal import Decimal
+from typing import Optional
 
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
-from django.db.models.functions import Coalesce, Floor
+from django.db.models.functions import Cast, Coalesce, Floor
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import pgettext_lazy
 
 from apps.catalog.choices import UnitType
+from apps.catalog.models.product_image_model import ProductImage
 from apps.core.models import BaseModel
 
 
@@ -110,6 +113,50 @@ class Product(BaseModel):  # type: ignore
         default=True,
         verbose_name=pgettext_lazy("masculine", "active"),
     )
+    rating_sum = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("rating sum"),
+        help_text=_("Calculated by the system."),
+    )
+    rating_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("rating count"),
+        help_text=_("Calculated by the system."),
+    )
+    rating_average = models.GeneratedField(
+        expression=models.Case(
+            models.When(
+                rating_count=0,
+                then=models.Value(Decimal(value="0.00")),
+            ),
+            default=Cast(
+                models.F("rating_sum"),
+                output_field=models.DecimalField(
+                    max_digits=12, decimal_places=2
+                ),
+            )
+            / models.F("rating_count"),
+            output_field=models.DecimalField(max_digits=3, decimal_places=2),
+        ),
+        output_field=models.DecimalField(max_digits=3, decimal_places=2),
+        db_persist=True,
+        editable=False,
+        verbose_name=_("rating average"),
+        help_text=_("Calculated by the system."),
+    )
+    search_vector = models.GeneratedField(
+        expression=SearchVector("name_ru", config="russian", weight="A")
+        + SearchVector("name_en", config="english", weight="A")
+        + SearchVector("description_ru", config="russian", weight="B")
+        + SearchVector("description_en", config="english", weight="B"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        editable=False,
+        verbose_name=_("search vector"),
+        help_text=_("Calculated by the system."),
+    )
 
     class Meta:
         db_table = "catalog_product"
@@ -120,7 +167,40 @@ class Product(BaseModel):  # type: ignore
         indexes = [
             GinIndex(
                 fields=["attributes"], name="index_product_attributes_gin"
-            )
+            ),
+            GinIndex(
+                fields=["attributes_ru"], name="index_product_attrs_ru_gin"
+            ),
+            GinIndex(
+                fields=["attributes_en"], name="index_product_attrs_en_gin"
+            ),
+            GinIndex(
+                fields=["search_vector"],
+                name="index_product_search_gin",
+            ),
+            GinIndex(
+                OpClass(models.F("name_ru"), name="gin_trgm_ops"),
+                name="index_product_name_ru_trgm",
+            ),
+            GinIndex(
+                OpClass(models.F("name_en"), name="gin_trgm_ops"),
+                name="index_product_name_en_trgm",
+            ),
+            models.Index(
+                fields=["category", "final_price", "id"],
+                name="index_product_category_price",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=["category", "discount", "id"],
+                name="index_product_category_disc",
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=["category", "-created_at", "id"],
+                name="index_product_category_new",
+                condition=models.Q(is_active=True),
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -140,3 +220,9 @@ class Product(BaseModel):  # type: ignore
                 "product_slug": self.slug,
             },
         )
+
+    @property
+    def primary_image(self) -> Optional[ProductImage]:
+        if hasattr(self, "primary_images"):
+            return next(iter(self.primary_images), None)
+        return self.images.first()
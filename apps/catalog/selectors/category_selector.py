@@ -1,7 +1,10 @@
 from typing import List, Optional
 
-from django.db.models import Prefetch, QuerySet
+from django.db.models import QuerySet
+from django.db.models.functions import Length
 
+from apps.catalog.caches import CategoryTreeCache
+from apps.catalog.dataclasses import CategoryNode
 from apps.catalog.models import Category
 
 
@@ -19,35 +22,29 @@ class CategorySelector:
 
     def get_parent_categories(
         self, *, only_active: bool = True
-    ) -> QuerySet[Category]:
-        parent_categories: QuerySet[Category] = self.get_categories(
-            only_active=only_active
-        ).filter(parent__isnull=True)
-        subcategories: QuerySet[Category] = self.get_categories(
-            only_active=only_active
-        )
-
-        return parent_categories.prefetch_related(
-            Prefetch(lookup="subcategories", queryset=subcategories)
+    ) -> List[CategoryNode]:
+        return (
+            CategoryTreeCache().get_tree().get_nodes(only_active=only_active)
         )
 
     def get_category(
         self, *, category_slug: str, only_active: bool = True
     ) -> Optional[Category]:
         return (
-            self.get_categories(only_active=only_active)
-            .filter(slug=category_slug)
-            .first()
+            CategoryTreeCache()
+            .get_tree()
+            .get_category(category_slug=category_slug, only_active=only_active)
         )
 
     def get_hierarchy(self, *, category: Category) -> List[Category]:
-        hierarchy: List[Category] = []
-        ancestor: Optional[Category] = category
-
-        while ancestor is not None:
-            hierarchy.append(ancestor)
-            ancestor = ancestor.parent
-
-        hierarchy.reverse()
+        hierarchy: List[Category] = (
+            CategoryTreeCache()
+            .get_tree()
+            .get_hierarchy(category_pk=category.pk)
+        )
 
-        return hierarchy
+        return hierarchy or list(
+            Category.objects.filter(pk__in=category.get_ancestor_pks())
+            .annotate(path_length=Length("path"))
+            .order_by("path_length")
+        )
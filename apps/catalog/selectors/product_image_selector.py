@@ -7,3 +7,6 @@ class ProductImageSelector:
 
     def get_product_images(self) -> QuerySet[ProductImage]:
         return ProductImage.objects.all()
+
+    def get_primary_product_images(self) -> QuerySet[ProductImage]:
+        return ProductImage.objects.order_by("sort_order", "pk")[:1]
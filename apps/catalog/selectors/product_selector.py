@@ -1,24 +1,78 @@
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from django.contrib.postgres import search
 from django.db.models import (
-    Avg,
+    Case,
     Count,
+    F,
     FloatField,
+    IntegerField,
+    Max,
     Prefetch,
     Q,
     QuerySet,
+    Sum,
     Value,
+    When,
 )
-from django.db.models.functions import Coalesce
+from django.db.models.functions import Cast, Greatest
 
-from apps.catalog.models import Product
+from apps.catalog.caches import CategoryTreeCache
+from apps.catalog.models import Category, Product
 from apps.catalog.selectors import (
     ProductImageSelector,
 )
+from apps.catalog.services import ProductRankingService
+
+PRODUCT_CARD_FIELDS: Tuple[str, ...] = (
+    "name",
+    "slug",
+    "unit_type",
+    "weight_step",
+    "price",
+    "discount",
+    "stock",
+    "final_price",
+    "is_available",
+    "rating_count",
+    "rating_average",
+    "updated_at",
+    "category__slug",
+)
 
 
 class ProductSelector:
 
+    def get_product_cards(
+        self,
+        *,
+        category_slug: Optional[str] = None,
+        only_active: bool = True,
+    ) -> QuerySet[Product]:
+        products: QuerySet[Product] = (
+            Product.objects.select_related("category")
+            .only(*PRODUCT_CARD_FIELDS)
+            .prefetch_related(
+                Prefetch(
+                    lookup="images",
+                    queryset=(
+                        ProductImageSelector().get_primary_product_images()
+                    ),
+                    to_attr="primary_images",
+                ),
+            )
+        )
+
+        if only_active:
+            products = products.filter(is_active=True)
+
+        if category_slug:
+            products = self._filter_by_category(
+                products=products, category_slug=category_slug
+            )
+
+        return products
+
     def get_products(
         self,
         *,
@@ -33,27 +87,85 @@ class ProductSelector:
                     queryset=ProductImageSelector().get_product_images(),
                 ),
             )
-            .annotate(
-                rating_average=Coalesce(
-                    Avg("reviews__rating"),
-                    Value(0.0),
-                    output_field=FloatField(),
-                ),
-                rating_count=Count("reviews"),
-            )
+            .defer("search_vector")
         )
 
         if only_active:
             products = products.filter(is_active=True)
 
         if category_slug:
-            products = products.filter(
-                Q(category__slug=category_slug)
-                | Q(category__parent__slug=category_slug),  # noqa: W503
+            products = self._filter_by_category(
+                products=products, category_slug=category_slug
             )
 
         return products
 
+    def _filter_by_category(
+        self, *, products: QuerySet[Product], category_slug: str
+    ) -> QuerySet[Product]:
+        category: Optional[Category] = (
+            CategoryTreeCache()
+            .get_tree()
+            .get_category(category_slug=category_slug, only_active=False)
+        )
+
+        if category is None:
+            return products.none()
+
+        return products.filter(category__path__startswith=category.path)
+
+    def get_products_state(
+        self,
+        *,
+        category_slug: Optional[str] = None,
+        product_slug: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        products: QuerySet[Product] = self.get_products(
+            category_slug=category_slug
+        )
+
+        if product_slug:
+            products = products.filter(slug=product_slug)
+
+        return products.aggregate(
+            last_modified=Max("updated_at"),
+            products_count=Count("pk"),
+            stock_total=Sum("stock"),
+            rating_sum_total=Sum("rating_sum"),
+            rating_count_total=Sum("rating_count"),
+        )
+
+    def search_products(
+        self, *, products: QuerySet[Product], query: str
+    ) -> QuerySet[Product]:
+        search_query: search.SearchQuery = search.SearchQuery(
+            value=query, config="russian"
+        ) | search.SearchQuery(value=query, config="english")
+
+        return (
+            products.annotate(
+                rank=Cast(
+                    search.SearchRank(
+                        F("search_vector"), search_query, cover_density=True
+                    ),
+                    output_field=FloatField(),
+                ),
+                similarity=Cast(
+                    Greatest(
+                        search.TrigramWordSimilarity(query, "name_ru"),
+                        search.TrigramWordSimilarity(query, "name_en"),
+                    ),
+                    output_field=FloatField(),
+                ),
+            )
+            .filter(
+                Q(search_vector=search_query)
+                | Q(name_ru__trigram_word_similar=query)  # noqa: W503
+                | Q(name_en__trigram_word_similar=query)  # noqa: W503
+            )
+            .order_by("-rank", "-similarity")
+        )
+
     def get_product(
         self, *, product_pk: int, only_active: bool = True
     ) -> Optional[Product]:
@@ -75,17 +187,58 @@ class ProductSelector:
 
         return products.filter(pk=product_pk).first()
 
+    def get_products_for_update(
+        self, *, product_pks: Iterable[int], only_active: bool = True
+    ) -> Dict[int, Product]:
+        products: QuerySet[Product] = Product.objects.select_for_update(
+            of=("self",)
+        )
+
+        if only_active:
+            products = products.filter(is_active=True)
+
+        return {
+            product.pk: product
+            for product in products.filter(pk__in=product_pks).order_by("pk")
+        }
+
+    def get_ranked_products(
+        self, *, product_pks: List[int]
+    ) -> QuerySet[Product]:
+        return (
+            self.get_product_cards()
+            .filter(pk__in=product_pks)
+            .order_by(
+                Case(
+                    *[
+                        When(pk=product_pk, then=Value(position))
+                        for position, product_pk in enumerate(product_pks)
+                    ],
+                    output_field=IntegerField(),
+                )
+            )
+        )
+
     def get_similar_products(
         self, *, product: Product, limit: int = 12
     ) -> QuerySet[Product]:
-        return (
-            self.get_products(category_slug=product.category.slug)
-            .exclude(pk=product.pk)
-            .order_by("?")[:limit]
+        return self.get_ranked_products(
+            product_pks=ProductRankingService()
+            .get_rankings()
+            .get_similar_product_pks(
+                product_pk=product.pk,
+                category_pk=product.category_id,
+                limit=limit,
+                pool_size=limit * 3,
+            )
         )
 
     def get_popular_products(self, *, limit: int = 12) -> QuerySet[Product]:
-        return self.get_products().order_by("?")[:limit]
+        return self.get_ranked_products(
+            product_pks=ProductRankingService()
+            .get_rankings()
+            .get_popular_product_pks(limit=limit, pool_size=limit * 3)
+        )
 
     def get_new_products(self, *, limit: int = 12) -> QuerySet[Product]:
-        return self.get_products().order_by("-created_at")[:limit]
+        return self.get_product_cards().order_by("-created_at")[:limit]
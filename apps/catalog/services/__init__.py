@@ -1,3 +1,11 @@
+from apps.catalog.services.category_service import CategoryService
+from apps.catalog.services.product_ranking_service import (
+    ProductRankingService,
+)
 from apps.catalog.services.product_service import ProductService
 
-__all__ = ["ProductService"]
+__all__ = [
+    "CategoryService",
+    "ProductRankingService",
+    "ProductService",
+]
@@ -0,0 +1,38 @@
+from typing import Dict, List, Optional
+
+from django.db import transaction
+
+from apps.catalog.caches import CategoryTreeCache
+from apps.catalog.models import Category
+
+
+class CategoryService:
+
+    @transaction.atomic
+    def rebuild_paths(self) -> int:
+        categories: List[Category] = list(
+            Category.objects.select_for_update().only("pk", "parent", "path")
+        )
+        parent_pks: Dict[int, Optional[int]] = {
+            category.pk: category.parent_id for category in categories
+        }
+        changed_categories: List[Category] = []
+
+        for category in categories:
+            ancestor_pks: List[int] = []
+            ancestor_pk: Optional[int] = category.pk
+
+            while ancestor_pk is not None and ancestor_pk not in ancestor_pks:
+                ancestor_pks.append(ancestor_pk)
+                ancestor_pk = parent_pks.get(ancestor_pk)
+
+            path: str = "".join(f"{pk}/" for pk in reversed(ancestor_pks))
+
+            if category.path != path:
+                category.path = path
+                changed_categories.append(category)
+
+        Category.objects.bulk_update(changed_categories, fields=["path"])
+        transaction.on_commit(CategoryTreeCache().invalidate)
+
+        return len(changed_categories)
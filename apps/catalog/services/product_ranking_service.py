@@ -0,0 +1,89 @@
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.catalog.caches import ProductRankingCache
+from apps.catalog.dataclasses import ProductRankings
+from apps.catalog.models import Product
+from apps.favorites.models import Favorite
+from apps.orders.choices import OrderStatus
+from apps.orders.models import OrderItem
+
+PRODUCT_RANKING_PERIOD: timedelta = timedelta(days=90)
+PRODUCT_RANKING_POOL_SIZE: int = 60
+PRODUCT_RANKING_ORDER_WEIGHT: int = 3
+PRODUCT_RANKING_FAVORITE_WEIGHT: int = 1
+
+
+class ProductRankingService:
+
+    def rebuild_rankings(self) -> ProductRankings:
+        order_counts: Subquery = Subquery(
+            OrderItem.objects.filter(
+                product=OuterRef("pk"),
+                created_at__gte=timezone.now() - PRODUCT_RANKING_PERIOD,
+            )
+            .exclude(order__order_status=OrderStatus.CANCELLED)
+            .values("product")
+            .annotate(count=Count("order", distinct=True))
+            .values("count"),
+            output_field=IntegerField(),
+        )
+        favorite_counts: Subquery = Subquery(
+            Favorite.objects.filter(product=OuterRef("pk"))
+            .values("product")
+            .annotate(count=Count("pk"))
+            .values("count"),
+            output_field=IntegerField(),
+        )
+        ranked_products: List[Tuple[int, int]] = list(
+            Product.objects.filter(is_active=True)
+            .annotate(
+                popularity=Coalesce(order_counts, 0)
+                * PRODUCT_RANKING_ORDER_WEIGHT
+                + Coalesce(favorite_counts, 0)  # noqa: W503
+                * PRODUCT_RANKING_FAVORITE_WEIGHT
+            )
+            .order_by(
+                F("popularity").desc(),
+                F("rating_average").desc(),
+                F("created_at").desc(),
+            )
+            .values_list("pk", "category_id")
+        )
+        similar_product_pks: Dict[int, List[int]] = {}
+
+        for product_pk, category_pk in ranked_products:
+            category_product_pks: List[int] = similar_product_pks.setdefault(
+                category_pk, []
+            )
+
+            if len(category_product_pks) < PRODUCT_RANKING_POOL_SIZE:
+                category_product_pks.append(product_pk)
+
+        rankings: ProductRankings = ProductRankings(
+            popular_product_pks=tuple(
+                product_pk
+                for product_pk, _ in ranked_products[
+                    :PRODUCT_RANKING_POOL_SIZE
+                ]
+            ),
+            similar_product_pks={
+                category_pk: tuple(product_pks)
+                for category_pk, product_pks in similar_product_pks.items()
+            },
+        )
+        ProductRankingCache().set_rankings(rankings=rankings)
+
+        return rankings
+
+    def get_rankings(self) -> ProductRankings:
+        rankings = ProductRankingCache().get_rankings()
+
+        if rankings is None:
+            rankings = self.rebuild_rankings()
+
+        return rankings
@@ -1,12 +1,67 @@
 from decimal import Decimal
+from typing import Dict, List, Tuple
 
-from django.db.models import F
+from django.db import transaction
+from django.db.models import Case, DecimalField, F, QuerySet, Value, When
 
+from apps.catalog.dataclasses import StockShortage
 from apps.catalog.models import Product
 
 
 class ProductService:
-    def decrease_stock(self, *, product_pk: int, quantity: Decimal) -> None:
+
+    @transaction.atomic
+    def reserve_stock(
+        self, *, quantities: Dict[int, Decimal]
+    ) -> List[StockShortage]:
+        locked_rows: QuerySet[Product, Tuple[int, Decimal, bool]] = (
+            Product.objects.select_for_update()
+            .filter(pk__in=quantities)
+            .order_by("pk")
+            .values_list("pk", "stock", "is_active")
+        )
+        locked_products: Dict[int, Tuple[Decimal, bool]] = {
+            product_pk: (stock, is_active)
+            for product_pk, stock, is_active in locked_rows
+        }
+        shortages: List[StockShortage] = []
+
+        for product_pk, quantity in sorted(quantities.items()):
+            stock, is_active = locked_products.get(
+                product_pk, (Decimal("0.00"), False)
+            )
+
+            if not is_active or stock < quantity:
+                shortages.append(
+                    StockShortage(
+                        product_pk=product_pk,
+                        requested_quantity=quantity,
+                        available_quantity=(
+                            stock if is_active else Decimal("0.00")
+                        ),
+                    )
+                )
+
+        if shortages or not quantities:
+            return shortages
+
+        Product.objects.filter(pk__in=quantities).update(
+            stock=Case(
+                *[
+                    When(pk=product_pk, then=F("stock") - Value(quantity))
+                    for product_pk, quantity in quantities.items()
+                ],
+                default=F("stock"),
+                output_field=DecimalField(max_digits=8, decimal_places=2),
+            )
+        )
+
+        return shortages
+
+    def change_rating(
+        self, *, product_pk: int, rating_delta: int, count_delta: int = 0
+    ) -> None:
         Product.objects.filter(pk=product_pk).update(
-            stock=F("stock") - quantity
+            rating_sum=F("rating_sum") + rating_delta,
+            rating_count=F("rating_count") + count_delta,
         )
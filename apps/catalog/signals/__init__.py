@@ -0,0 +1,27 @@
+from apps.catalog.signals.category_signals import (
+    invalidate_category_page_cache,
+    invalidate_category_tree_cache,
+)
+from apps.catalog.signals.image_variant_signals import (
+    schedule_image_variants,
+)
+from apps.catalog.signals.product_facet_signals import (
+    refresh_product_facets,
+    refresh_product_nutrition_facets,
+    remember_product_category,
+)
+from apps.catalog.signals.product_signals import (
+    invalidate_product_page_cache,
+    invalidate_product_suggestion_cache,
+)
+
+__all__ = [
+    "invalidate_category_page_cache",
+    "invalidate_category_tree_cache",
+    "invalidate_product_page_cache",
+    "invalidate_product_suggestion_cache",
+    "refresh_product_facets",
+    "refresh_product_nutrition_facets",
+    "remember_product_category",
+    "schedule_image_variants",
+]
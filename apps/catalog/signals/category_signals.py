@@ -0,0 +1,21 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.catalog.caches import CategoryTreeCache
+from apps.catalog.models import Category
+from apps.core.caches import PageCache
+
+
+@receiver(signal=post_save, sender=Category)
+@receiver(signal=post_delete, sender=Category)
+def invalidate_category_tree_cache(sender: Any, **kwargs: Any) -> None:
+    transaction.on_commit(CategoryTreeCache().invalidate)
+
+
+@receiver(signal=post_save, sender=Category)
+@receiver(signal=post_delete, sender=Category)
+def invalidate_category_page_cache(sender: Any, **kwargs: Any) -> None:
+    transaction.on_commit(lambda: PageCache().invalidate(tags=["category"]))
@@ -0,0 +1,32 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.catalog.models import Category, ProductImage
+from apps.core.models import ResponsiveImageModel
+from apps.core.tasks import generate_image_variants_task
+
+
+@receiver(signal=post_save, sender=Category)
+@receiver(signal=post_save, sender=ProductImage)
+def schedule_image_variants(
+    sender: Any,
+    instance: ResponsiveImageModel,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    if raw or (
+        (instance.image_variants or {}).get("source")
+        == instance.image_source_name
+    ):
+        return
+
+    model_label: str = instance._meta.label
+    pk: int = instance.pk
+    transaction.on_commit(
+        lambda: generate_image_variants_task.delay(
+            model_label=model_label, pk=pk
+        )
+    )
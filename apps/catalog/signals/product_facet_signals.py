@@ -0,0 +1,70 @@
+from typing import Any, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.catalog.models import Product, ProductNutrition
+from apps.catalog.tasks import refresh_product_facets_task
+
+
+def schedule_product_facets_refresh(
+    *, category_pks: Iterable[Optional[int]]
+) -> None:
+    refreshed_category_pks: List[int] = sorted(
+        {category_pk for category_pk in category_pks if category_pk}
+    )
+
+    if not refreshed_category_pks:
+        return
+
+    transaction.on_commit(
+        lambda: refresh_product_facets_task.delay(
+            category_pks=refreshed_category_pks
+        )
+    )
+
+
+@receiver(signal=pre_save, sender=Product)
+def remember_product_category(
+    sender: Any, instance: Product, raw: bool = False, **kwargs: Any
+) -> None:
+    if raw or instance._state.adding:
+        return
+
+    instance._previous_category_pk = (
+        Product.objects.filter(pk=instance.pk)
+        .values_list("category_id", flat=True)
+        .first()
+    )
+
+
+@receiver(signal=post_save, sender=Product)
+@receiver(signal=post_delete, sender=Product)
+def refresh_product_facets(
+    sender: Any, instance: Product, raw: bool = False, **kwargs: Any
+) -> None:
+    if raw:
+        return
+
+    schedule_product_facets_refresh(
+        category_pks=[
+            instance.category_id,
+            getattr(instance, "_previous_category_pk", None),
+        ]
+    )
+
+
+@receiver(signal=post_save, sender=ProductNutrition)
+@receiver(signal=post_delete, sender=ProductNutrition)
+def refresh_product_nutrition_facets(
+    sender: Any, instance: ProductNutrition, raw: bool = False, **kwargs: Any
+) -> None:
+    if raw:
+        return
+
+    schedule_product_facets_refresh(
+        category_pks=Product.objects.filter(
+            pk=instance.product_id
+        ).values_list("category_id", flat=True)
+    )
@@ -0,0 +1,25 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.catalog.caches import ProductSuggestionCache
+from apps.catalog.models import Category, Product, ProductImage
+from apps.core.caches import PageCache
+
+
+@receiver(signal=post_save, sender=Product)
+@receiver(signal=post_delete, sender=Product)
+@receiver(signal=post_save, sender=Category)
+@receiver(signal=post_delete, sender=Category)
+def invalidate_product_suggestion_cache(sender: Any, **kwargs: Any) -> None:
+    transaction.on_commit(ProductSuggestionCache().invalidate)
+
+
+@receiver(signal=post_save, sender=Product)
+@receiver(signal=post_delete, sender=Product)
+@receiver(signal=post_save, sender=ProductImage)
+@receiver(signal=post_delete, sender=ProductImage)
+def invalidate_product_page_cache(sender: Any, **kwargs: Any) -> None:
+    transaction.on_commit(lambda: PageCache().invalidate(tags=["product"]))
@@ -0,0 +1,11 @@
+from apps.catalog.tasks.rebuild_product_rankings_task import (
+    rebuild_product_rankings_task,
+)
+from apps.catalog.tasks.refresh_product_facets_task import (
+    refresh_product_facets_task,
+)
+
+__all__ = [
+    "rebuild_product_rankings_task",
+    "refresh_product_facets_task",
+]
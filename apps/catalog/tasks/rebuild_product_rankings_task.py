@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from apps.catalog.services import ProductRankingService
+
+
+@shared_task
+def rebuild_product_rankings_task() -> None:
+    ProductRankingService().rebuild_rankings()
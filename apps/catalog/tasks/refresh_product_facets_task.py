@@ -0,0 +1,10 @@
+from typing import List
+
+from celery import shared_task
+
+from apps.catalog.caches import ProductFacetCache
+
+
+@shared_task
+def refresh_product_facets_task(*, category_pks: List[int]) -> None:
+    ProductFacetCache().refresh(category_pks=category_pks)
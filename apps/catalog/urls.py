@@ -15,6 +15,11 @@ urlpatterns: List[URLPattern] = [
         view=views.ProductSearchListView.as_view(),
         name="product-search-list",
     ),
+    path(
+        route="search/suggestions/",
+        view=views.ProductSuggestionListView.as_view(),
+        name="product-suggestion-list",
+    ),
     path(
         route="<slug:category_slug>/",
         view=views.ProductListView.as_view(),
@@ -2,10 +2,14 @@ from apps.catalog.views.category_list_view import CategoryListView
 from apps.catalog.views.product_detail_view import ProductDetailView
 from apps.catalog.views.product_list_view import ProductListView
 from apps.catalog.views.product_search_list_view import ProductSearchListView
+from apps.catalog.views.product_suggestion_list_view import (
+    ProductSuggestionListView,
+)
 
 __all__ = [
     "CategoryListView",
     "ProductSearchListView",
+    "ProductSuggestionListView",
     "ProductListView",
     "ProductDetailView",
 ]
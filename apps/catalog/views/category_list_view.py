@@ -1,14 +1,19 @@
-from django.db.models import QuerySet
+from datetime import datetime
+from typing import Any, List, Optional
+
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import ListView
 
-from apps.catalog.models import Category
+from apps.catalog.caches import CategoryTreeCache
+from apps.catalog.dataclasses import CategoryNode
 from apps.catalog.selectors import CategorySelector
+from apps.core.mixins import AnonymousPageCacheMixin, ConditionalGetMixin
 
 
-class CategoryListView(ListView):
+class CategoryListView(AnonymousPageCacheMixin, ConditionalGetMixin, ListView):
     template_name = "catalog/category_list.html"
+    page_cache_tags = ("category",)
     context_object_name = "parent_categories"
     extra_context = {
         "breadcrumbs": [
@@ -20,5 +25,11 @@ class CategoryListView(ListView):
         ]
     }
 
-    def get_queryset(self) -> QuerySet[Category]:
+    def get_etag_parts(self) -> List[Any]:
+        return [CategoryTreeCache().get_version()]
+
+    def get_last_modified(self) -> Optional[datetime]:
+        return CategoryTreeCache().get_tree().get_last_modified()
+
+    def get_queryset(self) -> List[CategoryNode]:  # type: ignore
         return CategorySelector().get_parent_categories()
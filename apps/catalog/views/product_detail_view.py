@@ -1,20 +1,43 @@
-from typing import Any, Dict, List
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Dict, List, Optional
 
 from django.db.models import QuerySet
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import DetailView
 
+from apps.catalog.caches import CategoryTreeCache
 from apps.catalog.models import Product
 from apps.catalog.selectors import CategorySelector, ProductSelector
+from apps.core.mixins import AnonymousPageCacheMixin, ConditionalGetMixin
 from apps.reviews.selectors import ProductReviewSelector
 
 
-class ProductDetailView(DetailView):
+class ProductDetailView(
+    AnonymousPageCacheMixin, ConditionalGetMixin, DetailView
+):
     template_name = "catalog/product_detail.html"
+    page_cache_tags = ("product", "category", "review")
     context_object_name = "product"
     slug_url_kwarg = "product_slug"
 
+    @cached_property
+    def product_state(self) -> Dict[str, Any]:
+        return ProductSelector().get_products_state(
+            category_slug=self.kwargs["category_slug"],
+            product_slug=self.kwargs["product_slug"],
+        )
+
+    def get_etag_parts(self) -> List[Any]:
+        return [
+            CategoryTreeCache().get_version(),
+            *self.product_state.values(),
+        ]
+
+    def get_last_modified(self) -> Optional[datetime]:
+        return self.product_state["last_modified"]
+
     def get_queryset(self) -> QuerySet[Product]:
         category_slug: str = self.kwargs["category_slug"]
         return ProductSelector().get_products(category_slug=category_slug)
@@ -1,4 +1,6 @@
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Type
 
 from django.db.models import QuerySet
 from django.http import Http404
@@ -6,16 +8,28 @@ from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django_filters.views import FilterView
 
+from apps.catalog.caches import CategoryTreeCache, ProductFacetCache
+from apps.catalog.dataclasses import ProductFacets
 from apps.catalog.filters import ProductFilter
 from apps.catalog.models import Category, Product
 from apps.catalog.selectors import CategorySelector, ProductSelector
+from apps.core.mixins import (
+    AnonymousPageCacheMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+)
 
 
-class ProductListView(FilterView):
+class ProductListView(
+    AnonymousPageCacheMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    FilterView,
+):
     template_name = "catalog/product_list.html"
+    page_cache_tags = ("product", "category", "review")
     context_object_name = "products"
     paginate_by = 20
-    paginate_orphans = 4
     filterset_class = ProductFilter
 
     def get_template_names(self) -> List[str]:
@@ -38,16 +52,44 @@ class ProductListView(FilterView):
 
         return category
 
+    @cached_property
+    def products_state(self) -> Dict[str, Any]:
+        return ProductSelector().get_products_state(
+            category_slug=self.category_slug
+        )
+
+    @cached_property
+    def facets(self) -> ProductFacets:
+        return ProductFacetCache().get_facets(category_pk=self.category.pk)
+
+    def get_etag_parts(self) -> List[Any]:
+        return [
+            CategoryTreeCache().get_version(),
+            self.facets.version,
+            *self.products_state.values(),
+        ]
+
+    def get_last_modified(self) -> Optional[datetime]:
+        return self.products_state["last_modified"]
+
     def get_queryset(self) -> QuerySet[Product]:
         category_slug: Optional[str] = self.category_slug
 
-        return ProductSelector().get_products(
+        return ProductSelector().get_product_cards(
             category_slug=category_slug,
         )
 
+    def get_filterset_kwargs(
+        self, filterset_class: Type[ProductFilter]
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = super().get_filterset_kwargs(filterset_class)
+        kwargs["facets"] = self.facets
+        return kwargs
+
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context: Dict[str, Any] = super().get_context_data(**kwargs)
         context["category"] = self.category
+        context["facet_groups"] = context["filter"].get_facet_groups()
         context["breadcrumbs"] = [
             {"name": _("Home"), "url": reverse_lazy(viewname="pages:home")},
             {
@@ -10,13 +10,13 @@ from django_filters.views import FilterView
 from apps.catalog.filters import ProductSearchFilter
 from apps.catalog.models import Product
 from apps.catalog.selectors import ProductSelector
+from apps.core.mixins import KeysetPaginationMixin
 
 
-class ProductSearchListView(FilterView):
+class ProductSearchListView(KeysetPaginationMixin, FilterView):
     template_name = "catalog/product_search_list.html"
     context_object_name = "products"
     paginate_by = 20
-    paginate_orphans = 4
     filterset_class = ProductSearchFilter
 
     def get_template_names(self) -> List[str]:
@@ -30,7 +30,7 @@ class ProductSearchListView(FilterView):
         return super().get(request, **kwargs)
 
     def get_queryset(self) -> QuerySet[Product]:
-        return ProductSelector().get_products()
+        return ProductSelector().get_product_cards()
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context: Dict[str, Any] = super().get_context_data(**kwargs)
@@ -0,0 +1,32 @@
+from dataclasses import asdict
+from typing import Dict, List
+
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import render
+from django.views import View
+
+from apps.catalog.caches import ProductSuggestionCache
+from apps.catalog.dataclasses import ProductSuggestion
+
+
+class ProductSuggestionListView(View):
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        query: str = request.GET.get(key="q", default="")[:100]
+        suggestions: Dict[str, List[ProductSuggestion]] = (
+            ProductSuggestionCache().get_suggestions(query=query)
+        )
+
+        if request.htmx:  # type: ignore
+            return render(
+                request=request,
+                template_name="catalog/includes/_product_suggestion_list.html",
+                context={"query": query, **suggestions},
+            )
+
+        return JsonResponse(
+            data={
+                kind: [asdict(suggestion) for suggestion in items]
+                for kind, items in suggestions.items()
+            }
+        )
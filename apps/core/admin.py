@@ -0,0 +1 @@
+from apps.core.admins import OutboxEventAdmin  # noqa: F401 isort: skip
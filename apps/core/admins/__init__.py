@@ -1,5 +1,7 @@
 from apps.core.admins.base_model_admin import BaseModelAdmin
+from apps.core.admins.outbox_event_admin import OutboxEventAdmin
 
 __all__ = [
     "BaseModelAdmin",
+    "OutboxEventAdmin",
 ]
@@ -1,26 +1,23 @@
 import json
-from datetime import date, datetime, time, timedelta
+from datetime import date, timedelta
 from decimal import Decimal
 from typing import Any, Dict, List
 
-from django.contrib.auth import get_user_model
-from django.db.models import Avg, Count, DecimalField, Q, Sum, Value
-from django.db.models.functions import Coalesce, TruncDate
+from django.core.cache import cache
+from django.db.models import Sum
 from django.http import HttpRequest
 from django.utils import timezone
+from django.utils.translation import get_language
 from django.utils.translation import gettext as _
 
-from apps.carts.choices import CartStatus
-from apps.carts.models import Cart
 from apps.catalog.models import Product
-from apps.orders.choices import OrderStatus, PaymentStatus
-from apps.orders.models import Order, OrderItem
+from apps.orders.choices import OrderStatus
+from apps.orders.models import DailyProductSalesRollup, DailySalesRollup, Order
+from apps.orders.services import DailySalesRollupService
 
 DASHBOARD_DAYS = 30
-MONEY_OUTPUT_FIELD: DecimalField = DecimalField(
-    max_digits=14,
-    decimal_places=2,
-)
+DASHBOARD_CACHE_KEY = "core:admin-dashboard:{language}"
+DASHBOARD_CACHE_TIMEOUT = 60 * 5
 
 
 def _format_currency(value: Decimal) -> str:
@@ -28,18 +25,6 @@ def _format_currency(value: Decimal) -> str:
     return f"{formatted} ₽"
 
 
-def _period_start(today: date) -> datetime:
-    start_date = today - timedelta(days=DASHBOARD_DAYS - 1)
-    return timezone.make_aware(
-        datetime.combine(start_date, time.min),
-        timezone.get_current_timezone(),
-    )
-
-
-def _empty_money() -> Value:
-    return Value(Decimal("0.00"), output_field=MONEY_OUTPUT_FIELD)
-
-
 def _chart_data(
     *,
     labels: List[str],
@@ -83,110 +68,67 @@ def _daily_series(
 
 def _get_dashboard_data() -> Dict[str, Any]:
     today = timezone.localdate()
-    today_start = timezone.make_aware(
-        datetime.combine(today, time.min),
-        timezone.get_current_timezone(),
-    )
-    period_start = _period_start(today)
+    period_start_day = today - timedelta(days=DASHBOARD_DAYS - 1)
 
-    period_orders = Order.objects.filter(created_at__gte=period_start)
-    paid_filter = Q(payment_status=PaymentStatus.PAID) & ~Q(
-        order_status=OrderStatus.CANCELLED
-    )
+    rollups = {
+        rollup.day: rollup
+        for rollup in DailySalesRollup.objects.filter(
+            day__gte=period_start_day, day__lte=today
+        )
+    }
+    today_rollup = rollups.get(today, DailySalesRollup(day=today))
 
-    period_summary = period_orders.aggregate(
-        orders=Count("id"),
-        revenue=Coalesce(
-            Sum("total_price", filter=paid_filter),
-            _empty_money(),
-            output_field=MONEY_OUTPUT_FIELD,
+    period_summary = {
+        "orders": sum(rollup.orders_count for rollup in rollups.values()),
+        "paid_orders": sum(
+            rollup.paid_orders_count for rollup in rollups.values()
         ),
-        average_order=Coalesce(
-            Avg("total_price", filter=paid_filter),
-            _empty_money(),
-            output_field=MONEY_OUTPUT_FIELD,
+        "revenue": sum(
+            (rollup.revenue for rollup in rollups.values()), Decimal("0.00")
         ),
-        cancelled=Count(
-            "id",
-            filter=Q(order_status=OrderStatus.CANCELLED),
+        "cancelled": sum(
+            rollup.cancelled_orders_count for rollup in rollups.values()
         ),
-    )
-    today_summary = Order.objects.filter(
-        created_at__gte=today_start
-    ).aggregate(
-        orders=Count("id"),
-        revenue=Coalesce(
-            Sum("total_price", filter=paid_filter),
-            _empty_money(),
-            output_field=MONEY_OUTPUT_FIELD,
+        "new_users": sum(
+            rollup.new_users_count for rollup in rollups.values()
         ),
+    }
+    period_summary["average_order"] = (
+        (period_summary["revenue"] / period_summary["paid_orders"]).quantize(
+            Decimal("0.01")
+        )
+        if period_summary["paid_orders"]
+        else Decimal("0.00")
     )
 
-    carts_summary = Cart.objects.filter(
-        created_at__gte=period_start
-    ).aggregate(
-        total=Count("id"),
-        converted=Count(
-            "id",
-            filter=Q(cart_status=CartStatus.CONVERTED),
+    carts_summary = {
+        "total": sum(rollup.carts_count for rollup in rollups.values()),
+        "converted": sum(
+            rollup.converted_carts_count for rollup in rollups.values()
         ),
-        active=Count(
-            "id",
-            filter=Q(cart_status=CartStatus.ACTIVE),
+        "active": sum(
+            rollup.active_carts_count for rollup in rollups.values()
         ),
-    )
+    }
     conversion = (
         round(carts_summary["converted"] / carts_summary["total"] * 100, 1)
         if carts_summary["total"]
         else 0
     )
 
-    daily_orders = {
-        row["day"]: row["total"]
-        for row in period_orders.annotate(
-            day=TruncDate(
-                "created_at",
-                tzinfo=timezone.get_current_timezone(),
-            )
-        )
-        .values("day")
-        .annotate(total=Count("id"))
-        .order_by("day")
-    }
-    daily_revenue = {
-        row["day"]: row["total"]
-        for row in period_orders.filter(paid_filter)
-        .annotate(
-            day=TruncDate(
-                "created_at",
-                tzinfo=timezone.get_current_timezone(),
-            )
-        )
-        .values("day")
-        .annotate(
-            total=Coalesce(
-                Sum("total_price"),
-                _empty_money(),
-                output_field=MONEY_OUTPUT_FIELD,
-            )
-        )
-        .order_by("day")
-    }
     chart_labels, order_values = _daily_series(
         today=today,
-        rows=daily_orders,
+        rows={day: rollup.orders_count for day, rollup in rollups.items()},
     )
     revenue_labels, revenue_values = _daily_series(
         today=today,
-        rows=daily_revenue,
+        rows={day: rollup.revenue for day, rollup in rollups.items()},
     )
 
-    status_counts = {
-        row["order_status"]: row["total"]
-        for row in period_orders.values("order_status").annotate(
-            total=Count("id")
-        )
-    }
+    status_counts: Dict[str, int] = {}
+    for rollup in rollups.values():
+        for status, count in rollup.order_status_counts.items():
+            status_counts[status] = status_counts.get(status, 0) + count
     total_orders = period_summary["orders"]
     status_rows = []
     for status, label in OrderStatus.choices:
@@ -195,23 +137,21 @@ def _get_dashboard_data() -> Dict[str, Any]:
         status_rows.append([str(label), count, f"{share}%"])
 
     top_products = (
-        OrderItem.objects.filter(
-            order__created_at__gte=period_start,
-            order__payment_status=PaymentStatus.PAID,
+        DailyProductSalesRollup.objects.filter(
+            day__gte=period_start_day, day__lte=today
         )
-        .exclude(order__order_status=OrderStatus.CANCELLED)
-        .values("product_name_snapshot")
+        .values("product_name")
         .annotate(
             sold_quantity=Sum("quantity"),
-            revenue=Sum("total_price"),
+            total_revenue=Sum("revenue"),
         )
-        .order_by("-revenue")[:5]
+        .order_by("-total_revenue")[:5]
     )
     top_product_rows = [
         [
-            row["product_name_snapshot"],
+            row["product_name"],
             row["sold_quantity"],
-            _format_currency(row["revenue"]),
+            _format_currency(row["total_revenue"]),
         ]
         for row in top_products
     ]
@@ -244,9 +184,9 @@ def _get_dashboard_data() -> Dict[str, Any]:
     metrics = [
         {
             "title": _("Revenue today"),
-            "value": _format_currency(today_summary["revenue"]),
+            "value": _format_currency(today_rollup.revenue),
             "description": _("%(count)s orders")
-            % {"count": today_summary["orders"]},
+            % {"count": today_rollup.orders_count},
             "icon": "payments",
         },
         {
@@ -264,9 +204,7 @@ def _get_dashboard_data() -> Dict[str, Any]:
         },
         {
             "title": _("New users"),
-            "value": get_user_model()
-            .objects.filter(date_joined__gte=period_start)
-            .count(),
+            "value": period_summary["new_users"],
             "description": _("For the last 30 days"),
             "icon": "person_add",
         },
@@ -326,6 +264,22 @@ def _get_dashboard_data() -> Dict[str, Any]:
     }
 
 
+def _get_cached_dashboard_data(*, refresh: bool = False) -> Dict[str, Any]:
+    cache_key = DASHBOARD_CACHE_KEY.format(language=get_language())
+
+    if refresh:
+        DailySalesRollupService().rebuild_recent_rollups(days=2)
+    else:
+        dashboard = cache.get(cache_key)
+        if dashboard is not None:
+            return dashboard
+
+    dashboard = _get_dashboard_data()
+    dashboard["generated_at"] = timezone.localtime().strftime("%d.%m.%Y %H:%M")
+    cache.set(cache_key, dashboard, timeout=DASHBOARD_CACHE_TIMEOUT)
+    return dashboard
+
+
 def dashboard_callback(
     request: HttpRequest,
     context: Dict[str, Any],
@@ -334,5 +288,7 @@ def dashboard_callback(
         context["dashboard"] = None
         return context
 
-    context["dashboard"] = _get_dashboard_data()
+    context["dashboard"] = _get_cached_dashboard_data(
+        refresh="refresh" in request.GET
+    )
     return context
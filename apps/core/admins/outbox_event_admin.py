@@ -0,0 +1,37 @@
+from django.contrib import admin
+from django.http import HttpRequest
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.admins.base_model_admin import BaseModelAdmin
+from apps.core.models import OutboxEvent
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(BaseModelAdmin):
+    list_display = (
+        "event_type",
+        "status",
+        "attempts",
+        "available_at",
+        "processed_at",
+        "created_at",
+    )
+    list_filter = ("status", "event_type")
+    fields = (
+        "event_type",
+        "payload",
+        "status",
+        "attempts",
+        "available_at",
+        "processed_at",
+        "last_error",
+        "created_at",
+        "updated_at",
+    )
+    readonly_fields = fields
+    search_fields = ("event_type",)
+    search_help_text = _("Search by event type")
+    date_hierarchy = "created_at"
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
@@ -0,0 +1,7 @@
+from apps.core.caches.page_cache import PageCache
+from apps.core.caches.user_version_cache import UserVersionCache
+
+__all__ = [
+    "PageCache",
+    "UserVersionCache",
+]
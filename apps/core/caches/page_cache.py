@@ -0,0 +1,96 @@
+import hashlib
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.middleware.csrf import get_token
+from django.utils import translation
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+PAGE_CACHE_KEY: str = "core:page-cache:{digest}"
+PAGE_CACHE_TAG_KEY: str = "core:page-cache:tag:{tag}"
+PAGE_CACHE_CSRF_PLACEHOLDER: str = "__page_cache_csrf_token__"
+
+
+class PageCache:
+
+    def get_key(self, *, request: HttpRequest, tags: Iterable[str]) -> str:
+        tag_keys: List[str] = [
+            PAGE_CACHE_TAG_KEY.format(tag=tag) for tag in sorted(tags)
+        ]
+        tag_versions: Dict[str, Any] = cache.get_many(tag_keys)
+        parts: List[str] = [
+            request.method or "GET",
+            request.get_full_path(),
+            translation.get_language() or "",
+            request.headers.get("HX-Request", ""),
+            request.headers.get("HX-Target", ""),
+            *[f"{key}={tag_versions.get(key, 0)}" for key in tag_keys],
+        ]
+        digest: str = hashlib.md5(
+            "\n".join(parts).encode(), usedforsecurity=False
+        ).hexdigest()
+
+        return PAGE_CACHE_KEY.format(digest=digest)
+
+    def get_response(
+        self, *, request: HttpRequest, key: str
+    ) -> Optional[HttpResponse]:
+        cached_page: Optional[Dict[str, Any]] = cache.get(key)
+
+        if cached_page is None:
+            return None
+
+        response: HttpResponse = HttpResponse(
+            content=cached_page["content"].replace(
+                PAGE_CACHE_CSRF_PLACEHOLDER.encode(),
+                get_token(request).encode(),
+            ),
+            status=cached_page["status"],
+        )
+
+        for header, value in cached_page["headers"].items():
+            response.headers[header] = value
+
+        return (
+            get_conditional_response(
+                request,
+                etag=response.headers.get("ETag"),
+                last_modified=parse_http_date_safe(
+                    response.headers.get("Last-Modified")
+                ),
+                response=response,
+            )
+            or response  # noqa: W503
+        )
+
+    def set_response(
+        self,
+        *,
+        key: str,
+        response: HttpResponse,
+        csrf_token: str,
+        timeout: int,
+    ) -> None:
+        cache.set(
+            key,
+            {
+                "content": response.content.replace(
+                    csrf_token.encode(), PAGE_CACHE_CSRF_PLACEHOLDER.encode()
+                ),
+                "status": response.status_code,
+                "headers": dict(response.headers),
+            },
+            timeout=timeout,
+        )
+
+    def invalidate(self, *, tags: Iterable[str]) -> None:
+        cache.set_many(
+            {
+                PAGE_CACHE_TAG_KEY.format(tag=tag): time.time_ns()
+                for tag in tags
+            },
+            timeout=None,
+        )
@@ -0,0 +1,29 @@
+import time
+from typing import Any, Optional
+
+from django.core.cache import cache
+
+USER_VERSION_KEY: str = "core:user-version:{user_pk}"
+
+
+class UserVersionCache:
+
+    def get_version(self, *, user: Any) -> str:
+        if not user.is_authenticated:
+            return "anonymous"
+
+        version_key: str = USER_VERSION_KEY.format(user_pk=user.pk)
+        version: Optional[int] = cache.get(version_key)
+
+        if version is None:
+            cache.add(version_key, time.time_ns(), timeout=None)
+            version = cache.get(version_key)
+
+        return f"{user.pk}:{version}"
+
+    def invalidate(self, *, user_pk: int) -> None:
+        cache.set(
+            USER_VERSION_KEY.format(user_pk=user_pk),
+            time.time_ns(),
+            timeout=None,
+        )
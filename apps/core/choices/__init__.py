@@ -0,0 +1,5 @@
+from apps.core.choices.outbox_event_status_choices import OutboxEventStatus
+
+__all__ = [
+    "OutboxEventStatus",
+]
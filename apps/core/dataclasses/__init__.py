@@ -1,5 +1,17 @@
 from apps.core.dataclasses.email_template_dataclass import EmailTemplate
+from apps.core.dataclasses.query_budget_dataclass import (
+    QueryBudget,
+    QueryBudgetReport,
+)
+from apps.core.dataclasses.synthetic_dataset_dataclass import (
+    SyntheticDatasetReport,
+    SyntheticDatasetSpec,
+)
 
 __all__ = [
     "EmailTemplate",
+    "QueryBudget",
+    "QueryBudgetReport",
+    "SyntheticDatasetReport",
+    "SyntheticDatasetSpec",
 ]
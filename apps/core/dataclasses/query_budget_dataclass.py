@@ -0,0 +1,58 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    name: str
+    url_name: str
+    max_queries: int
+    max_query_time_ms: float = 200.0
+    max_duplicates: int = 0
+
+
+@dataclass(frozen=True)
+class QueryBudgetReport:
+    budget: QueryBudget
+    path: str
+    status_code: int
+    queries: List[Dict[str, str]] = field(default_factory=list)
+
+    @property
+    def query_count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def query_time_ms(self) -> float:
+        return sum(float(query["time"]) for query in self.queries) * 1000
+
+    @property
+    def duplicates(self) -> List[Tuple[str, int]]:
+        return [
+            (sql, count)
+            for sql, count in Counter(
+                query["sql"] for query in self.queries
+            ).most_common()
+            if count > 1
+        ]
+
+    @property
+    def violations(self) -> List[str]:
+        violations: List[str] = []
+
+        if self.status_code >= 400:
+            violations.append(f"status {self.status_code}")
+        if self.query_count > self.budget.max_queries:
+            violations.append(
+                f"{self.query_count} queries > {self.budget.max_queries}"
+            )
+        if self.query_time_ms > self.budget.max_query_time_ms:
+            violations.append(
+                f"{self.query_time_ms:.1f} ms > "
+                f"{self.budget.max_query_time_ms:.1f} ms"
+            )
+        if len(self.duplicates) > self.budget.max_duplicates:
+            violations.append(f"{len(self.duplicates)} duplicate statements")
+
+        return violations
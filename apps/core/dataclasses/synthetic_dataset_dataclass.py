@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class SyntheticDatasetSpec:
+    products: int
+    users: int
+    orders: int
+    order_items: int
+    reviews: int
+    active_carts: int
+    days: int = 365
+    seed: int = 0
+
+    @property
+    def order_size(self) -> int:
+        if not self.orders:
+            return 0
+
+        return max(1, round(self.order_items / self.orders))
+
+
+@dataclass(frozen=True)
+class SyntheticDatasetReport:
+    spec: SyntheticDatasetSpec
+    first_pks: Dict[str, int] = field(default_factory=dict)
+    row_counts: Dict[str, int] = field(default_factory=dict)
@@ -0,0 +1,6 @@
+class InvalidCursorError(Exception):
+    pass
+
+
+class SyntheticDatasetError(Exception):
+    pass
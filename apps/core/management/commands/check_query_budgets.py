@@ -0,0 +1,170 @@
+from typing import Any, Dict, List, Optional
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.db import transaction
+from django.db.models import QuerySet
+from django.test import Client
+from django.test.utils import (
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from apps.accounts.models import User
+from apps.carts.choices import CartStatus
+from apps.catalog.models import Product
+from apps.core.dataclasses import QueryBudget, QueryBudgetReport
+from apps.core.query_budgets import QUERY_BUDGETS
+from apps.core.services import QueryBudgetService
+from apps.orders.models import Order
+
+QUERY_BUDGET_SQL_PREVIEW: int = 160
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the main views against the seeded database and fail when a "
+        "view exceeds its query budget or repeats a statement."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--email",
+            help="Render the views as this user (a user with orders by "
+            "default).",
+        )
+        parser.add_argument(
+            "--budget",
+            action="append",
+            default=[],
+            dest="budget_names",
+            help="Check only the given budget (can be repeated).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        user: User = self._get_user(email=options["email"])
+        budgets: List[QueryBudget] = [
+            budget
+            for budget in QUERY_BUDGETS
+            if not options["budget_names"]
+            or budget.name in options["budget_names"]  # noqa: W503
+        ]
+
+        setup_test_environment()
+
+        try:
+            with transaction.atomic():
+                reports: List[QueryBudgetReport] = self._measure(
+                    user=user, budgets=budgets
+                )
+                transaction.set_rollback(True)
+        finally:
+            teardown_test_environment()
+
+        self._write_report(reports=reports)
+
+        failed_reports: List[QueryBudgetReport] = [
+            report for report in reports if report.violations
+        ]
+
+        if failed_reports:
+            raise CommandError(
+                f"{len(failed_reports)} of {len(reports)} views exceeded "
+                "their query budget."
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"All {len(reports)} views are within budget.")
+        )
+
+    def _get_user(self, *, email: Optional[str]) -> User:
+        users: QuerySet[User] = User.objects.filter(is_active=True)
+        user: Optional[User] = (
+            users.filter(email=email).first()
+            if email
+            else users.filter(
+                orders__isnull=False, carts__cart_status=CartStatus.ACTIVE
+            ).first()
+        )
+
+        if user is None:
+            raise CommandError(
+                "No user to render the views with. Load the demo fixtures "
+                "or pass --email."
+            )
+
+        return user
+
+    def _get_url_kwargs(self, *, user: User) -> Dict[str, Dict[str, Any]]:
+        product: Optional[Product] = (
+            Product.objects.filter(is_active=True, category__is_active=True)
+            .select_related("category")
+            .first()
+        )
+        order: Optional[Order] = Order.objects.filter(user=user).first()
+
+        if product is None or order is None:
+            raise CommandError(
+                "The database has no active product or order to render."
+            )
+
+        return {
+            "catalog:product-list": {"category_slug": product.category.slug},
+            "catalog:product-detail": {
+                "category_slug": product.category.slug,
+                "product_slug": product.slug,
+            },
+            "orders:detail": {"order_number": order.number},
+        }
+
+    def _measure(
+        self, *, user: User, budgets: List[QueryBudget]
+    ) -> List[QueryBudgetReport]:
+        client: Client = Client()
+        client.force_login(user)
+        url_kwargs: Dict[str, Dict[str, Any]] = self._get_url_kwargs(user=user)
+
+        return [
+            QueryBudgetService().measure(
+                client=client,
+                budget=budget,
+                url_kwargs=url_kwargs.get(budget.url_name),
+            )
+            for budget in budgets
+        ]
+
+    def _write_report(self, *, reports: List[QueryBudgetReport]) -> None:
+        self.stdout.write(
+            f"{'view':<16} {'status':>6} {'queries':>9} {'time, ms':>15} "
+            f"{'dupes':>5}  path"
+        )
+
+        for report in reports:
+            line: str = (
+                f"{report.budget.name:<16} {report.status_code:>6} "
+                f"{report.query_count:>4}/{report.budget.max_queries:<4} "
+                f"{report.query_time_ms:>7.1f}/"
+                f"{report.budget.max_query_time_ms:<7.1f} "
+                f"{len(report.duplicates):>5}  {report.path}"
+            )
+            self.stdout.write(
+                self.style.ERROR(line) if report.violations else line
+            )
+
+        for report in reports:
+            if not report.violations:
+                continue
+
+            self.stdout.write(
+                self.style.ERROR(
+                    f"\n{report.budget.name}: {', '.join(report.violations)}"
+                )
+            )
+
+            for sql, count in report.duplicates:
+                self.stdout.write(
+                    f"  {count}x {sql[:QUERY_BUDGET_SQL_PREVIEW]}"
+                )
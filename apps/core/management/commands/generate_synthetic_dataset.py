@@ -0,0 +1,159 @@
+import time
+from typing import Any, Tuple
+
+from django.core.management import call_command
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.db import models
+
+from apps.accounts.models import User
+from apps.carts.choices import CartStatus
+from apps.carts.models import Cart, CartItem
+from apps.carts.services import CartService
+from apps.catalog.caches import ProductFacetCache, ProductSuggestionCache
+from apps.catalog.models import Category, Product, ProductNutrition
+from apps.catalog.services import ProductRankingService
+from apps.core.caches import PageCache
+from apps.core.dataclasses import SyntheticDatasetReport, SyntheticDatasetSpec
+from apps.core.exceptions import SyntheticDatasetError
+from apps.core.services import CopyService, SyntheticDatasetService
+from apps.orders.models import Order, OrderItem
+from apps.orders.services import OrderService
+from apps.reviews.models import ProductReview
+
+SYNTHETIC_DATASET_MODELS: Tuple[type[models.Model], ...] = (
+    Product,
+    ProductNutrition,
+    User,
+    Cart,
+    CartItem,
+    Order,
+    OrderItem,
+    ProductReview,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a production-scale synthetic dataset on top of the loaded "
+        "fixtures and stream it into PostgreSQL with COPY."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=100_000,
+            help="Number of products (100 000 by default).",
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=1_000_000,
+            help="Number of users (1 000 000 by default).",
+        )
+        parser.add_argument(
+            "--orders",
+            type=int,
+            default=2_000_000,
+            help="Number of orders (2 000 000 by default).",
+        )
+        parser.add_argument(
+            "--order-items",
+            type=int,
+            default=10_000_000,
+            help="Approximate number of order items (10 000 000 by default).",
+        )
+        parser.add_argument(
+            "--reviews",
+            type=int,
+            default=2_000_000,
+            help="Approximate number of reviews (2 000 000 by default).",
+        )
+        parser.add_argument(
+            "--active-carts",
+            type=int,
+            default=100_000,
+            help="Number of users with an active cart (100 000 by default).",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Spread the history over this many days (365 by default).",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed for a reproducible dataset (0 by default).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        started_at: float = time.monotonic()
+        spec: SyntheticDatasetSpec = SyntheticDatasetSpec(
+            products=options["products"],
+            users=options["users"],
+            orders=options["orders"],
+            order_items=options["order_items"],
+            reviews=options["reviews"],
+            active_carts=options["active_carts"],
+            days=options["days"],
+            seed=options["seed"],
+        )
+
+        try:
+            report: SyntheticDatasetReport = SyntheticDatasetService(
+                spec=spec
+            ).generate()
+        except SyntheticDatasetError as error:
+            raise CommandError(str(error)) from error
+
+        for label, row_count in report.row_counts.items():
+            self.stdout.write(f"{label:<24} {row_count:>12,} rows copied")
+
+        self._rebuild_aggregates(report=report, verbosity=options["verbosity"])
+        self._refresh_caches()
+        CopyService().analyze(model_classes=SYNTHETIC_DATASET_MODELS)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Synthetic dataset generated in "
+                f"{time.monotonic() - started_at:.0f} s."
+            )
+        )
+
+    def _rebuild_aggregates(
+        self, *, report: SyntheticDatasetReport, verbosity: int
+    ) -> None:
+        OrderService().recompute_total_prices(
+            orders=Order.objects.filter(
+                pk__gte=report.first_pks[Order._meta.label_lower]
+            )
+        )
+        CartService().refresh_cart_summaries(
+            carts=Cart.objects.filter(
+                pk__gte=report.first_pks[Cart._meta.label_lower],
+                cart_status=CartStatus.ACTIVE,
+            )
+        )
+        call_command(
+            "rebuild_product_ratings",
+            verbosity=verbosity,
+        )
+        call_command(
+            "rebuild_daily_sales_rollups",
+            days=report.spec.days,
+            verbosity=verbosity,
+        )
+
+    def _refresh_caches(self) -> None:
+        ProductSuggestionCache().invalidate()
+        ProductFacetCache().refresh(
+            category_pks=Category.objects.values_list("pk", flat=True)
+        )
+        ProductRankingService().rebuild_rankings()
+        PageCache().invalidate(tags=["category", "product", "review"])
@@ -39,6 +39,22 @@ class Command(BaseCommand):
             *FIXTURE_PATHS,
             verbosity=options["verbosity"],
         )
+        call_command(
+            "rebuild_category_paths",
+            verbosity=options["verbosity"],
+        )
+        call_command(
+            "rebuild_product_ratings",
+            verbosity=options["verbosity"],
+        )
+        call_command(
+            "rebuild_daily_sales_rollups",
+            verbosity=options["verbosity"],
+        )
+        call_command(
+            "generate_image_variants",
+            verbosity=options["verbosity"],
+        )
 
         self.stdout.write(
             self.style.SUCCESS("All fixtures loaded successfully.")
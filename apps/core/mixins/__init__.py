@@ -1,5 +1,13 @@
+from apps.core.mixins.anonymous_page_cache_mixin import (
+    AnonymousPageCacheMixin,
+)
+from apps.core.mixins.conditional_get_mixin import ConditionalGetMixin
 from apps.core.mixins.htmx_login_required_mixin import HtmxLoginRequiredMixin
+from apps.core.mixins.keyset_pagination_mixin import KeysetPaginationMixin
 
 __all__ = [
+    "AnonymousPageCacheMixin",
+    "ConditionalGetMixin",
     "HtmxLoginRequiredMixin",
+    "KeysetPaginationMixin",
 ]
@@ -0,0 +1,61 @@
+from typing import Any, Optional, Tuple
+
+from django.contrib.messages import get_messages
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.middleware.csrf import get_token
+
+from apps.core.caches import PageCache
+
+
+class AnonymousPageCacheMixin:
+    page_cache_tags: Tuple[str, ...] = ()
+    page_cache_timeout: int = 60 * 5
+
+    def is_page_cacheable(self, request: HttpRequest) -> bool:
+        return (
+            request.method in ("GET", "HEAD")
+            and not request.user.is_authenticated  # noqa: W503
+            and not len(get_messages(request))  # noqa: W503
+        )
+
+    def dispatch(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponseBase:
+        if not self.is_page_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)  # type: ignore
+
+        page_cache: PageCache = PageCache()
+        key: str = page_cache.get_key(
+            request=request, tags=self.page_cache_tags
+        )
+        cached_response: Optional[HttpResponse] = page_cache.get_response(
+            request=request, key=key
+        )
+
+        if cached_response is not None:
+            return cached_response
+
+        response: HttpResponseBase = super().dispatch(  # type: ignore
+            request, *args, **kwargs
+        )
+
+        if response.status_code != 200 or response.cookies:
+            return response
+
+        csrf_token: str = get_token(request)
+
+        if hasattr(response, "render"):
+            response.context_data = {  # type: ignore
+                **(response.context_data or {}),  # type: ignore
+                "csrf_token": csrf_token,
+            }
+            response.render()
+
+        page_cache.set_response(
+            key=key,
+            response=response,  # type: ignore
+            csrf_token=csrf_token,
+            timeout=self.page_cache_timeout,
+        )
+
+        return response
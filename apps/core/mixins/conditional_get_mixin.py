@@ -0,0 +1,71 @@
+import hashlib
+from datetime import datetime
+from typing import Any, List, Optional
+
+from django.contrib.messages import get_messages
+from django.http import HttpRequest, HttpResponseBase
+from django.utils import translation
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from apps.core.caches import UserVersionCache
+
+
+class ConditionalGetMixin:
+
+    def get_etag_parts(self) -> List[Any]:
+        return []
+
+    def get_last_modified(self) -> Optional[datetime]:
+        return None
+
+    def get_etag(self, request: HttpRequest) -> str:
+        parts: List[Any] = [
+            request.get_full_path(),
+            translation.get_language(),
+            request.headers.get("HX-Request", ""),
+            request.headers.get("HX-Target", ""),
+            UserVersionCache().get_version(user=request.user),
+            *self.get_etag_parts(),
+        ]
+        digest: str = hashlib.md5(
+            "\n".join(map(str, parts)).encode(), usedforsecurity=False
+        ).hexdigest()
+
+        return f'W/"{digest}"'
+
+    def dispatch(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponseBase:
+        if request.method not in ("GET", "HEAD") or len(get_messages(request)):
+            return super().dispatch(request, *args, **kwargs)  # type: ignore
+
+        etag: str = self.get_etag(request)
+        last_modified: Optional[datetime] = self.get_last_modified()
+        last_modified_timestamp: Optional[int] = (
+            int(last_modified.timestamp()) if last_modified else None
+        )
+        conditional_response: Optional[HttpResponseBase] = (
+            get_conditional_response(
+                request, etag=etag, last_modified=last_modified_timestamp
+            )
+        )
+
+        if conditional_response is not None:
+            return conditional_response
+
+        response: HttpResponseBase = super().dispatch(  # type: ignore
+            request, *args, **kwargs
+        )
+
+        if response.status_code == 200:
+            response.headers["ETag"] = etag
+
+            if last_modified_timestamp is not None:
+                response.headers["Last-Modified"] = http_date(
+                    last_modified_timestamp
+                )
+
+            patch_cache_control(response, private=True, no_cache=True)
+
+        return response
@@ -0,0 +1,27 @@
+from typing import Any, List, Tuple
+
+from django.db.models import QuerySet
+from django.http import Http404
+
+from apps.core.exceptions import InvalidCursorError
+from apps.core.paginators import KeysetPage, KeysetPaginator
+
+
+class KeysetPaginationMixin:
+    cursor_kwarg: str = "cursor"
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Any], page_size: int
+    ) -> Tuple[KeysetPaginator, KeysetPage, List[Any], bool]:
+        paginator: KeysetPaginator = KeysetPaginator(
+            queryset=queryset, per_page=page_size
+        )
+
+        try:
+            page: KeysetPage = paginator.get_page(
+                cursor=self.request.GET.get(self.cursor_kwarg)  # type: ignore
+            )
+        except InvalidCursorError as exc:
+            raise Http404 from exc
+
+        return paginator, page, page.object_list, page.has_next()
@@ -1,5 +1,9 @@
 from apps.core.models.base_model import BaseModel
+from apps.core.models.outbox_event_model import OutboxEvent
+from apps.core.models.responsive_image_model import ResponsiveImageModel
 
 __all__ = [
     "BaseModel",
+    "OutboxEvent",
+    "ResponsiveImageModel",
 ]
@@ -0,0 +1,59 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.choices import OutboxEventStatus
+from apps.core.models.base_model import BaseModel
+
+
+class OutboxEvent(BaseModel):  # type: ignore
+    event_type = models.CharField(
+        max_length=100,
+        verbose_name=_("event type"),
+    )
+    payload = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name=_("payload"),
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=OutboxEventStatus.choices,
+        default=OutboxEventStatus.PENDING,
+        verbose_name=_("status"),
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name=_("attempts"),
+    )
+    available_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("available at"),
+    )
+    processed_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name=_("processed at"),
+    )
+    last_error = models.TextField(
+        blank=True,
+        default="",
+        verbose_name=_("last error"),
+    )
+
+    class Meta:
+        db_table = "core_outbox_event"
+        db_table_comment = "Table containing outbox events."
+        verbose_name = _("outbox event")
+        verbose_name_plural = _("outbox events")
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["available_at", "id"],
+                name="index_outbox_event_pending",
+                condition=models.Q(status=OutboxEventStatus.PENDING),
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_type} #{self.pk} ({self.status})"
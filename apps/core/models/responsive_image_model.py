@@ -0,0 +1,42 @@
+from typing import Any, Dict, List, Optional
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class ResponsiveImageModel(models.Model):
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name=_("image variants"),
+    )
+
+    class Meta:
+        abstract = True
+
+    @property
+    def image_source_name(self) -> Optional[str]:
+        image: Any = self.image  # type: ignore[attr-defined]
+        return image.name if image else None
+
+    def get_image_srcset(self, *, image_format: str) -> str:
+        variants: Dict[str, Any] = self.image_variants or {}
+
+        if variants.get("source") != self.image_source_name:
+            return ""
+
+        image_variants: List[List[Any]] = variants.get(image_format, [])
+        storage: Any = self.image.storage  # type: ignore[attr-defined]
+
+        return ", ".join(
+            f"{storage.url(name)} {width}w" for width, name in image_variants
+        )
+
+    @property
+    def avif_srcset(self) -> str:
+        return self.get_image_srcset(image_format="avif")
+
+    @property
+    def webp_srcset(self) -> str:
+        return self.get_image_srcset(image_format="webp")
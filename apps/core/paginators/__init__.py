@@ -0,0 +1,6 @@
+from apps.core.paginators.keyset_paginator import KeysetPage, KeysetPaginator
+
+__all__ = [
+    "KeysetPage",
+    "KeysetPaginator",
+]
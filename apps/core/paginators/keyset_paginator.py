@@ -0,0 +1,168 @@
+import base64
+import json
+from functools import cached_property
+from typing import Any, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import (
+    F,
+    Field,
+    GeneratedField,
+    Model,
+    OrderBy,
+    Q,
+    QuerySet,
+)
+
+from apps.core.exceptions import InvalidCursorError
+
+
+class KeysetPage:
+
+    def __init__(
+        self,
+        *,
+        object_list: List[Model],
+        paginator: "KeysetPaginator",
+        next_cursor: Optional[str],
+    ) -> None:
+        self.object_list: List[Model] = object_list
+        self.paginator: KeysetPaginator = paginator
+        self.next_cursor: Optional[str] = next_cursor
+
+    def __iter__(self) -> Any:
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+class KeysetPaginator:
+
+    def __init__(self, *, queryset: QuerySet[Any], per_page: int) -> None:
+        self.queryset: QuerySet[Any] = queryset
+        self.per_page: int = per_page
+        self.ordering: List[Tuple[str, bool]] = self.get_ordering()
+
+    @cached_property
+    def count(self) -> int:
+        return self.queryset.order_by().count()
+
+    def get_ordering(self) -> List[Tuple[str, bool]]:
+        ordering: List[Tuple[str, bool]] = []
+
+        for order_by in (
+            self.queryset.query.order_by
+            or self.queryset.model._meta.ordering  # noqa: W503
+        ):
+            if isinstance(order_by, OrderBy) and isinstance(
+                order_by.expression, F
+            ):
+                name, descending = (
+                    order_by.expression.name,
+                    order_by.descending,
+                )
+            elif isinstance(order_by, str):
+                name, descending = order_by.lstrip("-"), order_by[0] == "-"
+            else:
+                raise ValueError(f"Unsupported keyset ordering: {order_by!r}")
+
+            if name == "pk":
+                name = self.queryset.model._meta.pk.name
+
+            if "__" in name or "?" in name:
+                raise ValueError(f"Unsupported keyset ordering: {order_by!r}")
+
+            ordering.append((name, descending))
+
+        pk_name: str = self.queryset.model._meta.pk.name
+
+        if pk_name not in (name for name, _ in ordering):
+            ordering.append((pk_name, False))
+
+        return ordering
+
+    def encode_cursor(self, *, instance: Model) -> str:
+        values: List[Any] = [
+            getattr(instance, name) for name, _ in self.ordering
+        ]
+
+        return (
+            base64.urlsafe_b64encode(json.dumps(values, default=str).encode())
+            .decode()
+            .rstrip("=")
+        )
+
+    def decode_cursor(self, *, cursor: str) -> List[Any]:
+        try:
+            values: Any = json.loads(
+                base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            )
+        except ValueError as exc:
+            raise InvalidCursorError(cursor) from exc
+
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidCursorError(cursor)
+
+        try:
+            return [
+                self.to_python(name=name, value=value)
+                for (name, _), value in zip(self.ordering, values)
+            ]
+        except ValidationError as exc:
+            raise InvalidCursorError(cursor) from exc
+
+    def to_python(self, *, name: str, value: Any) -> Any:
+        try:
+            field: Field = self.queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return value
+
+        if isinstance(field, GeneratedField):
+            field = field.output_field
+
+        return field.to_python(value)
+
+    def get_cursor_filter(self, *, values: List[Any]) -> Q:
+        cursor_filter: Q = Q()
+
+        for position in range(len(self.ordering) - 1, -1, -1):
+            name, descending = self.ordering[position]
+            lookup: str = "lt" if descending else "gt"
+            condition: Q = Q(**{f"{name}__{lookup}": values[position]})
+
+            if position < len(self.ordering) - 1:
+                condition |= Q(**{name: values[position]}) & cursor_filter
+
+            cursor_filter = condition
+
+        return cursor_filter
+
+    def get_page(self, *, cursor: Optional[str] = None) -> KeysetPage:
+        queryset: QuerySet[Any] = self.queryset.order_by(
+            *[
+                f"-{name}" if descending else name
+                for name, descending in self.ordering
+            ]
+        )
+
+        if cursor:
+            queryset = queryset.filter(
+                self.get_cursor_filter(
+                    values=self.decode_cursor(cursor=cursor)
+                )
+            )
+
+        object_list: List[Model] = list(queryset[: self.per_page + 1])
+        next_cursor: Optional[str] = None
+
+        if len(object_list) > self.per_page:
+            object_list = object_list[: self.per_page]
+            next_cursor = self.encode_cursor(instance=object_list[-1])
+
+        return KeysetPage(
+            object_list=object_list, paginator=self, next_cursor=next_cursor
+        )
@@ -0,0 +1,22 @@
+from typing import Tuple
+
+from apps.core.dataclasses import QueryBudget
+
+QUERY_BUDGETS: Tuple[QueryBudget, ...] = (
+    QueryBudget(name="home", url_name="pages:home", max_queries=12),
+    QueryBudget(
+        name="category-list", url_name="catalog:category-list", max_queries=8
+    ),
+    QueryBudget(
+        name="product-list", url_name="catalog:product-list", max_queries=12
+    ),
+    QueryBudget(
+        name="product-detail",
+        url_name="catalog:product-detail",
+        max_queries=16,
+    ),
+    QueryBudget(name="cart-detail", url_name="carts:detail", max_queries=12),
+    QueryBudget(name="checkout", url_name="orders:checkout", max_queries=14),
+    QueryBudget(name="order-detail", url_name="orders:detail", max_queries=10),
+    QueryBudget(name="profile", url_name="accounts:profile", max_queries=14),
+)
@@ -1,9 +1,21 @@
+from apps.core.services.copy_service import CopyService
 from apps.core.services.email_service import EmailService
+from apps.core.services.image_variant_service import ImageVariantService
+from apps.core.services.outbox_service import OutboxService
+from apps.core.services.query_budget_service import QueryBudgetService
+from apps.core.services.synthetic_dataset_service import (
+    SyntheticDatasetService,
+)
 from apps.core.services.yandex_smart_captcha_service import (
     YandexSmartCaptchaService,
 )
 
 __all__ = [
+    "CopyService",
     "EmailService",
+    "ImageVariantService",
+    "OutboxService",
+    "QueryBudgetService",
+    "SyntheticDatasetService",
     "YandexSmartCaptchaService",
 ]
@@ -0,0 +1,139 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from django.core.management.color import no_style
+from django.db import connection, models
+from django.db.models import Max
+
+COPY_BATCH_SIZE: int = 10_000
+COPY_BUFFER_SIZE: int = 1 << 20
+
+
+class CopyStream:
+
+    def __init__(self, *, chunks: Iterator[str]) -> None:
+        self.chunks: Iterator[str] = chunks
+        self.buffer: str = ""
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self.buffer) < size:
+            chunk: Optional[str] = next(self.chunks, None)
+
+            if chunk is None:
+                break
+
+            self.buffer += chunk
+
+        if size < 0:
+            size = len(self.buffer)
+
+        data: str = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+
+        return data
+
+
+class CopyService:
+
+    def get_copy_fields(self, *, model: type[models.Model]) -> List[Any]:
+        return [
+            field
+            for field in model._meta.concrete_fields
+            if not field.generated and not field.has_db_default()
+        ]
+
+    def get_next_pk(self, *, model: type[models.Model]) -> int:
+        return (model.objects.aggregate(max_pk=Max("pk"))["max_pk"] or 0) + 1
+
+    def to_copy_value(self, value: Any) -> Optional[str]:
+        if value is None:
+            return None
+
+        if isinstance(value, bool):
+            return "t" if value else "f"
+
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+
+        return str(value)
+
+    def iter_csv_chunks(
+        self,
+        *,
+        rows: Iterable[Mapping[str, Any]],
+        fields: List[Any],
+        batch_size: int,
+    ) -> Iterator[str]:
+        attnames: List[str] = [field.attname for field in fields]
+        defaults: Dict[str, Optional[str]] = {
+            field.attname: self.to_copy_value(field.get_default())
+            for field in fields
+        }
+        row_iterator: Iterator[Mapping[str, Any]] = iter(rows)
+
+        while batch := list(islice(row_iterator, batch_size)):
+            buffer: io.StringIO = io.StringIO()
+            writer = csv.writer(
+                buffer, quoting=csv.QUOTE_NOTNULL, lineterminator="\n"
+            )
+            writer.writerows(
+                [
+                    (
+                        self.to_copy_value(row[attname])
+                        if attname in row
+                        else defaults[attname]
+                    )
+                    for attname in attnames
+                ]
+                for row in batch
+            )
+
+            yield buffer.getvalue()
+
+    def copy_rows(
+        self,
+        *,
+        model: type[models.Model],
+        rows: Iterable[Mapping[str, Any]],
+        batch_size: int = COPY_BATCH_SIZE,
+    ) -> int:
+        fields: List[Any] = self.get_copy_fields(model=model)
+        columns: str = ", ".join(
+            connection.ops.quote_name(field.column) for field in fields
+        )
+        table: str = connection.ops.quote_name(model._meta.db_table)
+
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)",
+                CopyStream(
+                    chunks=self.iter_csv_chunks(
+                        rows=rows, fields=fields, batch_size=batch_size
+                    )
+                ),
+                size=COPY_BUFFER_SIZE,
+            )
+
+            return cursor.rowcount
+
+    def reset_sequences(
+        self, *, model_classes: Iterable[type[models.Model]]
+    ) -> None:
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(
+                no_style(), list(model_classes)
+            ):
+                cursor.execute(sql)
+
+    def analyze(self, *, model_classes: Iterable[type[models.Model]]) -> None:
+        with connection.cursor() as cursor:
+            for model in model_classes:
+                table: str = connection.ops.quote_name(model._meta.db_table)
+                cursor.execute(f"ANALYZE {table}")
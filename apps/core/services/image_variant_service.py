@@ -0,0 +1,91 @@
+from io import BytesIO
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Set, Tuple
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from PIL import Image
+
+from apps.core.models import ResponsiveImageModel
+
+IMAGE_VARIANT_WIDTHS: Tuple[int, ...] = (160, 320, 480, 768)
+IMAGE_VARIANT_FORMATS: Dict[str, Dict[str, Any]] = {
+    "avif": {"format": "AVIF", "quality": 60},
+    "webp": {"format": "WEBP", "quality": 80},
+}
+
+
+class ImageVariantService:
+
+    def generate_variants(self, *, instance: ResponsiveImageModel) -> None:
+        image_file: Any = instance.image  # type: ignore[attr-defined]
+        self.delete_variants(instance=instance)
+
+        if not image_file:
+            instance.image_variants = {}
+            instance.save(update_fields=["image_variants", "updated_at"])
+            return
+
+        storage: Storage = image_file.storage
+
+        with image_file.open("rb"):
+            source: Image.Image = Image.open(image_file)
+            source.load()
+
+        source_path: PurePosixPath = PurePosixPath(image_file.name)
+        widths: List[int] = sorted(
+            {width for width in IMAGE_VARIANT_WIDTHS if width < source.width}
+            | {source.width}
+        )
+        image_variants: Dict[str, Any] = {"source": image_file.name}
+
+        for image_format, options in IMAGE_VARIANT_FORMATS.items():
+            format_variants: List[List[Any]] = []
+
+            for width in widths:
+                if width == source.width and source_path.suffix == (
+                    f".{image_format}"
+                ):
+                    format_variants.append([width, image_file.name])
+                    continue
+
+                height: int = max(
+                    1, round(source.height * width / source.width)
+                )
+                variant: Image.Image = (
+                    source
+                    if width == source.width
+                    else source.resize(
+                        (width, height), resample=Image.Resampling.LANCZOS
+                    )
+                )
+                buffer: BytesIO = BytesIO()
+                variant.save(buffer, **options)
+                variant_name: str = storage.save(
+                    str(
+                        source_path.parent
+                        / "variants"
+                        / f"{source_path.stem}-{width}w.{image_format}"
+                    ),
+                    ContentFile(buffer.getvalue()),
+                )
+                format_variants.append([width, variant_name])
+
+            image_variants[image_format] = format_variants
+
+        instance.image_variants = image_variants
+        instance.save(update_fields=["image_variants", "updated_at"])
+
+    def delete_variants(self, *, instance: ResponsiveImageModel) -> None:
+        image_file: Any = instance.image  # type: ignore[attr-defined]
+        image_variants: Dict[str, Any] = instance.image_variants or {}
+        variant_names: Set[str] = {
+            name
+            for image_format in IMAGE_VARIANT_FORMATS
+            for _, name in image_variants.get(image_format, [])
+        }
+        variant_names.discard(image_variants.get("source"))
+        variant_names.discard(image_file.name if image_file else None)
+
+        for variant_name in variant_names:
+            image_file.storage.delete(variant_name)
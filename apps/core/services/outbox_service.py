@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.choices import OutboxEventStatus
+from apps.core.models import OutboxEvent
+
+OUTBOX_BATCH_SIZE: int = 100
+OUTBOX_MAX_ATTEMPTS: int = 5
+OUTBOX_RETRY_DELAY: int = 60
+OUTBOX_RETENTION_DAYS: int = 7
+
+OutboxEventHandler = Callable[[Dict[str, Any]], None]
+
+
+class OutboxService:
+    handlers: ClassVar[Dict[str, OutboxEventHandler]] = {}
+
+    @classmethod
+    def register_handler(
+        cls, *, event_type: str, handler: OutboxEventHandler
+    ) -> None:
+        cls.handlers[event_type] = handler
+
+    def publish(
+        self, *, event_type: str, payload: Mapping[str, Any]
+    ) -> OutboxEvent:
+        from apps.core.tasks import drain_outbox_task
+
+        outbox_event: OutboxEvent = OutboxEvent.objects.create(
+            event_type=event_type, payload=dict(payload)
+        )
+        transaction.on_commit(drain_outbox_task.delay)
+
+        return outbox_event
+
+    @transaction.atomic
+    def drain(self, *, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+        now: datetime = timezone.now()
+        outbox_events: List[OutboxEvent] = list(
+            OutboxEvent.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboxEventStatus.PENDING, available_at__lte=now)
+            .order_by("available_at", "pk")[:batch_size]
+        )
+
+        for outbox_event in outbox_events:
+            self._handle(outbox_event=outbox_event, now=now)
+
+        OutboxEvent.objects.bulk_update(
+            outbox_events,
+            fields=[
+                "status",
+                "attempts",
+                "available_at",
+                "processed_at",
+                "last_error",
+                "updated_at",
+            ],
+        )
+
+        return len(outbox_events)
+
+    def purge_processed(
+        self, *, retention_days: int = OUTBOX_RETENTION_DAYS
+    ) -> int:
+        deleted_count, _ = OutboxEvent.objects.filter(
+            status=OutboxEventStatus.PROCESSED,
+            processed_at__lt=timezone.now() - timedelta(days=retention_days),
+        ).delete()
+
+        return deleted_count
+
+    def _handle(self, *, outbox_event: OutboxEvent, now: datetime) -> None:
+        handler: Optional[OutboxEventHandler] = self.handlers.get(
+            outbox_event.event_type
+        )
+        outbox_event.attempts += 1
+        outbox_event.updated_at = now
+
+        try:
+            if handler is None:
+                raise LookupError(
+                    f"No outbox handler for {outbox_event.event_type}."
+                )
+
+            with transaction.atomic():
+                handler(outbox_event.payload)
+        except Exception as error:
+            outbox_event.last_error = repr(error)
+
+            if outbox_event.attempts >= OUTBOX_MAX_ATTEMPTS:
+                outbox_event.status = OutboxEventStatus.FAILED
+            else:
+                outbox_event.available_at = now + timedelta(
+                    seconds=OUTBOX_RETRY_DELAY * 2**outbox_event.attempts
+                )
+        else:
+            outbox_event.status = OutboxEventStatus.PROCESSED
+            outbox_event.processed_at = now
+            outbox_event.last_error = ""
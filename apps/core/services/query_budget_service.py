@@ -0,0 +1,32 @@
+from typing import Any, Mapping, Optional
+
+from django.db import connection
+from django.http import HttpResponse
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.core.dataclasses import QueryBudget, QueryBudgetReport
+
+
+class QueryBudgetService:
+
+    def measure(
+        self,
+        *,
+        client: Client,
+        budget: QueryBudget,
+        url_kwargs: Optional[Mapping[str, Any]] = None,
+    ) -> QueryBudgetReport:
+        path: str = reverse(viewname=budget.url_name, kwargs=url_kwargs)
+        client.get(path, secure=True)
+
+        with CaptureQueriesContext(connection) as context:
+            response: HttpResponse = client.get(path, secure=True)
+
+        return QueryBudgetReport(
+            budget=budget,
+            path=path,
+            status_code=response.status_code,
+            queries=list(context.captured_queries),
+        )
@@ -0,0 +1,581 @@
+import time
+from array import array
+from collections import Counter, defaultdict
+from datetime import UTC, datetime
+from decimal import Decimal
+from itertools import accumulate, product
+from random import Random
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import models, transaction
+
+from apps.accounts.models import User
+from apps.carts.choices import CartStatus
+from apps.carts.models import Cart, CartItem
+from apps.catalog.models import Product, ProductNutrition
+from apps.core.dataclasses import SyntheticDatasetReport, SyntheticDatasetSpec
+from apps.core.exceptions import SyntheticDatasetError
+from apps.core.services.copy_service import CopyService
+from apps.orders.choices import (
+    DeliveryMethod,
+    OrderStatus,
+    PaymentMethod,
+    PaymentStatus,
+)
+from apps.orders.models import Order, OrderItem
+from apps.reviews.models import ProductReview
+
+SYNTHETIC_PASSWORD: str = "!"
+SYNTHETIC_EMAIL: str = "user{pk}@example.com"
+SYNTHETIC_PHONE_NUMBER: str = "+795{pk:08d}"
+SYNTHETIC_ADDRESS: str = "г. Иркутск, ул. {street}, д. {house}, кв. {flat}"
+SYNTHETIC_STREETS: Tuple[str, ...] = (
+    "Ленина",
+    "Байкальская",
+    "Советская",
+    "Карла Либкнехта",
+    "Декабрьских Событий",
+    "Лермонтова",
+    "Партизанская",
+    "Красноармейская",
+)
+SYNTHETIC_FULL_NAMES: Tuple[Tuple[str, str, str], ...] = tuple(
+    product(
+        ("Иванов", "Кузнецов", "Васильев", "Соколов", "Морозов", "Волков"),
+        ("Александр", "Дмитрий", "Максим", "Артём", "Иван", "Сергей"),
+        ("Сергеевич", "Олегович", "Игоревич", "Михайлович"),
+    )
+) + tuple(
+    product(
+        ("Смирнова", "Попова", "Петрова", "Новикова", "Фёдорова", "Лебедева"),
+        ("Елена", "Анна", "Мария", "Ольга", "Дарья", "Екатерина"),
+        ("Андреевна", "Викторовна", "Алексеевна", "Павловна"),
+    )
+)
+
+PRODUCT_TEMPLATE_FIELDS: Tuple[str, ...] = (
+    "category_id",
+    "slug",
+    "name_ru",
+    "name_en",
+    "description_ru",
+    "description_en",
+    "composition_ru",
+    "composition_en",
+    "attributes_ru",
+    "attributes_en",
+    "unit_type",
+    "weight_step",
+    "price",
+    "nutrition__calories",
+    "nutrition__proteins",
+    "nutrition__fats",
+    "nutrition__carbs",
+)
+PRODUCT_POPULARITY_EXPONENT: float = 1.0
+CATEGORY_POPULARITY_EXPONENT: float = 1.2
+PRODUCT_PRICE_SPREAD: Tuple[float, float] = (0.7, 1.5)
+PRODUCT_DISCOUNTS: Tuple[int, ...] = (0, 0, 0, 0, 0, 0, 5, 10, 15, 25)
+PRODUCT_INACTIVE_SHARE: float = 0.03
+PRODUCT_MAX_STOCK: int = 200
+
+USER_ACTIVITY_SHAPE: float = 1.16
+USER_ACTIVITY_MAX_WEIGHT: float = 500.0
+
+ORDER_COMPLETION_SECONDS: int = 60 * 60 * 24 * 3
+ORDER_CANCELLED_SHARE: float = 0.06
+ORDER_COURIER_SHARE: float = 0.7
+ORDER_ONLINE_PAYMENT_SHARE: float = 0.6
+ORDER_ACTIVE_STATUSES: Tuple[str, ...] = (
+    OrderStatus.PENDING,
+    OrderStatus.CONFIRMED,
+    OrderStatus.ASSEMBLING,
+    OrderStatus.SHIPPED,
+)
+ORDER_MAX_PIECES: int = 3
+ORDER_MAX_WEIGHT_STEPS: int = 5
+
+REVIEW_RATINGS: Tuple[int, ...] = (1, 2, 3, 4, 5)
+REVIEW_RATING_CUM_WEIGHTS: Tuple[int, ...] = tuple(
+    accumulate((4, 4, 10, 27, 55))
+)
+
+
+class SyntheticDatasetService:
+
+    def __init__(self, *, spec: SyntheticDatasetSpec) -> None:
+        self.spec: SyntheticDatasetSpec = spec
+        self.random: Random = Random(spec.seed)  # noqa: S311
+        self.copy_service: CopyService = CopyService()
+        self.now: float = time.time()
+        self.start: float = self.now - spec.days * 60 * 60 * 24
+        self.first_pks: Dict[str, int] = {}
+        self.row_counts: Dict[str, int] = {}
+        self.product_templates: List[Dict[str, Any]] = []
+        self.products: List[Tuple[int, str, Decimal, Optional[Decimal]]] = []
+        self.product_ranking: List[int] = []
+        self.product_cum_weights: List[float] = []
+        self.user_joined: array = array("d")
+        self.user_names: array = array("H")
+        self.user_cum_weights: List[float] = []
+        self.order_users: array = array("l")
+        self.order_created: array = array("d")
+        self.active_cart_users: List[int] = []
+
+    @transaction.atomic
+    def generate(self) -> SyntheticDatasetReport:
+        self.validate_spec()
+        templates: Dict[int, List[Dict[str, Any]]] = self.get_templates()
+        model_classes: Tuple[type[models.Model], ...] = (
+            Product,
+            ProductNutrition,
+            User,
+            Cart,
+            CartItem,
+            Order,
+            OrderItem,
+            ProductReview,
+        )
+
+        for model in model_classes:
+            self.first_pks[model._meta.label_lower] = (
+                self.copy_service.get_next_pk(model=model)
+            )
+
+        self.copy(model=Product, rows=self.iter_product_rows(templates))
+        self.copy(model=ProductNutrition, rows=self.iter_nutrition_rows())
+        self.load_products()
+
+        self.copy(model=User, rows=self.iter_user_rows())
+        self.plan_orders()
+
+        self.copy(model=Cart, rows=self.iter_cart_rows())
+        self.copy(model=CartItem, rows=self.iter_cart_item_rows())
+        self.copy(model=Order, rows=self.iter_order_rows())
+        self.copy(model=OrderItem, rows=self.iter_order_item_rows())
+        self.copy(model=ProductReview, rows=self.iter_review_rows())
+
+        self.copy_service.reset_sequences(model_classes=model_classes)
+
+        return SyntheticDatasetReport(
+            spec=self.spec,
+            first_pks=self.first_pks,
+            row_counts=self.row_counts,
+        )
+
+    def validate_spec(self) -> None:
+        if self.spec.products < 1 or self.spec.users < 1:
+            raise SyntheticDatasetError(
+                "The dataset needs at least one product and one user."
+            )
+
+        if self.spec.order_size * 2 > self.spec.products:
+            raise SyntheticDatasetError(
+                "Not enough products for the requested order size."
+            )
+
+        if self.spec.active_carts > self.spec.users:
+            raise SyntheticDatasetError(
+                "Every user can have only one active cart."
+            )
+
+    def get_templates(self) -> Dict[int, List[Dict[str, Any]]]:
+        templates: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+
+        for template in (
+            Product.objects.filter(nutrition__isnull=False)
+            .order_by("pk")
+            .values(*PRODUCT_TEMPLATE_FIELDS)
+        ):
+            templates[template["category_id"]].append(template)
+
+        if not templates:
+            raise SyntheticDatasetError(
+                "No template products found. Run load_fixtures first."
+            )
+
+        return templates
+
+    def copy(
+        self, *, model: type[models.Model], rows: Iterable[Dict[str, Any]]
+    ) -> None:
+        self.row_counts[model._meta.label_lower] = self.copy_service.copy_rows(
+            model=model, rows=rows
+        )
+
+    def get_first_pk(self, *, model: type[models.Model]) -> int:
+        return self.first_pks[model._meta.label_lower]
+
+    def get_datetime(self, timestamp: float) -> datetime:
+        return datetime.fromtimestamp(timestamp, tz=UTC)
+
+    def get_timestamp_after(self, timestamp: float) -> float:
+        return self.random.uniform(timestamp, self.now)
+
+    def get_zipf_cum_weights(
+        self, *, size: int, exponent: float
+    ) -> List[float]:
+        return list(
+            accumulate(1 / rank**exponent for rank in range(1, size + 1))
+        )
+
+    def iter_product_rows(
+        self, templates: Dict[int, List[Dict[str, Any]]]
+    ) -> Iterator[Dict[str, Any]]:
+        category_pks: List[int] = sorted(templates)
+        self.random.shuffle(category_pks)
+        category_cum_weights: List[float] = self.get_zipf_cum_weights(
+            size=len(category_pks), exponent=CATEGORY_POPULARITY_EXPONENT
+        )
+        first_pk: int = self.get_first_pk(model=Product)
+
+        for pk in range(first_pk, first_pk + self.spec.products):
+            category_pk: int = self.random.choices(
+                category_pks, cum_weights=category_cum_weights
+            )[0]
+            template: Dict[str, Any] = self.random.choice(
+                templates[category_pk]
+            )
+            created_at: datetime = self.get_datetime(
+                self.get_timestamp_after(self.start)
+            )
+            self.product_templates.append(template)
+
+            yield {
+                "id": pk,
+                "created_at": created_at,
+                "updated_at": created_at,
+                "name": f"{template['name_ru']} #{pk}",
+                "name_ru": f"{template['name_ru']} #{pk}",
+                "name_en": f"{template['name_en']} #{pk}",
+                "description": template["description_ru"],
+                "description_ru": template["description_ru"],
+                "description_en": template["description_en"],
+                "slug": f"{template['slug']}-{pk}",
+                "composition": template["composition_ru"] or "",
+                "composition_ru": template["composition_ru"] or "",
+                "composition_en": template["composition_en"] or "",
+                "attributes": template["attributes_ru"] or {},
+                "attributes_ru": template["attributes_ru"] or {},
+                "attributes_en": template["attributes_en"] or {},
+                "unit_type": template["unit_type"],
+                "weight_step": template["weight_step"],
+                "price": (
+                    template["price"]
+                    * Decimal(
+                        f"{self.random.uniform(*PRODUCT_PRICE_SPREAD):.2f}"
+                    )
+                ).quantize(Decimal("0.01")),
+                "discount": self.random.choice(PRODUCT_DISCOUNTS),
+                "stock": self.random.randint(0, PRODUCT_MAX_STOCK),
+                "category_id": category_pk,
+                "is_active": self.random.random() >= PRODUCT_INACTIVE_SHARE,
+            }
+
+    def iter_nutrition_rows(self) -> Iterator[Dict[str, Any]]:
+        first_pk: int = self.get_first_pk(model=ProductNutrition)
+        first_product_pk: int = self.get_first_pk(model=Product)
+        created_at: datetime = self.get_datetime(self.now)
+
+        for offset, template in enumerate(self.product_templates):
+            yield {
+                "id": first_pk + offset,
+                "created_at": created_at,
+                "updated_at": created_at,
+                "product_id": first_product_pk + offset,
+                "calories": template["nutrition__calories"],
+                "proteins": template["nutrition__proteins"],
+                "fats": template["nutrition__fats"],
+                "carbs": template["nutrition__carbs"],
+            }
+
+    def load_products(self) -> None:
+        self.products = list(
+            Product.objects.filter(pk__gte=self.get_first_pk(model=Product))
+            .order_by("pk")
+            .values_list("pk", "name", "final_price", "weight_step")
+        )
+        self.product_ranking = list(range(len(self.products)))
+        self.random.shuffle(self.product_ranking)
+        self.product_cum_weights = self.get_zipf_cum_weights(
+            size=len(self.products), exponent=PRODUCT_POPULARITY_EXPONENT
+        )
+
+    def sample_products(
+        self, *, size: int
+    ) -> List[Tuple[int, str, Decimal, Optional[Decimal]]]:
+        product_indices: Dict[int, None] = {}
+
+        while len(product_indices) < size:
+            product_indices.update(
+                dict.fromkeys(
+                    self.random.choices(
+                        self.product_ranking,
+                        cum_weights=self.product_cum_weights,
+                        k=size - len(product_indices),
+                    )
+                )
+            )
+
+        return [self.products[index] for index in product_indices]
+
+    def get_quantity(self, *, weight_step: Optional[Decimal]) -> Decimal:
+        if weight_step:
+            return weight_step * self.random.randint(1, ORDER_MAX_WEIGHT_STEPS)
+
+        return Decimal(self.random.randint(1, ORDER_MAX_PIECES))
+
+    def get_order_size(self) -> int:
+        return self.random.randint(1, max(1, self.spec.order_size * 2 - 1))
+
+    def iter_user_rows(self) -> Iterator[Dict[str, Any]]:
+        first_pk: int = self.get_first_pk(model=User)
+
+        for pk in range(first_pk, first_pk + self.spec.users):
+            joined_at: float = self.get_timestamp_after(self.start)
+            name_index: int = self.random.randrange(len(SYNTHETIC_FULL_NAMES))
+            last_name, first_name, middle_name = SYNTHETIC_FULL_NAMES[
+                name_index
+            ]
+            self.user_joined.append(joined_at)
+            self.user_names.append(name_index)
+
+            yield {
+                "id": pk,
+                "password": SYNTHETIC_PASSWORD,
+                "is_superuser": False,
+                "email": SYNTHETIC_EMAIL.format(pk=pk),
+                "phone_number": SYNTHETIC_PHONE_NUMBER.format(pk=pk),
+                "first_name": first_name,
+                "last_name": last_name,
+                "middle_name": middle_name,
+                "is_staff": False,
+                "is_active": True,
+                "date_joined": self.get_datetime(joined_at),
+            }
+
+    def plan_orders(self) -> None:
+        self.user_cum_weights = list(
+            accumulate(
+                min(
+                    self.random.paretovariate(USER_ACTIVITY_SHAPE),
+                    USER_ACTIVITY_MAX_WEIGHT,
+                )
+                for _ in range(self.spec.users)
+            )
+        )
+        self.order_users = array(
+            "l",
+            self.random.choices(
+                range(self.spec.users),
+                cum_weights=self.user_cum_weights,
+                k=self.spec.orders,
+            ),
+        )
+        self.order_created = array(
+            "d",
+            (
+                self.get_timestamp_after(self.user_joined[user_index])
+                for user_index in self.order_users
+            ),
+        )
+        self.active_cart_users = self.random.sample(
+            range(self.spec.users), k=self.spec.active_carts
+        )
+
+    def iter_cart_rows(self) -> Iterator[Dict[str, Any]]:
+        first_pk: int = self.get_first_pk(model=Cart)
+        first_user_pk: int = self.get_first_pk(model=User)
+
+        for offset, (user_index, ordered_at) in enumerate(
+            zip(self.order_users, self.order_created)
+        ):
+            yield {
+                "id": first_pk + offset,
+                "created_at": self.get_datetime(
+                    max(
+                        ordered_at - self.random.uniform(60, 60 * 60),
+                        self.start,
+                    )
+                ),
+                "updated_at": self.get_datetime(ordered_at),
+                "user_id": first_user_pk + user_index,
+                "cart_status": CartStatus.CONVERTED,
+            }
+
+        for offset, user_index in enumerate(
+            self.active_cart_users, start=self.spec.orders
+        ):
+            created_at: datetime = self.get_datetime(
+                self.get_timestamp_after(self.user_joined[user_index])
+            )
+
+            yield {
+                "id": first_pk + offset,
+                "created_at": created_at,
+                "updated_at": created_at,
+                "user_id": first_user_pk + user_index,
+                "cart_status": CartStatus.ACTIVE,
+            }
+
+    def iter_cart_item_rows(self) -> Iterator[Dict[str, Any]]:
+        pk: int = self.get_first_pk(model=CartItem)
+        first_cart_pk: int = self.get_first_pk(model=Cart) + self.spec.orders
+        created_at: datetime = self.get_datetime(self.now)
+
+        for offset in range(self.spec.active_carts):
+            for (
+                product_pk,
+                _name,
+                final_price,
+                weight_step,
+            ) in self.sample_products(size=self.get_order_size()):
+                yield {
+                    "id": pk,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "cart_id": first_cart_pk + offset,
+                    "product_id": product_pk,
+                    "quantity": self.get_quantity(weight_step=weight_step),
+                    "price_snapshot": final_price,
+                }
+                pk += 1
+
+    def get_order_statuses(self, *, ordered_at: float) -> Tuple[str, str, str]:
+        payment_method: str = (
+            PaymentMethod.ONLINE
+            if self.random.random() < ORDER_ONLINE_PAYMENT_SHARE
+            else PaymentMethod.ON_DELIVERY
+        )
+
+        if self.now - ordered_at < ORDER_COMPLETION_SECONDS:
+            return (
+                self.random.choice(ORDER_ACTIVE_STATUSES),
+                payment_method,
+                (
+                    PaymentStatus.PAID
+                    if payment_method == PaymentMethod.ONLINE
+                    else PaymentStatus.PENDING
+                ),
+            )
+
+        if self.random.random() < ORDER_CANCELLED_SHARE:
+            return (
+                OrderStatus.CANCELLED,
+                payment_method,
+                (
+                    PaymentStatus.REFUNDED
+                    if payment_method == PaymentMethod.ONLINE
+                    else PaymentStatus.FAILED
+                ),
+            )
+
+        return OrderStatus.COMPLETED, payment_method, PaymentStatus.PAID
+
+    def iter_order_rows(self) -> Iterator[Dict[str, Any]]:
+        first_pk: int = self.get_first_pk(model=Order)
+        first_cart_pk: int = self.get_first_pk(model=Cart)
+        first_user_pk: int = self.get_first_pk(model=User)
+
+        for offset, (user_index, ordered_at) in enumerate(
+            zip(self.order_users, self.order_created)
+        ):
+            user_pk: int = first_user_pk + user_index
+            order_status, payment_method, payment_status = (
+                self.get_order_statuses(ordered_at=ordered_at)
+            )
+            delivery_method: str = (
+                DeliveryMethod.COURIER
+                if self.random.random() < ORDER_COURIER_SHARE
+                else DeliveryMethod.PICKUP
+            )
+            created_at: datetime = self.get_datetime(ordered_at)
+
+            yield {
+                "id": first_pk + offset,
+                "created_at": created_at,
+                "updated_at": created_at,
+                "user_id": user_pk,
+                "cart_id": first_cart_pk + offset,
+                "order_status": order_status,
+                "delivery_method": delivery_method,
+                "delivery_address": (
+                    SYNTHETIC_ADDRESS.format(
+                        street=self.random.choice(SYNTHETIC_STREETS),
+                        house=self.random.randint(1, 150),
+                        flat=self.random.randint(1, 200),
+                    )
+                    if delivery_method == DeliveryMethod.COURIER
+                    else ""
+                ),
+                "payment_status": payment_status,
+                "payment_method": payment_method,
+                "recipient_name": " ".join(
+                    SYNTHETIC_FULL_NAMES[self.user_names[user_index]]
+                ),
+                "recipient_email": SYNTHETIC_EMAIL.format(pk=user_pk),
+                "recipient_phone_number": SYNTHETIC_PHONE_NUMBER.format(
+                    pk=user_pk
+                ),
+            }
+
+    def iter_order_item_rows(self) -> Iterator[Dict[str, Any]]:
+        pk: int = self.get_first_pk(model=OrderItem)
+        first_order_pk: int = self.get_first_pk(model=Order)
+
+        for offset, ordered_at in enumerate(self.order_created):
+            created_at: datetime = self.get_datetime(ordered_at)
+
+            for (
+                product_pk,
+                name,
+                final_price,
+                weight_step,
+            ) in self.sample_products(size=self.get_order_size()):
+                yield {
+                    "id": pk,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "order_id": first_order_pk + offset,
+                    "product_id": product_pk,
+                    "quantity": self.get_quantity(weight_step=weight_step),
+                    "product_name_snapshot": name,
+                    "price_snapshot": final_price,
+                }
+                pk += 1
+
+    def iter_review_rows(self) -> Iterator[Dict[str, Any]]:
+        pk: int = self.get_first_pk(model=ProductReview)
+        first_user_pk: int = self.get_first_pk(model=User)
+        reviewer_counts: Counter[int] = Counter(
+            self.random.choices(
+                range(self.spec.users),
+                cum_weights=self.user_cum_weights,
+                k=self.spec.reviews,
+            )
+        )
+
+        for user_index, review_count in sorted(reviewer_counts.items()):
+            for (
+                product_pk,
+                _name,
+                _final_price,
+                _weight_step,
+            ) in self.sample_products(
+                size=min(review_count, len(self.products) // 2)
+            ):
+                created_at: datetime = self.get_datetime(
+                    self.get_timestamp_after(self.user_joined[user_index])
+                )
+
+                yield {
+                    "id": pk,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "user_id": first_user_pk + user_index,
+                    "product_id": product_pk,
+                    "rating": self.random.choices(
+                        REVIEW_RATINGS, cum_weights=REVIEW_RATING_CUM_WEIGHTS
+                    )[0],
+                }
+                pk += 1
@@ -1,5 +1,15 @@
+from apps.core.tasks.drain_outbox_task import (
+    drain_outbox_task,
+    purge_outbox_events_task,
+)
+from apps.core.tasks.generate_image_variants_task import (
+    generate_image_variants_task,
+)
 from apps.core.tasks.send_email_task import send_email_task
 
 __all__ = [
+    "drain_outbox_task",
+    "generate_image_variants_task",
+    "purge_outbox_events_task",
     "send_email_task",
 ]
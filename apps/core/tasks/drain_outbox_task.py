@@ -0,0 +1,16 @@
+from celery import shared_task
+
+
+@shared_task
+def drain_outbox_task() -> None:
+    from apps.core.services import OutboxService
+
+    while OutboxService().drain():
+        continue
+
+
+@shared_task
+def purge_outbox_events_task() -> None:
+    from apps.core.services import OutboxService
+
+    OutboxService().purge_processed()
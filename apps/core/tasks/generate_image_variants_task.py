@@ -0,0 +1,26 @@
+from typing import Optional, Type
+
+from celery import shared_task
+from django.apps import apps
+
+from apps.core.models import ResponsiveImageModel
+
+
+@shared_task(
+    bind=True,
+    default_retry_delay=60,
+    max_retries=3,
+    autoretry_for=(OSError,),
+)
+def generate_image_variants_task(self, *, model_label: str, pk: int) -> None:
+    from apps.core.services import ImageVariantService
+
+    model: Type[ResponsiveImageModel] = apps.get_model(model_label)
+    instance: Optional[ResponsiveImageModel] = model.objects.filter(
+        pk=pk
+    ).first()
+
+    if instance is None:
+        return
+
+    ImageVariantService().generate_variants(instance=instance)
@@ -8,3 +8,6 @@ class FavoritesConfig(AppConfig):
     name: str = "apps.favorites"
     verbose_name: StrOrPromise = _("Favorites")
     label: str = "favorites"
+
+    def ready(self) -> None:
+        from apps.favorites import signals  # noqa: F401
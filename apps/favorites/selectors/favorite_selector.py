@@ -13,7 +13,9 @@ class FavoriteSelector:
         return Favorite.objects.filter(user=user).prefetch_related(
             Prefetch(
                 lookup="product",
-                queryset=ProductSelector().get_products(only_active=False),
+                queryset=ProductSelector().get_product_cards(
+                    only_active=False
+                ),
             )
         )
 
@@ -0,0 +1,7 @@
+from apps.favorites.signals.favorite_signals import (
+    invalidate_favorite_user_version,
+)
+
+__all__ = [
+    "invalidate_favorite_user_version",
+]
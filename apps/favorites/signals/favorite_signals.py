@@ -0,0 +1,19 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.caches import UserVersionCache
+from apps.favorites.models import Favorite
+
+
+@receiver(signal=post_save, sender=Favorite)
+@receiver(signal=post_delete, sender=Favorite)
+def invalidate_favorite_user_version(
+    sender: Any, instance: Favorite, **kwargs: Any
+) -> None:
+    user_pk: int = instance.user_id
+    transaction.on_commit(
+        lambda: UserVersionCache().invalidate(user_pk=user_pk)
+    )
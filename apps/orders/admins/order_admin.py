@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 from unfold.contrib.filters.admin import ChoicesDropdownFilter
@@ -8,6 +9,7 @@ from apps.core.admins import BaseModelAdmin
 from apps.orders.admins.order_item_inline_admin import OrderItemInline
 from apps.orders.choices import OrderStatus, PaymentStatus
 from apps.orders.models import Order
+from apps.orders.services import OrderService
 
 
 @admin.register(Order)
@@ -37,6 +39,7 @@ class OrderAdmin(BaseModelAdmin):
         "recipient_phone_number",
         "comment",
         "total_price",
+        "is_total_price_mismatched",
         "created_at",
         "updated_at",
     )
@@ -52,6 +55,7 @@ class OrderAdmin(BaseModelAdmin):
         "recipient_phone_number",
         "comment",
         "total_price",
+        "is_total_price_mismatched",
         "created_at",
         "updated_at",
     )
@@ -60,6 +64,7 @@ class OrderAdmin(BaseModelAdmin):
         ("payment_status", ChoicesDropdownFilter),
         ("delivery_method", ChoicesDropdownFilter),
         ("payment_method", ChoicesDropdownFilter),
+        "is_total_price_mismatched",
     )
     search_fields = (
         "number",
@@ -74,10 +79,18 @@ class OrderAdmin(BaseModelAdmin):
     list_select_related = ("user",)
     date_hierarchy = "created_at"
     ordering = ("-created_at",)
+    actions = ("recompute_total_prices",)
 
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
 
+    @admin.action(description=_("Recompute total price"))
+    def recompute_total_prices(
+        self, request: HttpRequest, queryset: QuerySet[Order]
+    ) -> None:
+        for order in queryset:
+            OrderService().recompute_total_price(order=order)
+
     @display(
         description=_("Order status"),
         label={
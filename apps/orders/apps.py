@@ -8,3 +8,16 @@ class OrdersConfig(AppConfig):
     name: str = "apps.orders"
     verbose_name: StrOrPromise = _("Orders")
     label: str = "orders"
+
+    def ready(self) -> None:
+        from apps.core.services import OutboxService
+        from apps.orders import signals  # noqa: F401
+        from apps.orders.services import (
+            ORDER_CREATED_EVENT,
+            OrderEventService,
+        )
+
+        OutboxService.register_handler(
+            event_type=ORDER_CREATED_EVENT,
+            handler=OrderEventService().handle_order_created,
+        )
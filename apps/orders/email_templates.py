@@ -0,0 +1,7 @@
+from apps.core.dataclasses import EmailTemplate
+
+ORDER_CREATED_EMAIL: EmailTemplate = EmailTemplate(
+    subject="emails/order_created_subject.txt",
+    body="emails/order_created.txt",
+    content="emails/order_created.html",
+)
@@ -1,6 +1,17 @@
+from typing import List
+
+from apps.catalog.dataclasses import StockShortage
+
+
 class OrderError(Exception):
     pass
 
 
 class EmptyCartError(OrderError):
     pass
+
+
+class StockReservationError(OrderError):
+    def __init__(self, shortages: List[StockShortage]) -> None:
+        super().__init__(shortages)
+        self.shortages: List[StockShortage] = shortages
@@ -0,0 +1,28 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.orders.services import DailySalesRollupService
+
+
+class Command(BaseCommand):
+    help = "Rebuild daily sales rollups for the admin dashboard."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Number of recent days to rebuild (30 by default).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        rebuilt_count: int = DailySalesRollupService().rebuild_recent_rollups(
+            days=options["days"]
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Daily sales rollups rebuilt for {rebuilt_count} days."
+            )
+        )
@@ -0,0 +1,66 @@
+from django.db import migrations, models
+
+CREATE_ORDER_NUMBER_FUNCTION_SQL: str = """
+CREATE OR REPLACE FUNCTION orders_next_order_number() RETURNS varchar AS $$
+DECLARE
+    order_year text := to_char(now(), 'YYYY');
+    sequence_name text := 'orders_order_number_' || order_year || '_seq';
+    next_value bigint;
+BEGIN
+    IF to_regclass(sequence_name) IS NULL THEN
+        PERFORM pg_advisory_xact_lock(hashtext(sequence_name));
+
+        IF to_regclass(sequence_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE SEQUENCE %I START WITH %s',
+                sequence_name,
+                (
+                    SELECT COALESCE(MAX(substring(number FROM 10)::bigint), 0)
+                           + 1
+                    FROM orders_order
+                    WHERE number ~ ('^ORD-' || order_year || '-[0-9]+$')
+                )
+            );
+        END IF;
+    END IF;
+
+    next_value := nextval(sequence_name);
+
+    RETURN 'ORD-' || order_year || '-'
+           || lpad(next_value::text, greatest(6, length(next_value::text)), '0');
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+DROP_ORDER_NUMBER_FUNCTION_SQL: str = """
+DROP FUNCTION IF EXISTS orders_next_order_number();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_ORDER_NUMBER_FUNCTION_SQL,
+            reverse_sql=DROP_ORDER_NUMBER_FUNCTION_SQL,
+        ),
+        migrations.AlterField(
+            model_name="order",
+            name="number",
+            field=models.CharField(
+                db_default=models.Func(
+                    function="orders_next_order_number",
+                    output_field=models.CharField(),
+                ),
+                editable=False,
+                help_text="ORD-0000-000000",
+                max_length=20,
+                unique=True,
+                verbose_name="number",
+            ),
+        ),
+    ]
@@ -0,0 +1,172 @@
+# Generated by Django 5.2.6 on 2026-10-15 18:00
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0002_alter_order_number"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailySalesRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="created date"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="updated date"
+                    ),
+                ),
+                ("day", models.DateField(unique=True, verbose_name="day")),
+                (
+                    "orders_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="orders count"
+                    ),
+                ),
+                (
+                    "paid_orders_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="paid orders count"
+                    ),
+                ),
+                (
+                    "cancelled_orders_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="cancelled orders count"
+                    ),
+                ),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        max_digits=14,
+                        verbose_name="revenue",
+                    ),
+                ),
+                (
+                    "order_status_counts",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        verbose_name="order status counts",
+                    ),
+                ),
+                (
+                    "carts_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="carts count"
+                    ),
+                ),
+                (
+                    "converted_carts_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="converted carts count"
+                    ),
+                ),
+                (
+                    "active_carts_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="active carts count"
+                    ),
+                ),
+                (
+                    "new_users_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="new users count"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "daily sales rollup",
+                "verbose_name_plural": "daily sales rollups",
+                "db_table": "orders_daily_sales_rollup",
+                "db_table_comment": "Table containing daily sales rollups.",
+                "ordering": ("-day",),
+            },
+        ),
+        migrations.CreateModel(
+            name="DailyProductSalesRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="created date"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="updated date"
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="day")),
+                (
+                    "product_name",
+                    models.CharField(
+                        max_length=255, verbose_name="product name"
+                    ),
+                ),
+                (
+                    "quantity",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        max_digits=12,
+                        verbose_name="quantity",
+                    ),
+                ),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0.00"),
+                        max_digits=14,
+                        verbose_name="revenue",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "daily product sales rollup",
+                "verbose_name_plural": "daily product sales rollups",
+                "db_table": "orders_daily_product_sales_rollup",
+                "db_table_comment": "Table containing daily product sales rollups.",
+                "ordering": ("-day", "-revenue"),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "product_name"),
+                        name="unique_day_product_name",
+                    )
+                ],
+            },
+        ),
+    ]
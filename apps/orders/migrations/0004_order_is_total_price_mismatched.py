@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-15 18:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0003_dailysalesrollup_dailyproductsalesrollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="is_total_price_mismatched",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                help_text="Set when the total price differs from the sum of order items.",
+                verbose_name="total price mismatched",
+            ),
+        ),
+    ]
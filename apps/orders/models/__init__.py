@@ -1,7 +1,13 @@
+from apps.orders.models.daily_sales_rollup_model import (
+    DailyProductSalesRollup,
+    DailySalesRollup,
+)
 from apps.orders.models.order_item_model import OrderItem
 from apps.orders.models.order_model import Order
 
 __all__ = [
+    "DailyProductSalesRollup",
+    "DailySalesRollup",
     "Order",
     "OrderItem",
 ]
@@ -0,0 +1,100 @@
+from decimal import Decimal
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import BaseModel
+
+
+class DailySalesRollup(BaseModel):  # type: ignore
+    day = models.DateField(
+        unique=True,
+        verbose_name=_("day"),
+    )
+    orders_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("orders count"),
+    )
+    paid_orders_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("paid orders count"),
+    )
+    cancelled_orders_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("cancelled orders count"),
+    )
+    revenue = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        verbose_name=_("revenue"),
+    )
+    order_status_counts = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name=_("order status counts"),
+    )
+    carts_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("carts count"),
+    )
+    converted_carts_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("converted carts count"),
+    )
+    active_carts_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("active carts count"),
+    )
+    new_users_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("new users count"),
+    )
+
+    class Meta:
+        db_table = "orders_daily_sales_rollup"
+        db_table_comment = "Table containing daily sales rollups."
+        verbose_name = _("daily sales rollup")
+        verbose_name_plural = _("daily sales rollups")
+        ordering = ("-day",)
+
+    def __str__(self) -> str:
+        return f"{self.day}"
+
+
+class DailyProductSalesRollup(BaseModel):  # type: ignore
+    day = models.DateField(
+        verbose_name=_("day"),
+    )
+    product_name = models.CharField(
+        max_length=255,
+        verbose_name=_("product name"),
+    )
+    quantity = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        verbose_name=_("quantity"),
+    )
+    revenue = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        verbose_name=_("revenue"),
+    )
+
+    class Meta:
+        db_table = "orders_daily_product_sales_rollup"
+        db_table_comment = "Table containing daily product sales rollups."
+        verbose_name = _("daily product sales rollup")
+        verbose_name_plural = _("daily product sales rollups")
+        ordering = ("-day", "-revenue")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "product_name"],
+                name="unique_day_product_name",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.day}: {self.product_name}"
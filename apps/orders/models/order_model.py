@@ -82,8 +82,20 @@ class Order(BaseModel):  # type: ignore
         verbose_name=_("total price"),
         help_text=_("Calculated by the system."),
     )
+    is_total_price_mismatched = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name=_("total price mismatched"),
+        help_text=_(
+            "Set when the total price differs from the sum of order items."
+        ),
+    )
     number = models.CharField(
         max_length=20,
+        db_default=models.Func(
+            function="orders_next_order_number",
+            output_field=models.CharField(),
+        ),
         verbose_name=_("number"),
         unique=True,
         editable=False,
@@ -1,6 +1,17 @@
+from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 
-from django.db.models import QuerySet
+from django.db.models import (
+    DecimalField,
+    F,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce
 
 from apps.accounts.models import User
 from apps.orders.models import Order, OrderItem
@@ -25,3 +36,26 @@ class OrderSelector:
         self, *, user: User, limit: int = 5
     ) -> QuerySet[Order]:
         return self.get_user_orders(user=user)[:limit]
+
+    def get_orders_with_total_price_drift(
+        self, *, created_since: datetime
+    ) -> QuerySet[Order]:
+        items_total_price: Subquery = Subquery(
+            OrderItem.objects.filter(order=OuterRef("pk"))
+            .order_by()
+            .values("order")
+            .annotate(total=Sum("total_price"))
+            .values("total")
+        )
+
+        return (
+            Order.objects.filter(created_at__gte=created_since)
+            .alias(
+                items_total_price=Coalesce(
+                    items_total_price,
+                    Value(Decimal("0.00")),
+                    output_field=DecimalField(max_digits=10, decimal_places=2),
+                )
+            )
+            .exclude(total_price=F("items_total_price"))
+        )
@@ -1,3 +1,15 @@
+from apps.orders.services.daily_sales_rollup_service import (
+    DailySalesRollupService,
+)
+from apps.orders.services.order_event_service import (
+    ORDER_CREATED_EVENT,
+    OrderEventService,
+)
 from apps.orders.services.order_service import OrderService
 
-__all__ = ["OrderService"]
+__all__ = [
+    "DailySalesRollupService",
+    "ORDER_CREATED_EVENT",
+    "OrderEventService",
+    "OrderService",
+]
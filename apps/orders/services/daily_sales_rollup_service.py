@@ -0,0 +1,187 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, Q, QuerySet, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.carts.choices import CartStatus
+from apps.carts.models import Cart
+from apps.orders.choices import OrderStatus, PaymentStatus
+from apps.orders.models import (
+    DailyProductSalesRollup,
+    DailySalesRollup,
+    Order,
+    OrderItem,
+)
+
+
+class DailySalesRollupService:
+
+    def get_day_start(self, *, day: date) -> datetime:
+        return timezone.make_aware(
+            datetime.combine(day, time.min),
+            timezone.get_current_timezone(),
+        )
+
+    def get_daily_rows(
+        self, *, queryset: QuerySet[Any], field_name: str, **aggregates: Any
+    ) -> Dict[date, Dict[str, Any]]:
+        return {
+            row["day"]: row
+            for row in queryset.annotate(
+                day=TruncDate(
+                    field_name, tzinfo=timezone.get_current_timezone()
+                )
+            )
+            .values("day")
+            .annotate(**aggregates)
+            .order_by()
+        }
+
+    @transaction.atomic
+    def rebuild_rollups(self, *, start_day: date, end_day: date) -> int:
+        period_start: datetime = self.get_day_start(day=start_day)
+        period_end: datetime = self.get_day_start(
+            day=end_day + timedelta(days=1)
+        )
+        paid_filter: Q = Q(payment_status=PaymentStatus.PAID) & ~Q(
+            order_status=OrderStatus.CANCELLED
+        )
+
+        orders: QuerySet[Order] = Order.objects.filter(
+            created_at__gte=period_start, created_at__lt=period_end
+        )
+        order_rows: Dict[date, Dict[str, Any]] = self.get_daily_rows(
+            queryset=orders,
+            field_name="created_at",
+            orders_count=Count("id"),
+            paid_orders_count=Count("id", filter=paid_filter),
+            cancelled_orders_count=Count(
+                "id", filter=Q(order_status=OrderStatus.CANCELLED)
+            ),
+            revenue=Sum("total_price", filter=paid_filter),
+        )
+        order_status_counts: Dict[date, Dict[str, int]] = {}
+
+        for row in (
+            orders.annotate(
+                day=TruncDate(
+                    "created_at", tzinfo=timezone.get_current_timezone()
+                )
+            )
+            .values("day", "order_status")
+            .annotate(total=Count("id"))
+            .order_by()
+        ):
+            order_status_counts.setdefault(row["day"], {})[
+                row["order_status"]
+            ] = row["total"]
+
+        cart_rows: Dict[date, Dict[str, Any]] = self.get_daily_rows(
+            queryset=Cart.objects.filter(
+                created_at__gte=period_start, created_at__lt=period_end
+            ),
+            field_name="created_at",
+            carts_count=Count("id"),
+            converted_carts_count=Count(
+                "id", filter=Q(cart_status=CartStatus.CONVERTED)
+            ),
+            active_carts_count=Count(
+                "id", filter=Q(cart_status=CartStatus.ACTIVE)
+            ),
+        )
+        user_rows: Dict[date, Dict[str, Any]] = self.get_daily_rows(
+            queryset=get_user_model().objects.filter(
+                date_joined__gte=period_start, date_joined__lt=period_end
+            ),
+            field_name="date_joined",
+            new_users_count=Count("id"),
+        )
+
+        rollups: List[DailySalesRollup] = []
+        day: date = start_day
+
+        while day <= end_day:
+            order_row: Dict[str, Any] = order_rows.get(day, {})
+            cart_row: Dict[str, Any] = cart_rows.get(day, {})
+            rollups.append(
+                DailySalesRollup(
+                    day=day,
+                    orders_count=order_row.get("orders_count", 0),
+                    paid_orders_count=order_row.get("paid_orders_count", 0),
+                    cancelled_orders_count=order_row.get(
+                        "cancelled_orders_count", 0
+                    ),
+                    revenue=order_row.get("revenue") or Decimal("0.00"),
+                    order_status_counts=order_status_counts.get(day, {}),
+                    carts_count=cart_row.get("carts_count", 0),
+                    converted_carts_count=cart_row.get(
+                        "converted_carts_count", 0
+                    ),
+                    active_carts_count=cart_row.get("active_carts_count", 0),
+                    new_users_count=user_rows.get(day, {}).get(
+                        "new_users_count", 0
+                    ),
+                )
+            )
+            day += timedelta(days=1)
+
+        DailySalesRollup.objects.bulk_create(
+            rollups,
+            update_conflicts=True,
+            unique_fields=["day"],
+            update_fields=[
+                "orders_count",
+                "paid_orders_count",
+                "cancelled_orders_count",
+                "revenue",
+                "order_status_counts",
+                "carts_count",
+                "converted_carts_count",
+                "active_carts_count",
+                "new_users_count",
+                "updated_at",
+            ],
+        )
+
+        DailyProductSalesRollup.objects.filter(
+            day__gte=start_day, day__lte=end_day
+        ).delete()
+        DailyProductSalesRollup.objects.bulk_create(
+            [
+                DailyProductSalesRollup(
+                    day=row["day"],
+                    product_name=row["product_name_snapshot"],
+                    quantity=row["quantity"],
+                    revenue=row["revenue"],
+                )
+                for row in OrderItem.objects.filter(
+                    order__created_at__gte=period_start,
+                    order__created_at__lt=period_end,
+                    order__payment_status=PaymentStatus.PAID,
+                )
+                .exclude(order__order_status=OrderStatus.CANCELLED)
+                .annotate(
+                    day=TruncDate(
+                        "order__created_at",
+                        tzinfo=timezone.get_current_timezone(),
+                    )
+                )
+                .values("day", "product_name_snapshot")
+                .annotate(quantity=Sum("quantity"), revenue=Sum("total_price"))
+                .order_by()
+            ]
+        )
+
+        return len(rollups)
+
+    def rebuild_recent_rollups(self, *, days: int) -> int:
+        today: date = timezone.localdate()
+
+        return self.rebuild_rollups(
+            start_day=today - timedelta(days=days - 1), end_day=today
+        )
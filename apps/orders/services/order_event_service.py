@@ -0,0 +1,29 @@
+from typing import Any, Dict, Optional
+
+from apps.carts.services import CartService
+from apps.core.services import EmailService
+from apps.orders.email_templates import ORDER_CREATED_EMAIL
+from apps.orders.models import Order
+
+ORDER_CREATED_EVENT: str = "orders.order_created"
+
+
+class OrderEventService:
+
+    def handle_order_created(self, payload: Dict[str, Any]) -> None:
+        CartService().reconcile_product_cart_items(
+            product_pks=payload["product_pks"]
+        )
+
+        order: Optional[Order] = Order.objects.filter(
+            pk=payload["order_pk"]
+        ).first()
+
+        if order is None:
+            return
+
+        EmailService().send_email(
+            email_template=ORDER_CREATED_EMAIL,
+            to=[order.recipient_email],
+            context={"order": order},
+        )
@@ -1,29 +1,86 @@
-from decimal import Decimal
-from typing import Any, Dict, List
+from datetime import datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, Iterable, List
 
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import (
+    DecimalField,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from apps.accounts.models import User
 from apps.carts.choices import CartStatus
 from apps.carts.models import Cart, CartItem
 from apps.carts.selectors import CartSelector
 from apps.carts.services import CartService
+from apps.catalog.dataclasses import StockShortage
 from apps.catalog.services import ProductService
-from apps.orders.exceptions import EmptyCartError
+from apps.core.services import OutboxService
+from apps.orders.exceptions import EmptyCartError, StockReservationError
 from apps.orders.models import Order, OrderItem
 from apps.orders.selectors import OrderSelector
+from apps.orders.services.order_event_service import ORDER_CREATED_EVENT
+
+ORDER_TOTAL_PRICE_CHECK_DAYS: int = 7
 
 
 class OrderService:
 
+    def calculate_total_price(
+        self, *, cart_items: Iterable[CartItem]
+    ) -> Decimal:
+        return sum(
+            (
+                (cart_item.price_snapshot * cart_item.quantity).quantize(
+                    Decimal("0.01"), rounding=ROUND_HALF_UP
+                )
+                for cart_item in cart_items
+            ),
+            Decimal("0.00"),
+        )
+
     @transaction.atomic
     def recompute_total_price(self, *, order: Order) -> None:
         total_price: Decimal = OrderSelector().get_order_items(
             order=order
         ).aggregate(total=Sum("total_price"))["total"] or Decimal("0.00")
         order.total_price = total_price
-        order.save(update_fields=["total_price"])
+        order.is_total_price_mismatched = False
+        order.save(update_fields=["total_price", "is_total_price_mismatched"])
+
+    def recompute_total_prices(self, *, orders: QuerySet[Order]) -> int:
+        return orders.update(
+            total_price=Coalesce(
+                Subquery(
+                    OrderItem.objects.filter(order=OuterRef("pk"))
+                    .order_by()
+                    .values("order")
+                    .annotate(total=Sum("total_price"))
+                    .values("total")
+                ),
+                Value(Decimal("0.00")),
+                output_field=DecimalField(max_digits=10, decimal_places=2),
+            ),
+            is_total_price_mismatched=False,
+        )
+
+    def flag_total_price_mismatches(
+        self, *, days: int = ORDER_TOTAL_PRICE_CHECK_DAYS
+    ) -> int:
+        created_since: datetime = timezone.now() - timedelta(days=days)
+
+        return (
+            OrderSelector()
+            .get_orders_with_total_price_drift(created_since=created_since)
+            .filter(is_total_price_mismatched=False)
+            .update(is_total_price_mismatched=True)
+        )
 
     @transaction.atomic
     def checkout(
@@ -35,14 +92,29 @@ class OrderService:
         available_cart_items: List[CartItem] = (
             CartSelector().get_available_cart_items(cart=cart)
         )
+        quantities: Dict[int, Decimal] = {}
+
+        for cart_item in available_cart_items:
+            quantities[cart_item.product_id] = (
+                quantities.get(cart_item.product_id, Decimal("0.00"))
+                + cart_item.quantity  # noqa: W503
+            )
+
+        shortages: List[StockShortage] = ProductService().reserve_stock(
+            quantities=quantities
+        )
+
+        if shortages:
+            raise StockReservationError(shortages)
 
         order: Order = Order.objects.create(
             user=user,
             cart=cart,
+            total_price=self.calculate_total_price(
+                cart_items=available_cart_items
+            ),
             **checkout_data,
         )
-        order.number = f"ORD-{order.created_at.year}-{order.pk:06d}"
-        order.save(update_fields=["number"])
 
         OrderItem.objects.bulk_create(
             [
@@ -57,15 +129,16 @@ class OrderService:
             ]
         )
 
-        for cart_item in available_cart_items:
-            ProductService().decrease_stock(
-                product_pk=cart_item.product.pk, quantity=cart_item.quantity
-            )
-
-        self.recompute_total_price(order=order)
-
         CartService().change_cart_status(
             cart=cart, new_status=CartStatus.CONVERTED
         )
 
+        OutboxService().publish(
+            event_type=ORDER_CREATED_EVENT,
+            payload={
+                "order_pk": order.pk,
+                "product_pks": list(quantities),
+            },
+        )
+
         return order
@@ -0,0 +1,5 @@
+from apps.orders.signals.order_signals import refresh_daily_sales_rollup
+
+__all__ = [
+    "refresh_daily_sales_rollup",
+]
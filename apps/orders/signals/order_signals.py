@@ -0,0 +1,37 @@
+from datetime import date
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.orders.models import Order
+from apps.orders.tasks import rebuild_daily_sales_rollups_task
+
+DAILY_SALES_ROLLUP_PENDING_KEY: str = "orders:daily-sales-rollup:pending:{day}"
+DAILY_SALES_ROLLUP_DELAY: int = 60
+
+
+def schedule_daily_sales_rollup(*, day: date) -> None:
+    if cache.add(
+        DAILY_SALES_ROLLUP_PENDING_KEY.format(day=day.isoformat()),
+        True,
+        timeout=DAILY_SALES_ROLLUP_DELAY,
+    ):
+        rebuild_daily_sales_rollups_task.apply_async(
+            kwargs={"day": day.isoformat()},
+            countdown=DAILY_SALES_ROLLUP_DELAY,
+        )
+
+
+@receiver(signal=post_save, sender=Order)
+def refresh_daily_sales_rollup(
+    sender: Any, instance: Order, raw: bool = False, **kwargs: Any
+) -> None:
+    if raw:
+        return
+
+    day: date = timezone.localdate(instance.created_at)
+    transaction.on_commit(lambda: schedule_daily_sales_rollup(day=day))
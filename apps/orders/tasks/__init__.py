@@ -0,0 +1,11 @@
+from apps.orders.tasks.check_order_total_prices_task import (
+    check_order_total_prices_task,
+)
+from apps.orders.tasks.rebuild_daily_sales_rollups_task import (
+    rebuild_daily_sales_rollups_task,
+)
+
+__all__ = [
+    "check_order_total_prices_task",
+    "rebuild_daily_sales_rollups_task",
+]
@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from apps.orders.services import OrderService
+
+
+@shared_task
+def check_order_total_prices_task(*, days: int = 7) -> None:
+    OrderService().flag_total_price_mismatches(days=days)
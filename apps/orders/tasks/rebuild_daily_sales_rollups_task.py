@@ -0,0 +1,20 @@
+from datetime import date
+from typing import Optional
+
+from celery import shared_task
+
+from apps.orders.services import DailySalesRollupService
+
+
+@shared_task
+def rebuild_daily_sales_rollups_task(
+    *, days: int = 2, day: Optional[str] = None
+) -> None:
+    if day is None:
+        DailySalesRollupService().rebuild_recent_rollups(days=days)
+        return
+
+    rollup_day: date = date.fromisoformat(day)
+    DailySalesRollupService().rebuild_rollups(
+        start_day=rollup_day, end_day=rollup_day
+    )
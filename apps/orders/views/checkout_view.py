@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Set
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -13,10 +13,9 @@ from django.urls import reverse, reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import FormView
 
-from apps.carts.models import Cart
+from apps.carts.dataclasses import CartSnapshot
 from apps.carts.selectors import CartSelector
-from apps.carts.services import CartService
-from apps.orders.exceptions import EmptyCartError
+from apps.orders.exceptions import EmptyCartError, StockReservationError
 from apps.orders.forms import CheckoutForm
 from apps.orders.models import Order
 from apps.orders.services import OrderService
@@ -40,29 +39,23 @@ class CheckoutView(LoginRequiredMixin, SuccessMessageMixin, FormView):
     success_message = _("The order has been successfully created.")
 
     @property
-    def cart(self) -> Cart:
-        return CartService().get_or_create_active_cart_for_user(
-            user=self.request.user  # type: ignore
-        )
+    def cart_snapshot(self) -> CartSnapshot:
+        return CartSelector().get_request_cart_snapshot(request=self.request)
 
     def dispatch(
         self, request: HttpRequest, **kwargs: Any
     ) -> HttpResponseBase:
-        if CartSelector().is_cart_empty(cart=self.cart):
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+
+        if self.cart_snapshot.is_empty:
             messages.info(request, _("Your cart is empty."))
             return redirect(to="catalog:category-list")
 
-        if CartSelector().has_unavailable_cart_items(cart=self.cart):
+        if self.cart_snapshot.has_unavailable_cart_items:
             return redirect(to="carts:detail")
 
-        if CartService().validate_cart_item_quantities(cart=self.cart):
-            messages.warning(
-                self.request,
-                _(
-                    "The stock availability has changed. "
-                    "The price has been updated."
-                ),
-            )
+        if self.cart_snapshot.cart.is_stock_changed:  # type: ignore
             return redirect(to="carts:detail")
 
         return super().dispatch(request=request, **kwargs)
@@ -71,7 +64,7 @@ class CheckoutView(LoginRequiredMixin, SuccessMessageMixin, FormView):
         try:
             order: Order = OrderService().checkout(
                 user=self.request.user,  # type: ignore
-                cart=self.cart,
+                cart=self.cart_snapshot.cart,
                 **form.cleaned_data,
             )
             self.success_url = reverse(
@@ -79,6 +72,22 @@ class CheckoutView(LoginRequiredMixin, SuccessMessageMixin, FormView):
             )
         except EmptyCartError:
             return redirect(to="carts:detail")
+        except StockReservationError as exc:
+            product_pks: Set[int] = {
+                shortage.product_pk for shortage in exc.shortages
+            }
+            messages.warning(
+                self.request,
+                _("Not enough stock for: %(products)s.")
+                % {
+                    "products": ", ".join(
+                        cart_item.product.name
+                        for cart_item in self.cart_snapshot.cart_items
+                        if cart_item.product_id in product_pks
+                    )
+                },
+            )
+            return redirect(to="carts:detail")
         except Exception:
             messages.error(
                 self.request, _("An error occurred while creating the order.")
@@ -5,10 +5,12 @@ from django.utils.translation import gettext_lazy as _
 from django.views.generic import TemplateView
 
 from apps.catalog.selectors import ProductSelector
+from apps.core.mixins import AnonymousPageCacheMixin
 
 
-class HomeView(TemplateView):
+class HomeView(AnonymousPageCacheMixin, TemplateView):
     template_name = "pages/home.html"
+    page_cache_tags = ("product", "category", "review")
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context: Dict[str, Any] = super().get_context_data(**kwargs)
@@ -1,8 +1,14 @@
+from typing import Any, Set
+
 from django.contrib import admin
+from django.db.models import QuerySet
+from django.forms import ModelForm
+from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 
 from apps.core.admins import BaseModelAdmin
 from apps.reviews.models import ProductReview
+from apps.reviews.services import ProductReviewService
 
 
 @admin.register(ProductReview)
@@ -31,3 +37,31 @@ class ProductReviewAdmin(BaseModelAdmin):
     list_filter = ("rating",)
     list_select_related = ("user", "product")
     date_hierarchy = "created_at"
+
+    def save_model(
+        self,
+        request: HttpRequest,
+        obj: ProductReview,
+        form: ModelForm,
+        change: bool,
+    ) -> None:
+        product_pks: Set[Any] = {obj.product_id, form.initial.get("product")}
+        super().save_model(request, obj, form, change)
+        ProductReviewService().rebuild_product_ratings(
+            product_pks=[pk for pk in product_pks if pk is not None]
+        )
+
+    def delete_model(self, request: HttpRequest, obj: ProductReview) -> None:
+        super().delete_model(request, obj)
+        ProductReviewService().rebuild_product_ratings(
+            product_pks=[obj.product_id]
+        )
+
+    def delete_queryset(
+        self, request: HttpRequest, queryset: QuerySet[ProductReview]
+    ) -> None:
+        product_pks: Set[int] = set(
+            queryset.values_list("product_id", flat=True)
+        )
+        super().delete_queryset(request, queryset)
+        ProductReviewService().rebuild_product_ratings(product_pks=product_pks)
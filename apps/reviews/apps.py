@@ -8,3 +8,6 @@ class ReviewsConfig(AppConfig):
     name: str = "apps.reviews"
     verbose_name: StrOrPromise = _("Reviews")
     label: str = "reviews"
+
+    def ready(self) -> None:
+        from apps.reviews import signals  # noqa: F401
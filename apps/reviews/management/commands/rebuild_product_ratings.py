@@ -0,0 +1,28 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.reviews.services import ProductReviewService
+
+
+class Command(BaseCommand):
+    help = "Rebuild denormalized product rating aggregates from reviews."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "product_pks",
+            nargs="*",
+            type=int,
+            help="Rebuild only the given products (all by default).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        updated_count: int = ProductReviewService().rebuild_product_ratings(
+            product_pks=options["product_pks"] or None
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Product ratings rebuilt for {updated_count} products."
+            )
+        )
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+BACKFILL_PRODUCT_RATINGS_SQL: str = """
+UPDATE catalog_product AS product
+SET rating_sum = aggregates.rating_sum,
+    rating_count = aggregates.rating_count
+FROM (
+    SELECT product_id,
+           SUM(rating) AS rating_sum,
+           COUNT(*) AS rating_count
+    FROM reviews_product_review
+    GROUP BY product_id
+) AS aggregates
+WHERE product.id = aggregates.product_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0025_product_rating_count_product_rating_sum_and_more"),
+        ("reviews", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=BACKFILL_PRODUCT_RATINGS_SQL,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -20,3 +20,15 @@ class ProductReviewSelector:
             user=user,
             product_id=product_pk,
         ).first()
+
+    def get_user_product_review_for_update(
+        self, *, user: User, product_pk: int
+    ) -> Optional[ProductReview]:
+        return (
+            ProductReview.objects.select_for_update()
+            .filter(
+                user=user,
+                product_id=product_pk,
+            )
+            .first()
+        )
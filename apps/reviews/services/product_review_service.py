@@ -1,6 +1,19 @@
+from typing import Iterable, Optional
+
 from django.db import transaction
+from django.db.models import (
+    Count,
+    IntegerField,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import Coalesce
 
 from apps.accounts.models import User
+from apps.catalog.models import Product
+from apps.catalog.services import ProductService
 from apps.reviews.exceptions import ProductReviewNotAllowedError
 from apps.reviews.models import ProductReview
 from apps.reviews.selectors import ProductReviewSelector
@@ -22,9 +35,66 @@ class ProductReviewService:
         if not can_review_product:
             raise ProductReviewNotAllowedError()
 
-        product_review, _ = ProductReview.objects.update_or_create(
+        product_review: Optional[
+            ProductReview
+        ] = ProductReviewSelector().get_user_product_review_for_update(
             user=user,
-            product_id=product_pk,
-            defaults={"rating": rating},
+            product_pk=product_pk,
         )
+
+        if product_review is None:
+            product_review = ProductReview.objects.create(
+                user=user,
+                product_id=product_pk,
+                rating=rating,
+            )
+            ProductService().change_rating(
+                product_pk=product_pk, rating_delta=rating, count_delta=1
+            )
+            return product_review
+
+        rating_delta: int = rating - product_review.rating
+        product_review.rating = rating
+        product_review.save(update_fields=["rating", "updated_at"])
+
+        if rating_delta:
+            ProductService().change_rating(
+                product_pk=product_pk, rating_delta=rating_delta
+            )
+
         return product_review
+
+    @transaction.atomic
+    def rebuild_product_ratings(
+        self, *, product_pks: Optional[Iterable[int]] = None
+    ) -> int:
+        product_reviews: QuerySet[ProductReview] = (
+            ProductReview.objects.filter(product=OuterRef("pk"))
+            .order_by()
+            .values("product")
+        )
+        products: QuerySet[Product] = Product.objects.all()
+
+        if product_pks is not None:
+            products = products.filter(pk__in=product_pks)
+
+        return products.update(
+            rating_sum=Coalesce(
+                Subquery(
+                    product_reviews.annotate(total=Sum("rating")).values(
+                        "total"
+                    ),
+                    output_field=IntegerField(),
+                ),
+                0,
+            ),
+            rating_count=Coalesce(
+                Subquery(
+                    product_reviews.annotate(total=Count("pk")).values(
+                        "total"
+                    ),
+                    output_field=IntegerField(),
+                ),
+                0,
+            ),
+        )
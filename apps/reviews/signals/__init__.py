@@ -0,0 +1,9 @@
+from apps.reviews.signals.product_review_signals import (
+    invalidate_product_review_page_cache,
+    invalidate_product_review_user_version,
+)
+
+__all__ = [
+    "invalidate_product_review_page_cache",
+    "invalidate_product_review_user_version",
+]
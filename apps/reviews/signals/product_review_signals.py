@@ -0,0 +1,25 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.caches import PageCache, UserVersionCache
+from apps.reviews.models import ProductReview
+
+
+@receiver(signal=post_save, sender=ProductReview)
+@receiver(signal=post_delete, sender=ProductReview)
+def invalidate_product_review_page_cache(sender: Any, **kwargs: Any) -> None:
+    transaction.on_commit(lambda: PageCache().invalidate(tags=["review"]))
+
+
+@receiver(signal=post_save, sender=ProductReview)
+@receiver(signal=post_delete, sender=ProductReview)
+def invalidate_product_review_user_version(
+    sender: Any, instance: ProductReview, **kwargs: Any
+) -> None:
+    user_pk: int = instance.user_id
+    transaction.on_commit(
+        lambda: UserVersionCache().invalidate(user_pk=user_pk)
+    )
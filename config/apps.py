@@ -0,0 +1,10 @@
+from typing import List
+
+from django.contrib.staticfiles.apps import StaticFilesConfig
+
+
+class StaticFilesWithoutSourcesConfig(StaticFilesConfig):
+    ignore_patterns: List[str] = [
+        *StaticFilesConfig.ignore_patterns,
+        "input.css",
+    ]
@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from celery.schedules import crontab
 from decouple import Csv, config
 from django.templatetags.static import static
 from django.urls import reverse_lazy
@@ -71,7 +72,8 @@ INSTALLED_APPS: List[str] = [
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
-    "django.contrib.staticfiles",
+    "config.apps.StaticFilesWithoutSourcesConfig",
+    "django.contrib.postgres",
     "phonenumber_field",
     "django_resized",
     "django_cleanup.apps.CleanupConfig",
@@ -150,6 +152,9 @@ CACHES: Dict[str, Any] = {
             "CACHE_LOCATION", default="redis://127.0.0.1:6379/0"
         ),
     },
+    "compressor": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
     "ratelimit": {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
         "LOCATION": config(
@@ -237,6 +242,39 @@ CELERY_TASK_ACKS_LATE: bool = True
 CELERY_TASK_REJECT_ON_WORKER_LOST: bool = True
 CELERY_WORKER_MAX_TASKS_PER_CHILD: int = 1000
 CELERY_WORKER_MAX_MEMORY_PER_CHILD: int = 400_000
+CELERY_BEAT_SCHEDULE: Dict[str, Any] = {
+    "rebuild-product-rankings": {
+        "task": "apps.catalog.tasks.rebuild_product_rankings_task."
+        "rebuild_product_rankings_task",
+        "schedule": 60 * 30,
+    },
+    "refresh-daily-sales-rollups": {
+        "task": "apps.orders.tasks.rebuild_daily_sales_rollups_task."
+        "rebuild_daily_sales_rollups_task",
+        "schedule": 60 * 10,
+        "kwargs": {"days": 2},
+    },
+    "rebuild-daily-sales-rollups": {
+        "task": "apps.orders.tasks.rebuild_daily_sales_rollups_task."
+        "rebuild_daily_sales_rollups_task",
+        "schedule": crontab(hour=3, minute=0),
+        "kwargs": {"days": 30},
+    },
+    "check-order-total-prices": {
+        "task": "apps.orders.tasks.check_order_total_prices_task."
+        "check_order_total_prices_task",
+        "schedule": crontab(hour=3, minute=30),
+        "kwargs": {"days": 7},
+    },
+    "drain-outbox": {
+        "task": "apps.core.tasks.drain_outbox_task.drain_outbox_task",
+        "schedule": 60,
+    },
+    "purge-outbox-events": {
+        "task": "apps.core.tasks.drain_outbox_task.purge_outbox_events_task",
+        "schedule": crontab(hour=4, minute=0),
+    },
+}
 
 LANGUAGE_CODE: str = "ru-ru"
 MODELTRANSLATION_DEFAULT_LANGUAGE: str = "en"
@@ -256,6 +294,17 @@ STATICFILES_DIRS: List[Any] = [
 ]
 STATIC_ROOT: Path = BASE_DIR / "staticfiles"
 
+STORAGES: Dict[str, Dict[str, Any]] = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": (
+            "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"
+        ),
+    },
+}
+
 STATICFILES_FINDERS: Tuple[str, ...] = (
     "django.contrib.staticfiles.finders.FileSystemFinder",
     "django.contrib.staticfiles.finders.AppDirectoriesFinder",
@@ -263,6 +312,7 @@ STATICFILES_FINDERS: Tuple[str, ...] = (
 )
 COMPRESS_OFFLINE: bool = not DEBUG
 COMPRESS_ENABLED: bool = True
+COMPRESS_CACHE_BACKEND: str = "compressor"
 COMPRESS_CSS_FILTERS: List[str] = [
     "compressor.filters.cssmin.CSSMinFilter",
 ]
@@ -0,0 +1,59 @@
+const fs = require("node:fs");
+const path = require("node:path");
+const zlib = require("node:zlib");
+
+const COMPRESSIBLE_EXTENSIONS = new Set([
+  ".css",
+  ".js",
+  ".json",
+  ".map",
+  ".svg",
+  ".txt",
+  ".xml",
+  ".ico",
+]);
+const MIN_SIZE = 512;
+
+function* walk(directory) {
+  for (const entry of fs.readdirSync(directory, { withFileTypes: true })) {
+    const entryPath = path.join(directory, entry.name);
+
+    if (entry.isDirectory()) {
+      yield* walk(entryPath);
+    } else if (COMPRESSIBLE_EXTENSIONS.has(path.extname(entry.name))) {
+      yield entryPath;
+    }
+  }
+}
+
+function precompress(root) {
+  let compressedCount = 0;
+
+  for (const filePath of walk(root)) {
+    const content = fs.readFileSync(filePath);
+
+    if (content.length < MIN_SIZE) {
+      continue;
+    }
+
+    fs.writeFileSync(
+      `${filePath}.gz`,
+      zlib.gzipSync(content, { level: zlib.constants.Z_BEST_COMPRESSION }),
+    );
+    fs.writeFileSync(
+      `${filePath}.br`,
+      zlib.brotliCompressSync(content, {
+        params: {
+          [zlib.constants.BROTLI_PARAM_QUALITY]:
+            zlib.constants.BROTLI_MAX_QUALITY,
+          [zlib.constants.BROTLI_PARAM_SIZE_HINT]: content.length,
+        },
+      }),
+    );
+    compressedCount += 1;
+  }
+
+  console.log(`Precompressed ${compressedCount} static files in ${root}.`);
+}
+
+precompress(path.resolve(process.argv[2] ?? "staticfiles"));
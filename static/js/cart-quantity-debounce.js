@@ -0,0 +1,52 @@
+(function() {
+  var DEBOUNCE_DELAY = 400;
+  var pendingUpdates = new WeakMap();
+
+  function resolveTarget(control) {
+    var selector = control.dataset.target;
+
+    if (selector.indexOf("closest ") === 0) {
+      return control.closest(selector.slice("closest ".length));
+    }
+
+    return document.querySelector(selector);
+  }
+
+  function formatQuantity(quantity) {
+    return Number.isInteger(quantity) ? String(quantity) : quantity.toFixed(2);
+  }
+
+  function scheduleUpdate(control) {
+    clearTimeout(pendingUpdates.get(control));
+
+    pendingUpdates.set(control, setTimeout(function() {
+      pendingUpdates.delete(control);
+      htmx.ajax("POST", control.dataset.url, {
+        source: control,
+        target: resolveTarget(control),
+        values: { product: control.dataset.product, quantity: control.dataset.quantity },
+      });
+    }, DEBOUNCE_DELAY));
+  }
+
+  document.addEventListener("htmx:confirm", function(event) {
+    var control = event.target.closest("[data-cart-quantity-control]");
+    var actionInput = event.target.querySelector("input[name='action']");
+
+    if (!control || !actionInput) return;
+
+    event.preventDefault();
+
+    var step = parseFloat(control.dataset.step);
+    var stock = parseFloat(control.dataset.stock);
+    var delta = actionInput.value === "increment" ? step : -step;
+    var quantity = Math.round((parseFloat(control.dataset.quantity) + delta) * 100) / 100;
+
+    if (quantity < step || quantity > stock) return;
+
+    control.dataset.quantity = quantity.toFixed(2);
+    control.querySelector("[data-cart-quantity-value]").textContent = formatQuantity(quantity) + " " + control.dataset.unit;
+
+    scheduleUpdate(control);
+  });
+})();